@@ -9,10 +9,156 @@ Strategy:
 4. Remove low-value qualitative facts
 """
 
+import heapq
 import json
+import re
 import sys
+from operator import itemgetter
 from pathlib import Path
 
+from frfr import _json
+
+# Terms that mark a claim as generic boilerplate
+GENERIC_TERMS = frozenset([
+    'personnel', 'management', 'appropriate', 'reasonable', 'adequate', 'sufficient',
+])
+
+# One-pass, case-insensitive matcher for any generic term (substring match, like `in`)
+_GENERIC_RE = re.compile(
+    '|'.join(re.escape(term) for term in sorted(GENERIC_TERMS)), re.IGNORECASE
+)
+
+# Score adjustment per fact type
+FACT_TYPE_BONUS = {
+    'technical_control': 0.5,
+    'process': 0.5,
+    'architecture': 0.5,
+    'organizational': 0.3,
+    'test_result': -0.5,  # Deprioritize test results without QV
+}
+
+# Pre-bound lookups for the per-fact scoring path
+_type_bonus = FACT_TYPE_BONUS.get
+_generic_search = _GENERIC_RE.search
+
+
+# Placeholder spliced out of the serialized envelope in _write_filtered
+_FACTS_MARKER = '__frfr_filtered_facts__'
+
+# Indentation of items in documents.<doc>.facts at indent=2
+_FACT_INDENT = b' ' * 8
+
+
+def _write_filtered(data: dict, doc_name: str, kept_facts: list, path: Path):
+    """
+    Write data with the document's facts replaced by kept_facts.
+
+    Only the envelope (session and document metadata) goes through a full
+    dump; each kept fact is serialized and streamed into the facts array,
+    so neither a new tree nor the full output is ever held in memory.
+    The layout matches json.dump(indent=2); non-ASCII text is written as
+    UTF-8 rather than \\uXXXX escapes, like every other _json writer.
+
+    Args:
+        data: Loaded facts file contents
+        doc_name: Document whose facts were filtered
+        kept_facts: Facts to write for that document
+        path: Output path
+    """
+    doc = dict(data['documents'][doc_name], facts=[_FACTS_MARKER] if kept_facts else [])
+    envelope = dict(data, documents=dict(data['documents'], **{doc_name: doc}))
+    serialized = _json.dumps(envelope, indent=True)
+
+    if not kept_facts:
+        with open(path, 'wb') as f:
+            f.write(serialized)
+        return
+
+    head, tail = serialized.split(json.dumps(_FACTS_MARKER).encode('utf-8'), 1)
+    separator = b',\n' + _FACT_INDENT
+
+    # Write facts one at a time so peak memory is one fact, not the whole array
+    with open(path, 'wb') as f:
+        f.write(head)
+        for i, fact in enumerate(kept_facts):
+            if i:
+                f.write(separator)
+            f.write(_json.dumps(fact, indent=True).replace(b'\n', b'\n' + _FACT_INDENT))
+        f.write(tail)
+
+
+def _score_features(
+    specificity: float,
+    n_entities: int,
+    n_process_details: int,
+    type_bonus: float,
+    confidence: float,
+    has_generic: bool,
+) -> float:
+    """
+    Score a fact from its pre-extracted scalar features.
+
+    Kept free of dict access so the arithmetic stays a tight scalar kernel.
+
+    Args:
+        specificity: Specificity score (0-1)
+        n_entities: Number of entities
+        n_process_details: Number of process detail fields
+        type_bonus: Adjustment from FACT_TYPE_BONUS
+        confidence: Extraction confidence (0-1)
+        has_generic: Whether the claim contains a generic term
+
+    Returns:
+        Quality score (higher is better)
+    """
+    score = specificity * 2.0  # Weight: 2x
+
+    # Has entities (specific names/technologies)
+    if n_entities > 0:
+        score += 1.0
+    if n_entities >= 3:
+        score += 0.5
+
+    # Has process details (WHO/WHEN/HOW)
+    if n_process_details > 0:
+        score += 0.5
+        if n_process_details >= 2:
+            score += 0.5
+
+    # Fact type priorities
+    score += type_bonus
+
+    # High confidence
+    if confidence >= 0.9:
+        score += 0.3
+
+    # Penalty for generic terms
+    if has_generic:
+        score -= 0.5
+
+    return score
+
+
+def _score_fact(fact: dict) -> float:
+    """
+    Score a fact without QV by how specific and useful it is.
+
+    Args:
+        fact: Fact dictionary
+
+    Returns:
+        Quality score (higher is better)
+    """
+    get = fact.get
+    return _score_features(
+        get('specificity_score', 0.0) or 0.0,
+        len(get('entities') or ()),
+        len(get('process_details') or ()),
+        _type_bonus(get('fact_type', ''), 0.0),
+        get('confidence', 0.0) or 0.0,
+        _generic_search(get('claim', '') or '') is not None,
+    )
+
 
 def aggressive_filter_facts(facts_file: Path, output_file: Path = None, target_coverage: float = 0.35):
     """
@@ -24,8 +170,7 @@ def aggressive_filter_facts(facts_file: Path, output_file: Path = None, target_c
         target_coverage: Target QV coverage percentage (default: 0.35 = 35%)
     """
     print(f"Loading facts from: {facts_file}")
-    with open(facts_file, 'r') as f:
-        data = json.load(f)
+    data = _json.load_file(facts_file)
 
     # Extract document name and facts
     doc_name = list(data['documents'].keys())[0]
@@ -33,9 +178,19 @@ def aggressive_filter_facts(facts_file: Path, output_file: Path = None, target_c
 
     print(f"Loaded {len(facts)} facts from document '{doc_name}'")
 
-    # Count current QV coverage
-    qv_facts = [f for f in facts if f.get('quantitative_values') and len(f['quantitative_values']) > 0]
-    initial_qv_count = len(qv_facts)
+    # Single pass: partition QV facts and score the rest inline
+    kept_facts = []
+    scored_facts = []
+    final_qv_count = 0
+    for fact in facts:
+        if fact.get('quantitative_values'):
+            kept_facts.append(fact)
+            final_qv_count += 1
+            continue
+
+        scored_facts.append((_score_fact(fact), fact))
+
+    initial_qv_count = len(kept_facts)
     initial_coverage = (initial_qv_count / len(facts) * 100) if len(facts) > 0 else 0
 
     print(f"\nInitial state:")
@@ -53,70 +208,26 @@ def aggressive_filter_facts(facts_file: Path, output_file: Path = None, target_c
     print(f"  Must remove: {len(facts) - target_total} facts\n")
 
     # PHASE 1: Keep all facts with QV (highest priority)
-    kept_facts = list(qv_facts)
-    print(f"Phase 1: Keeping ALL {len(qv_facts)} facts with QV")
+    print(f"Phase 1: Keeping ALL {initial_qv_count} facts with QV")
 
     # PHASE 2: Rank remaining facts by quality and keep top N
-    remaining_facts = [f for f in facts if f not in kept_facts]
     needed_count = target_total - len(kept_facts)
 
-    print(f"Phase 2: Need to keep {needed_count} more high-quality facts from {len(remaining_facts)} remaining")
+    print(f"Phase 2: Need to keep {needed_count} more high-quality facts from {len(scored_facts)} remaining")
 
-    # Score each remaining fact
-    scored_facts = []
-    for fact in remaining_facts:
-        score = 0.0
-
-        # Specificity score (0-1)
-        specificity = fact.get('specificity_score', 0.0)
-        score += specificity * 2.0  # Weight: 2x
-
-        # Has entities (specific names/technologies)
-        entities = fact.get('entities') or []
-        if len(entities) > 0:
-            score += 1.0
-        if len(entities) >= 3:
-            score += 0.5
-
-        # Has process details (WHO/WHEN/HOW)
-        process_details = fact.get('process_details') or {}
-        if process_details:
-            score += 0.5
-            if len(process_details) >= 2:
-                score += 0.5
-
-        # Fact type priorities
-        fact_type = fact.get('fact_type', '')
-        if fact_type in ['technical_control', 'process', 'architecture']:
-            score += 0.5
-        elif fact_type == 'organizational':
-            score += 0.3
-        elif fact_type == 'test_result':
-            score -= 0.5  # Deprioritize test results without QV
-
-        # High confidence
-        confidence = fact.get('confidence', 0.0)
-        if confidence >= 0.9:
-            score += 0.3
-
-        # Penalty for generic terms
-        claim = fact.get('claim', '').lower()
-        generic_terms = ['personnel', 'management', 'appropriate', 'reasonable', 'adequate', 'sufficient']
-        if any(term in claim for term in generic_terms):
-            score -= 0.5
-
-        scored_facts.append((score, fact))
-
-    # Sort by score descending and keep top N
-    scored_facts.sort(key=lambda x: x[0], reverse=True)
-    top_facts = [f for score, f in scored_facts[:needed_count]]
+    # Keep top N by score (bounded heap instead of sorting every fact)
+    top = heapq.nlargest(needed_count, scored_facts, key=itemgetter(0))
+    top_facts = [f for _, f in top]
 
     kept_facts.extend(top_facts)
 
-    print(f"  Kept {len(top_facts)} high-quality facts (score range: {scored_facts[0][0]:.2f} to {scored_facts[needed_count-1][0]:.2f})")
+    if top:
+        max_score, min_score = top[0][0], top[-1][0]
+        print(f"  Kept {len(top_facts)} high-quality facts (score range: {max_score:.2f} to {min_score:.2f})")
+    else:
+        print("  Kept 0 high-quality facts")
 
-    # Calculate final coverage
-    final_qv_count = sum(1 for f in kept_facts if f.get('quantitative_values') and len(f['quantitative_values']) > 0)
+    # Calculate final coverage (only QV facts were counted, top facts have none)
     final_coverage = (final_qv_count / len(kept_facts) * 100) if len(kept_facts) > 0 else 0
 
     print(f"\n{'='*60}")
@@ -134,15 +245,11 @@ def aggressive_filter_facts(facts_file: Path, output_file: Path = None, target_c
 
     print(f"{'='*60}\n")
 
-    # Update document with filtered facts
-    data['documents'][doc_name]['facts'] = kept_facts
-
     # Save filtered facts
     if output_file is None:
         output_file = facts_file.parent / f"{facts_file.stem}_filtered.json"
 
-    with open(output_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    _write_filtered(data, doc_name, kept_facts, output_file)
 
     print(f"Saved filtered facts to: {output_file}")
 
@@ -3,54 +3,98 @@
 Analyze V4.2 results and compare to V3 baseline.
 """
 
-import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from frfr import _json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 def count_lines(text_file: Path) -> int:
     """Count lines in source text file."""
-    with open(text_file, 'r') as f:
-        return len(f.readlines())
+    count = 0
+    last = b''
+    with open(text_file, 'rb') as f:
+        while chunk := f.read(1 << 20):
+            count += chunk.count(b'\n')
+            last = chunk
+    # A final line without a trailing newline still counts
+    if last and not last.endswith(b'\n'):
+        count += 1
+    return count
+
+def _iter_facts(facts_file: Path):
+    """
+    Yield facts from every document in a facts JSON file.
+
+    Streams facts one at a time with ijson when it is installed so the
+    whole file never has to be resident; otherwise loads it in one go.
+    """
+    if ijson is None:
+        data = _json.load_file(facts_file)
+        for doc_name, doc_data in data.get('documents', {}).items():
+            yield from doc_data.get('facts', [])
+        return
+
+    with open(facts_file, 'rb') as f:
+        builder = None
+        fact_prefix = None
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if builder is None:
+                # Facts live at documents.<doc_name>.facts.item
+                if (event == 'start_map' and prefix.startswith('documents.')
+                        and prefix.endswith('.facts.item')):
+                    builder = ijson.ObjectBuilder()
+                    fact_prefix = prefix
+                    builder.event(event, value)
+                continue
+
+            builder.event(event, value)
+            if event == 'end_map' and prefix == fact_prefix:
+                yield builder.value
+                builder = None
 
 def analyze_facts(facts_file: Path) -> dict:
     """Analyze facts from JSON file."""
-    with open(facts_file, 'r') as f:
-        data = json.load(f)
-
-    # Get all facts
-    all_facts = []
-    for doc_name, doc_data in data.get('documents', {}).items():
-        facts = doc_data.get('facts', [])
-        all_facts.extend(facts)
-
-    # Count facts with quantitative values
-    qv_facts = [f for f in all_facts if f.get('quantitative_values') and len(f['quantitative_values']) > 0]
-
-    # Count specificity levels
-    high_specificity = [f for f in all_facts if f.get('specificity_score', 0) >= 0.7]
-    medium_specificity = [f for f in all_facts if 0.5 <= f.get('specificity_score', 0) < 0.7]
-    low_specificity = [f for f in all_facts if f.get('specificity_score', 0) < 0.5]
-
-    # Count facts with entity metadata
-    entity_facts = [f for f in all_facts if f.get('entities') and len(f['entities']) > 0]
-
-    # Count facts with process details
-    process_facts = [f for f in all_facts if f.get('process_details') and len(f['process_details']) > 0]
-
-    # Average specificity
-    avg_specificity = sum(f.get('specificity_score', 0) for f in all_facts) / len(all_facts) if all_facts else 0
+    total = qv = high = medium = low = entity = process = 0
+    specificity_sum = 0
+
+    for f in _iter_facts(facts_file):
+        total += 1
+        spec = f.get('specificity_score', 0) or 0
+        specificity_sum += spec
+
+        # Bucket specificity levels
+        if spec >= 0.7:
+            high += 1
+        elif spec >= 0.5:
+            medium += 1
+        else:
+            low += 1
+
+        # Quantitative values, entity metadata, process details
+        if f.get('quantitative_values'):
+            qv += 1
+        if f.get('entities'):
+            entity += 1
+        if f.get('process_details'):
+            process += 1
 
     return {
-        'total_facts': len(all_facts),
-        'qv_facts': len(qv_facts),
-        'qv_coverage': len(qv_facts) / len(all_facts) if all_facts else 0,
-        'high_specificity': len(high_specificity),
-        'medium_specificity': len(medium_specificity),
-        'low_specificity': len(low_specificity),
-        'avg_specificity': avg_specificity,
-        'entity_facts': len(entity_facts),
-        'entity_coverage': len(entity_facts) / len(all_facts) if all_facts else 0,
-        'process_facts': len(process_facts),
-        'process_coverage': len(process_facts) / len(all_facts) if all_facts else 0,
+        'total_facts': total,
+        'qv_facts': qv,
+        'qv_coverage': qv / total if total else 0,
+        'high_specificity': high,
+        'medium_specificity': medium,
+        'low_specificity': low,
+        'avg_specificity': specificity_sum / total if total else 0,
+        'entity_facts': entity,
+        'entity_coverage': entity / total if total else 0,
+        'process_facts': process,
+        'process_coverage': process / total if total else 0,
     }
 
 def main():
@@ -59,12 +103,17 @@ def main():
     v4_2_file = Path('output/lexisnexis_soc2_v4_2_facts.json')
     source_file = Path('output/soc2_full_extraction.txt')
 
-    # Count lines
-    total_lines = count_lines(source_file)
+    # Count lines and analyze both versions in parallel (independent files)
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        lines_future = executor.submit(count_lines, source_file)
+        v3_future = executor.submit(analyze_facts, v3_file)
+        v4_2_future = executor.submit(analyze_facts, v4_2_file)
+        total_lines = lines_future.result()
+        v3_stats = v3_future.result()
+        v4_2_stats = v4_2_future.result()
 
     # Analyze V3
     print("=== Analyzing V3 Baseline ===")
-    v3_stats = analyze_facts(v3_file)
     v3_density = (v3_stats['total_facts'] / total_lines) * 100
 
     print(f"Total facts: {v3_stats['total_facts']}")
@@ -77,7 +126,6 @@ def main():
 
     # Analyze V4.2
     print("=== Analyzing V4.2 ===")
-    v4_2_stats = analyze_facts(v4_2_file)
     v4_2_density = (v4_2_stats['total_facts'] / total_lines) * 100
 
     print(f"Total facts: {v4_2_stats['total_facts']}")
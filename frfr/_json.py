@@ -0,0 +1,85 @@
+"""
+JSON encoding helpers that use orjson when it is installed.
+
+orjson encodes and decodes in C and emits bytes directly; the stdlib json
+module is the fallback so orjson stays an optional dependency.
+"""
+
+import json
+import mmap
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        Encoded JSON
+    """
+    if HAVE_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Deserialize JSON from bytes or str.
+
+    Args:
+        data: Encoded JSON
+
+    Returns:
+        Decoded object
+    """
+    if HAVE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(path: str | Path) -> Any:
+    """
+    Read and decode a JSON file.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Decoded object
+    """
+    with open(path, "rb") as f:
+        if not HAVE_ORJSON or not f.seek(0, 2):
+            # Stdlib fallback, or an empty file (mmap cannot map one)
+            f.seek(0)
+            return loads(f.read())
+        # orjson parses straight from a memory map, without a read() copy
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def dump_file(obj: Any, path: str | Path, indent: bool = False) -> None:
+    """
+    Encode obj and write it to a JSON file.
+
+    Args:
+        obj: Object to serialize
+        path: Output path
+        indent: Pretty-print with 2-space indentation
+    """
+    with open(path, "wb") as f:
+        f.write(dumps(obj, indent=indent))
@@ -0,0 +1,219 @@
+"""
+On-disk caches for Claude responses (fact query answers, document summaries).
+"""
+
+import hashlib
+import logging
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from frfr import _json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "frfr"
+
+
+def _write_atomic(target: Path, data: bytes) -> None:
+    """
+    Write data to a file through a temp file and rename.
+
+    Readers never see a partial file, and the temp file is removed if the
+    write or the rename fails.
+
+    Args:
+        target: File to write (its directory is created if missing)
+        data: Contents to write
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("wb", dir=target.parent, suffix=".tmp", delete=False) as f:
+        tmp_file = Path(f.name)
+    try:
+        tmp_file.write_bytes(data)
+        tmp_file.replace(target)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+class ResponseCache:
+    """Caches query answers keyed by facts file state and question."""
+
+    def __init__(self, cache_dir: Optional[Path] = None, ttl: int = 3600):
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_dir: Base cache directory (default: ~/.cache/frfr)
+            ttl: Seconds a cached response stays valid (default: 1 hour)
+        """
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR) / "responses"
+        self.ttl = ttl
+
+    def make_key(self, facts_path: Path, question: str, variant: str = "") -> str:
+        """
+        Build a cache key for a question asked against a facts file.
+
+        The facts file's mtime and size stand in for its content, so editing or
+        regenerating the file invalidates earlier answers.
+
+        Args:
+            facts_path: Path to the facts file being queried
+            question: Question text (whitespace and case are normalized)
+            variant: Extra discriminator for prompt options (e.g. deep search)
+
+        Returns:
+            Hex digest cache key
+        """
+        facts_path = Path(facts_path)
+        stat = facts_path.stat()
+        normalized = " ".join(question.split()).lower()
+        raw = f"{facts_path.resolve()}|{stat.st_mtime_ns}|{stat.st_size}|{variant}|{normalized}"
+        return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached response text, or None if missing or expired
+        """
+        try:
+            entry = _json.load_file(self.cache_dir / f"{key}.json")
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get("created_at", 0) > self.ttl:
+            logger.debug("Response cache entry expired: %s", key)
+            (self.cache_dir / f"{key}.json").unlink(missing_ok=True)
+            return None
+
+        response = entry.get("response")
+        return response if isinstance(response, str) else None
+
+    def set(self, key: str, response: str, question: str = "") -> None:
+        """
+        Store a response in the cache.
+
+        Args:
+            key: Cache key from make_key()
+            response: Response text to store
+            question: Original question (kept for inspection only)
+        """
+        entry = {"created_at": time.time(), "question": question, "response": response}
+        try:
+            _write_atomic(self.cache_dir / f"{key}.json", _json.dumps(entry))
+        except OSError as e:
+            logger.warning("Failed to write response cache: %s", e)
+
+
+class SummaryCache:
+    """Caches document summaries keyed by the summarization prompt."""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize the summary cache.
+
+        Args:
+            cache_dir: Base cache directory (default: ~/.cache/frfr)
+        """
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR) / "summaries"
+
+    @staticmethod
+    def make_key(prompt: str) -> str:
+        """
+        Build a cache key for a summarization prompt.
+
+        The prompt embeds the document name and text as well as the
+        instructions, so editing the prompt template or the document both
+        produce a new key. Entries never expire.
+
+        Args:
+            prompt: Full prompt sent to Claude
+
+        Returns:
+            Hex digest cache key
+        """
+        return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Look up a cached summary.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached summary, or None if missing or unreadable
+        """
+        try:
+            summary = _json.load_file(self.cache_dir / f"{key}.json")
+        except (OSError, ValueError):
+            return None
+        return summary if isinstance(summary, dict) else None
+
+    def set(self, key: str, summary: dict) -> None:
+        """
+        Store a summary in the cache.
+
+        Args:
+            key: Cache key from make_key()
+            summary: Parsed summary to store
+        """
+        try:
+            _write_atomic(self.cache_dir / f"{key}.json", _json.dumps(summary))
+        except OSError as e:
+            logger.warning("Failed to write summary cache: %s", e)
+
+
+def load_json_cached(path: Path, cache_dir: Optional[Path] = None) -> Any:
+    """
+    Load a JSON file through a pickle copy kept in the cache directory.
+
+    Unpickling nested dicts is several times faster than parsing JSON, which
+    matters for large facts files loaded at every query/interactive startup.
+    The copy starts with the file's mtime and size, pickled separately ahead
+    of the data, so a stale copy is detected without unpickling the data and
+    is rebuilt.
+
+    Args:
+        path: JSON file to load
+        cache_dir: Base cache directory (default: ~/.cache/frfr)
+
+    Returns:
+        Decoded object
+    """
+    path = Path(path)
+    stat = path.stat()
+    resolved = str(path.resolve())
+    name = hashlib.md5(resolved.encode("utf-8")).hexdigest()
+    cache_file = Path(cache_dir or DEFAULT_CACHE_DIR) / "json" / f"{name}.pkl"
+    stamp = (resolved, stat.st_mtime_ns, stat.st_size)
+
+    try:
+        with open(cache_file, "rb") as f:
+            if pickle.load(f) == stamp:
+                return pickle.load(f)
+    except Exception:
+        # Missing, stale-format or corrupt copies are simply rebuilt
+        pass
+
+    data = _json.load_file(path)
+    try:
+        _write_atomic(
+            cache_file,
+            pickle.dumps(stamp, protocol=pickle.HIGHEST_PROTOCOL)
+            + pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL),
+        )
+    except OSError as e:
+        logger.warning("Failed to write JSON cache: %s", e)
+    return data
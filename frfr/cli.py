@@ -4,20 +4,86 @@ Command-line interface for Frfr.
 
 import sys
 import os
+import re
+import hashlib
+import threading
+from collections import Counter
+from fnmatch import fnmatch
+from functools import lru_cache
+
 import click
 from pathlib import Path
-from rich.console import Console
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from rich.console import Console, Group
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
 from rich.table import Table
+from rich.text import Text
 
-from frfr.documents import extract_pdf_to_text, get_pdf_info
-from frfr.extraction.fact_extractor import FactExtractor
+from frfr import _json
+from frfr.documents import PDF_BACKEND, SourceText, extract_pdf_to_text, get_pdf_info
+from frfr.retrieval import DEFAULT_TOP_K, LARGE_CORPUS_FACTS, FactIndex, embeddings_available
 from frfr.session import Session
-from frfr.validation import validate_consolidated_facts
+
+if TYPE_CHECKING:
+    # Imported lazily by the commands that use them (see query_cmd)
+    from frfr.cache import ResponseCache
+    from frfr.extraction.claude_client import ClaudeClient
 
 
 console = Console()
 
+# Directory listings for source text discovery, keyed by path: (mtime_ns, file names)
+_dir_listing_cache: Dict[str, Tuple[int, List[str]]] = {}
+
+# Matches fact locations like "Line 15" or "Lines 1245-1248"
+_LOCATION_RE = re.compile(r'Lines? (\d+)(?:-(\d+))?', re.IGNORECASE)
+
+# Matches inline citations like "[Fact 42]" in Claude's answers
+_FACT_CITE_RE = re.compile(r'\[Fact (\d+)\]')
+
+# Header line before each answer in a batched response ("=== QUESTION 2 ===")
+_BATCH_ANSWER_RE = re.compile(r'^=== QUESTION (\d+) ===[ \t]*$', re.MULTILINE)
+
+# System prompt for answering questions from facts; only the question, sent
+# separately, changes between turns (see _build_query_context)
+QUERY_CONTEXT_TEMPLATE = """You are answering a question based on extracted facts from a document.
+
+AVAILABLE FACTS:
+{facts_text}
+{deep_instruction}
+INSTRUCTIONS:
+1. Search through the facts to find information relevant to the question
+2. Provide a clear, direct answer with INLINE CITATIONS
+3. Cite facts inline using [Fact N] notation immediately after each claim
+4. If the facts don't contain enough information to answer, say so clearly
+5. Be precise - only claim what the facts actually support{deep_note}
+
+Format your response as:
+ANSWER: [your answer with inline citations like "SSO is enabled [Fact 42] using SAML 2.0 [Fact 108]"]
+CONFIDENCE: [High/Medium/Low]
+
+Example format:
+ANSWER: Yes, the vendor supports SSO [Fact 42]. The implementation uses SAML 2.0 protocol [Fact 108] and integrates with Azure AD [Fact 234].
+CONFIDENCE: High
+"""
+
+# Per-call prompt for several questions at once (see _build_batch_query_prompt);
+# headers must match _BATCH_ANSWER_RE
+BATCH_QUERY_TEMPLATE = """QUESTIONS:
+{questions}
+
+Answer each question separately and in order. Start each answer with a line containing only "=== QUESTION N ===" (N is the question number), followed by the ANSWER and CONFIDENCE format above."""
+
+DEEP_SEARCH_INSTRUCTION = """
+DEEP SEARCH MODE: You have access to surrounding context from the source document for each fact.
+Use this context to provide more detailed, nuanced answers. Look for additional details in the
+context that may not be captured in the fact claim itself.
+"""
+
+# Query context split around the facts, which are joined in without an
+# intermediate copy (see _build_query_context)
+_QUERY_CONTEXT_HEAD, _QUERY_CONTEXT_TAIL = QUERY_CONTEXT_TEMPLATE.split("{facts_text}")
+
 
 @click.group()
 @click.version_option(version="0.1.0")
@@ -27,8 +93,8 @@ def main():
 
 
 @main.command()
-@click.argument("pdf_path", type=click.Path(exists=True))
-@click.argument("output_path", type=click.Path())
+@click.argument("pdf_path", type=click.Path(exists=True, path_type=Path))
+@click.argument("output_path", type=click.Path(path_type=Path))
 @click.option(
     "--min-text-threshold",
     default=50,
@@ -39,18 +105,27 @@ def main():
     is_flag=True,
     help="Save extraction metadata (PDF source info) alongside text file",
 )
-def extract(pdf_path: str, output_path: str, min_text_threshold: int, save_metadata: bool):
+@click.option("--force", is_flag=True, help="Re-extract even if the output is up to date")
+@click.option("--workers", default=1, help="Processes to extract pages with (default: 1)")
+def extract(
+    pdf_path: Path,
+    output_path: Path,
+    min_text_threshold: int,
+    save_metadata: bool,
+    force: bool,
+    workers: int,
+):
     """
     Extract text from a PDF file.
 
     PDF_PATH: Path to the input PDF file
     OUTPUT_PATH: Path to save the extracted text file
+
+    Extraction is skipped when OUTPUT_PATH is newer than the PDF and was made
+    from identical PDF contents with the same settings; use --force to redo it.
     """
     console.print("\n[bold blue]📄 PDF Text Extraction[/bold blue]\n")
 
-    pdf_path = Path(pdf_path)
-    output_path = Path(output_path)
-
     # Get PDF info
     with Progress(
         SpinnerColumn(),
@@ -69,22 +144,35 @@ def extract(pdf_path: str, output_path: str, min_text_threshold: int, save_metad
     console.print(f"  Encrypted: {info['is_encrypted']}")
     console.print(f"  Size: {info['file_size']:,} bytes\n")
 
-    # Extract text
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        progress.add_task(f"Extracting text from {info['pages']} pages...", total=None)
-        try:
-            result = extract_pdf_to_text(
-                pdf_path=pdf_path,
-                output_path=output_path,
-                min_text_threshold=min_text_threshold,
-            )
-        except Exception as e:
-            console.print(f"\n[red]✗ Extraction failed: {e}[/red]")
-            sys.exit(1)
+    # Reuse the existing output if the PDF has not changed since it was made
+    result = None if force else _load_cached_extraction(pdf_path, output_path, min_text_threshold)
+
+    if result is not None:
+        console.print("[green]✓[/green] Output is up to date with the PDF (use --force to re-extract)")
+    else:
+        # The output is rewritten page by page; drop the old sidecar first so
+        # an interrupted extraction is never taken for an up-to-date one
+        _extraction_cache_path(output_path).unlink(missing_ok=True)
+
+        # Extract text
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+        ) as progress:
+            progress.add_task(f"Extracting text from {info['pages']} pages...", total=None)
+            try:
+                result = extract_pdf_to_text(
+                    pdf_path=pdf_path,
+                    output_path=output_path,
+                    min_text_threshold=min_text_threshold,
+                    workers=workers,
+                )
+            except Exception as e:
+                console.print(f"\n[red]✗ Extraction failed: {e}[/red]")
+                sys.exit(1)
+
+        _save_extraction_cache(pdf_path, output_path, min_text_threshold, result)
 
     console.print(f"\n[green]✓ Extraction complete![/green]")
     console.print(f"  Method: [cyan]{result['method']}[/cyan]")
@@ -95,8 +183,7 @@ def extract(pdf_path: str, output_path: str, min_text_threshold: int, save_metad
 
     # Save metadata if requested
     if save_metadata:
-        metadata_path = Path(output_path).with_suffix('.json')
-        import json
+        metadata_path = output_path.with_suffix('.json')
         metadata = {
             "source_pdf": result.get('source_pdf'),
             "source_pdf_path": result.get('source_pdf_path'),
@@ -105,16 +192,13 @@ def extract(pdf_path: str, output_path: str, min_text_threshold: int, save_metad
             "total_chars": result['total_chars'],
             "text_file": result['output_file'],
         }
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        _json.dump_file(metadata, metadata_path, indent=True)
         console.print(f"[green]✓[/green] Metadata saved: [cyan]{metadata_path}[/cyan]\n")
 
     # Preview
     console.print("[bold]Preview (first 500 characters):[/bold]")
     console.print("[dim]" + "─" * 60 + "[/dim]")
-    with open(output_path, "r") as f:
-        preview = f.read(500)
-        console.print(preview)
+    console.print(result["preview"])
     console.print("[dim]" + "─" * 60 + "[/dim]\n")
 
     console.print("[green]✅ Success![/green] Text file ready for processing.\n")
@@ -156,6 +240,7 @@ def info(pdf_path: str):
 @click.option("--end-chunk", default=None, type=int, help="End extraction at this chunk (inclusive)")
 @click.option("--max-workers", default=5, help="Maximum parallel Claude processes (default: 5)")
 @click.option("--multipass", is_flag=True, help="Enable multi-pass extraction (CUECs, test procedures, quantitative, technical specs)")
+@click.option("--no-cache", is_flag=True, help="Always summarize with Claude instead of reusing a cached summary")
 def extract_facts_cmd(
     text_file: str,
     document_name: str,
@@ -166,6 +251,7 @@ def extract_facts_cmd(
     end_chunk: int,
     max_workers: int,
     multipass: bool,
+    no_cache: bool,
 ):
     """
     Extract structured facts from a document using LLM.
@@ -178,8 +264,14 @@ def extract_facts_cmd(
     3. Extracts facts from each chunk using the summary as context
     4. Saves all artifacts in a session directory
 
+    The summary of a document is cached, so re-running on an unchanged
+    document skips step 1; pass --no-cache to regenerate it.
+
     Requires Claude CLI to be installed and authenticated (run 'claude login').
     """
+    from frfr.cache import SummaryCache
+    from frfr.extraction.fact_extractor import FactExtractor
+
     console.print("\n[bold blue]🔍 Fact Extraction Pipeline[/bold blue]\n")
 
     text_file = Path(text_file)
@@ -211,8 +303,12 @@ def extract_facts_cmd(
         chunk_size=chunk_size,
         overlap_size=overlap,
         max_workers=max_workers,
+        summary_cache=None if no_cache else SummaryCache(),
     )
 
+    # Size the progress bar up front so it shows an ETA from the start
+    chunk_count = extractor.count_chunks(text_file, start_chunk, end_chunk)
+
     # Run extraction with progress bar
     try:
         with Progress(
@@ -223,11 +319,9 @@ def extract_facts_cmd(
             TimeRemainingColumn(),
             console=console,
         ) as progress:
-            task = progress.add_task("[cyan]Processing chunks...", total=None)
+            task = progress.add_task("[cyan]Processing chunks...", total=chunk_count)
 
             def update_progress(current, total, message):
-                if progress.tasks[task].total is None:
-                    progress.update(task, total=total)
                 progress.update(task, completed=current, description=f"[cyan]{message}")
 
             result = extractor.extract_from_document(
@@ -275,32 +369,16 @@ def extract_facts_cmd(
         # Auto-consolidate facts
         console.print("[bold blue]📦 Consolidating facts...[/bold blue]\n")
 
-        # Load summary and all facts
-        summary = session.load_summary(document_name)
-        facts_list = session.load_all_facts(document_name)
-
-        # Create consolidated structure with source tracking
-        consolidated = {
-            "session_id": session.session_id,
-            "documents": {
-                document_name: {
-                    "summary": summary,
-                    "facts": facts_list,
-                    "fact_count": len(facts_list),
-                    "source_text_file": str(text_file),  # Track the text file used
-                }
-            },
-            "total_facts": len(facts_list),
-        }
-
-        # Save to output directory
+        # Save to output directory, streaming facts with source tracking
         output_dir = Path("output")
         output_dir.mkdir(exist_ok=True)
         output_file = output_dir / f"{document_name}_facts.json"
 
-        import json
-        with open(output_file, "w") as f:
-            json.dump(consolidated, f, indent=2)
+        session.write_consolidated(
+            output_file,
+            [document_name],
+            source_text_files={document_name: os.fspath(text_file)},  # Track the text file used
+        )
 
         console.print(f"[green]✓[/green] Consolidated facts saved: [cyan]{output_file}[/cyan]\n")
 
@@ -348,46 +426,22 @@ def consolidate_facts_cmd(session_id: str, output: str, document_name: str):
 
     console.print(f"Documents to consolidate: [cyan]{', '.join(docs)}[/cyan]\n")
 
-    # Consolidate facts
-    consolidated = {
-        "session_id": session.session_id,
-        "documents": {},
-        "total_facts": 0,
-    }
+    # Determine output path
+    if output:
+        output_path = Path(output)
+    else:
+        output_path = session.session_dir / "consolidated_facts.json"
 
+    # Consolidate facts, streaming each document's chunk files to the output
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
         task = progress.add_task("Loading facts...", total=len(docs))
-
-        for doc in docs:
-            # Load summary
-            summary = session.load_summary(doc)
-
-            # Load all facts for document
-            facts = session.load_all_facts(doc)
-
-            consolidated["documents"][doc] = {
-                "summary": summary,
-                "facts": facts,
-                "fact_count": len(facts),
-            }
-            consolidated["total_facts"] += len(facts)
-
-            progress.advance(task)
-
-    # Determine output path
-    if output:
-        output_path = Path(output)
-    else:
-        output_path = session.session_dir / "consolidated_facts.json"
-
-    # Save consolidated facts
-    import json
-    with open(output_path, "w") as f:
-        json.dump(consolidated, f, indent=2)
+        consolidated = session.write_consolidated(
+            output_path, docs, progress_callback=lambda doc: progress.advance(task)
+        )
 
     console.print(f"\n[green]✅ Consolidation complete![/green]\n")
 
@@ -398,7 +452,7 @@ def consolidate_facts_cmd(session_id: str, output: str, document_name: str):
     table.add_column("Summary Available", style="yellow")
 
     for doc, data in consolidated["documents"].items():
-        has_summary = "✓" if data["summary"] else "✗"
+        has_summary = "✓" if data["has_summary"] else "✗"
         table.add_row(doc, str(data["fact_count"]), has_summary)
 
     console.print(table)
@@ -424,6 +478,8 @@ def validate_facts_cmd(
     This command verifies that all evidence quotes actually exist in the
     specified line ranges of the source document.
     """
+    from frfr.validation import validate_consolidated_facts
+
     console.print("\n[bold blue]✓ Validating Facts[/bold blue]\n")
 
     consolidated_path = Path(consolidated_file)
@@ -504,9 +560,7 @@ def validate_facts_cmd(
                 ],
             }
 
-            import json
-            with open(output_path, "w") as f:
-                json.dump(report, f, indent=2)
+            _json.dump_file(report, output_path, indent=True)
 
             console.print(f"[green]✓[/green] Validation report saved: [cyan]{output_path}[/cyan]\n")
 
@@ -578,7 +632,7 @@ def session_info_cmd(session_id: str, document_name: str):
 
     for doc in docs:
         processed_chunks = session.get_processed_chunks(doc)
-        total_facts = len(session.load_all_facts(doc))
+        total_facts = sum(1 for _ in session.iter_facts(doc))
         has_summary = "✓" if session.load_summary(doc) else "✗"
 
         if processed_chunks:
@@ -652,44 +706,485 @@ def correct_quotes_cmd(session_id: str, text_file: str, document_name: str, min_
     console.print("[dim]Full session integration coming soon...[/dim]\n")
 
 
-def _get_surrounding_context(location_str: str, source_lines: list, context_lines: int = 10) -> str:
+def _extraction_cache_path(output_path: Path) -> Path:
+    """Sidecar file recording which PDF an extracted text file came from."""
+    return output_path.with_name(output_path.name + ".extract.json")
+
+
+def _file_sha256(path: Path) -> str:
+    """Hex SHA-256 of a file, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _load_cached_extraction(pdf_path: Path, output_path: Path, min_text_threshold: int) -> Optional[dict]:
+    """
+    Return the previous extraction result if the output is still current.
+
+    The output must be newer than the PDF (a cheap make-style check), and the
+    sidecar must record the same PDF hash, extraction settings and PDF
+    backend (pymupdf and PyPDF2 extract different text).
+
+    Args:
+        pdf_path: Input PDF
+        output_path: Extracted text file
+        min_text_threshold: Extraction setting the output must have used
+
+    Returns:
+        Extraction result dict (with a fresh preview), or None to re-extract
+    """
+    cache_path = _extraction_cache_path(output_path)
+    try:
+        if output_path.stat().st_mtime <= pdf_path.stat().st_mtime:
+            return None
+        cached = _json.load_file(cache_path)
+    except (OSError, ValueError):
+        return None
+
+    if cached.get("min_text_threshold") != min_text_threshold:
+        return None
+    if cached.get("pdf_backend") != PDF_BACKEND:
+        return None
+    if cached.get("pdf_sha256") != _file_sha256(pdf_path):
+        return None
+
+    result = cached.get("result") or {}
+    with open(output_path, "r", encoding="utf-8") as f:
+        result["preview"] = f.read(500)
+    return result
+
+
+def _save_extraction_cache(pdf_path: Path, output_path: Path, min_text_threshold: int, result: dict) -> None:
+    """Record the PDF hash and result for an extraction (see _load_cached_extraction)."""
+    cached = {
+        "pdf_sha256": _file_sha256(pdf_path),
+        "min_text_threshold": min_text_threshold,
+        "pdf_backend": PDF_BACKEND,
+        "result": {k: v for k, v in result.items() if k != "preview"},
+    }
+    try:
+        _json.dump_file(cached, _extraction_cache_path(output_path), indent=True)
+    except OSError as e:
+        console.print(f"[yellow]⚠ Could not write extraction cache: {e}[/yellow]")
+
+
+def _list_dir_files(directory: str) -> List[str]:
+    """
+    List visible file names in a directory, reusing the listing until it changes.
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        File names in directory order (hidden files skipped, like glob)
+    """
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        return []
+
+    cached = _dir_listing_cache.get(directory)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with os.scandir(directory) as entries:
+        names = [e.name for e in entries if not e.name.startswith(".") and e.is_file()]
+    _dir_listing_cache[directory] = (mtime, names)
+    return names
+
+
+def _find_first_match(patterns: list) -> Optional[str]:
+    """
+    Find the first file matching any of several glob patterns.
+
+    Each directory is scanned once and patterns are matched in memory.
+
+    Args:
+        patterns: Patterns like "output/name*.txt", tried in order
+
+    Returns:
+        Path string of the first match, or None
+    """
+    for pattern in patterns:
+        directory, name_pattern = os.path.split(pattern)
+        for name in _list_dir_files(directory or "."):
+            if fnmatch(name, name_pattern):
+                return os.path.join(directory, name) if directory else name
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_location(location_str: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse a location string into a 0-indexed (start, end) line range.
+
+    Args:
+        location_str: Location string like "Lines 1245-1248"
+
+    Returns:
+        Tuple of (start_line, end_line), or None if no line numbers found
+    """
+    match = _LOCATION_RE.search(location_str)
+    if not match:
+        return None
+
+    start_line = int(match.group(1)) - 1  # Convert to 0-indexed
+    end_line = int(match.group(2)) - 1 if match.group(2) else start_line
+    return start_line, end_line
+
+
+def _get_surrounding_context(location_str: str, source: SourceText, context_lines: int = 10) -> str:
     """
     Extract surrounding context from source document.
 
     Args:
         location_str: Location string like "Lines 1245-1248"
-        source_lines: List of all source text lines
+        source: Line-indexed source text
         context_lines: Number of lines before/after to include
 
     Returns:
         Surrounding context text
     """
-    import re
-
     # Parse location string to get line numbers
-    match = re.search(r'Lines? (\d+)(?:-(\d+))?', location_str, re.IGNORECASE)
-    if not match:
+    line_range = _parse_location(location_str)
+    if line_range is None:
         return ""
-
-    start_line = int(match.group(1)) - 1  # Convert to 0-indexed
-    end_line = int(match.group(2)) - 1 if match.group(2) else start_line
+    start_line, end_line = line_range
 
     # Calculate context window
     context_start = max(0, start_line - context_lines)
-    context_end = min(len(source_lines), end_line + context_lines + 1)
+    context_end = min(len(source), end_line + context_lines + 1)
 
-    # Extract context
-    context = "".join(source_lines[context_start:context_end])
+    # Extract context (one buffer slice, no per-line join)
+    context = source.get_lines(context_start, context_end)
     return context.strip()
 
 
+def _extract_evidence(fact: dict) -> str:
+    """Return the first evidence quote of a fact (V4 or V5 format), or ""."""
+    evidence: str = ""
+    evidence_quotes = fact.get("evidence_quotes")
+    if evidence_quotes:
+        # V5 format - get first quote
+        if isinstance(evidence_quotes, list):
+            evidence = evidence_quotes[0].get("quote", "")
+    else:
+        # V4 format
+        evidence = fact.get("evidence_quote", "")
+    return evidence
+
+
+def _normalize_evidence(all_facts: list) -> None:
+    """
+    Store each fact's first evidence quote as fact["_evidence"].
+
+    Done once after loading so prompt rendering and cited-fact display read
+    a plain string instead of re-checking the V4/V5 layout on every turn.
+    """
+    for fact in all_facts:
+        fact["_evidence"] = _extract_evidence(fact)
+
+
+def _attach_contexts(all_facts: list, source: SourceText, context_lines: int = 10) -> None:
+    """
+    Store each fact's surrounding source context as fact["_context"].
+
+    Deep search renders facts for every question (and every shortlist), so
+    the context is sliced from the source once up front and reused.
+
+    Args:
+        all_facts: Facts to annotate
+        source: Line-indexed source text
+        context_lines: Number of lines before/after to include
+    """
+    for fact in all_facts:
+        context = _get_surrounding_context(fact.get("source_location", ""), source, context_lines)
+        fact["_context"] = context[:300]
+
+
+def _render_facts(
+    all_facts: list, deep: bool = False, indices: list | None = None
+) -> list:
+    """
+    Render facts as the numbered list shown to Claude.
+
+    Built once per facts file and reused for every question, so the text
+    (and therefore the prompt prefix) is identical across turns. The text is
+    returned as pieces that _build_query_context joins straight into the
+    prompt, so the facts are copied once rather than joined twice.
+
+    Args:
+        all_facts: Facts in prompt order; numbering starts at 1
+        deep: Add each fact's surrounding context (see _attach_contexts)
+        indices: Optional subset of fact positions to render; facts keep
+            their numbers from the full list so citations stay valid
+
+    Returns:
+        Pieces of the rendered facts text, in order
+    """
+    numbered: Iterator[Tuple[int, dict]]
+    if indices is None:
+        numbered = enumerate(all_facts, 1)
+    else:
+        numbered = ((idx + 1, all_facts[idx]) for idx in indices)
+
+    # Each fact's entry is rendered once and kept on the fact, so shortlists
+    # rendered per question only add the number in front
+    key = "_entry_deep" if deep else "_entry"
+    parts: List[str] = []
+    append = parts.append
+    for i, fact in numbered:
+        entry = fact.get(key)
+        if entry is None:
+            entry = fact[key] = _render_fact_entry(fact, deep)
+        append(f"{i}. ")
+        append(entry)
+
+    return parts
+
+
+def _render_fact_entry(fact: dict, deep: bool) -> str:
+    """Render one fact for the prompt, without its leading number."""
+    claim = fact.get("claim", "")
+    location = fact.get("source_location", "")
+    evidence = fact["_evidence"]
+
+    lines = [f"{claim}\n   Location: {location}\n"]
+    if evidence:
+        evidence_preview = evidence[:150] + "..." if len(evidence) > 150 else evidence
+        lines.append(f"   Evidence: \"{evidence_preview}\"\n")
+
+    # Add surrounding context for deep search
+    if deep:
+        context = fact.get("_context")
+        if context:
+            lines.append(f"   Context: {context}...\n")
+
+    lines.append("\n")
+    return "".join(lines)
+
+
+def _build_query_context(facts_parts: list, deep: bool = False) -> str:
+    """
+    Build the static part of a query: instructions plus all rendered facts.
+
+    This is sent as the system prompt and is identical for every question
+    asked against the same facts, so the backend can reuse its cached prefix
+    across follow-up questions instead of reprocessing the facts each turn.
+
+    Args:
+        facts_parts: Numbered facts rendered for the prompt (_render_facts)
+        deep: Whether facts include surrounding source context
+
+    Returns:
+        System prompt text
+    """
+    tail = _QUERY_CONTEXT_TAIL.format(
+        deep_instruction=DEEP_SEARCH_INSTRUCTION if deep else "",
+        deep_note=" (including details from surrounding context)" if deep else "",
+    )
+    return "".join([_QUERY_CONTEXT_HEAD, *facts_parts, tail])
+
+
+# A system prompt, or a builder of one per question (or list of questions)
+_QueryContext = Union[str, Callable[[Union[str, List[str]]], str]]
+
+
+def _shortlist_query_context(
+    all_facts: list, top_k: int, deep: bool = False, semantic: bool = False
+) -> Callable[[Union[str, List[str]]], str]:
+    """
+    Build a per-question query context from the facts most relevant to it.
+
+    Facts sharing no terms with the question (and, with semantic, not close
+    to it) are left out of the prompt instead of being re-sent every turn.
+
+    Args:
+        all_facts: Facts in prompt order
+        top_k: Maximum facts sent per question
+        deep: Include surrounding context (see _attach_contexts)
+        semantic: Also rank facts by embedding similarity
+
+    Returns:
+        Function mapping a question, or a list of questions asked together, to
+        its system prompt; a list gets the union of each question's shortlist
+    """
+    index = FactIndex(all_facts, semantic=semantic)
+
+    def query_context(questions: Union[str, List[str]]) -> str:
+        if isinstance(questions, str):
+            questions = [questions]
+        indices = sorted(set().union(*(index.search(q, top_k) for q in questions)))
+        return _build_query_context(_render_facts(all_facts, deep, indices), deep)
+
+    return query_context
+
+
+def _build_query_prompt(question: str) -> str:
+    """Build the per-question part of a query sent after the static context."""
+    return f"QUESTION: {question}"
+
+
+def _build_batch_query_prompt(questions: list) -> str:
+    """
+    Build one query asking several questions against the same context.
+
+    Args:
+        questions: Questions to answer, numbered from 1 in the prompt
+
+    Returns:
+        Prompt asking for each answer under a "=== QUESTION N ===" header
+    """
+    numbered = "\n".join(f"{i}. {q}" for i, q in enumerate(questions, 1))
+    return BATCH_QUERY_TEMPLATE.format(questions=numbered)
+
+
+def _split_batch_answers(response: str, count: int) -> list:
+    """
+    Split a batched response into per-question answers.
+
+    Args:
+        response: Claude's answer to a _build_batch_query_prompt() query
+        count: Number of questions asked
+
+    Returns:
+        Answers in question order; questions without an answer get ""
+    """
+    answers = [""] * count
+    parts = _BATCH_ANSWER_RE.split(response)
+    # parts = [preamble, num, answer, num, answer, ...]
+    for num_str, answer in zip(parts[1::2], parts[2::2]):
+        idx = int(num_str) - 1
+        if 0 <= idx < count:
+            answers[idx] = answer.strip()
+    return answers
+
+
+def _answer_questions(
+    claude: "ClaudeClient",
+    questions: list,
+    query_context: _QueryContext,
+    cache: Optional["ResponseCache"] = None,
+    facts_path: Optional[Path] = None,
+    cache_variant: str = "",
+    max_workers: int = 5,
+) -> list:
+    """
+    Answer questions against a query context, reusing cached responses.
+
+    Args:
+        claude: ClaudeClient to send uncached questions to
+        questions: Questions to answer
+        query_context: System prompt from _build_query_context(), or a function
+            building one per question (e.g. from a shortlist of facts)
+        cache: Optional ResponseCache (used only when facts_path is given)
+        facts_path: Facts file the context was built from (cache key input)
+        cache_variant: Prompt option discriminator for the cache key
+        max_workers: Maximum parallel Claude processes for uncached questions
+
+    Returns:
+        Responses in question order; with several uncached questions a failed
+        one yields its exception instead of raising
+    """
+    responses: List[Union[str, Exception, None]] = [None] * len(questions)
+    keys = [""] * len(questions)
+    pending = []
+
+    for i, question in enumerate(questions):
+        if cache is not None and facts_path is not None:
+            keys[i] = cache.make_key(facts_path, question, cache_variant)
+            responses[i] = cache.get(keys[i])
+        if responses[i] is None:
+            pending.append(i)
+
+    system_prompts: List[Optional[str]]
+    if callable(query_context):
+        system_prompts = [query_context(questions[i]) for i in pending]
+    else:
+        system_prompts = [query_context] * len(pending)
+
+    if len(pending) == 1:
+        i = pending[0]
+        responses[i] = claude.prompt(_build_query_prompt(questions[i]), system_prompt=system_prompts[0])
+    elif pending:
+        answers = claude.prompt_many(
+            [_build_query_prompt(questions[i]) for i in pending],
+            max_workers=max_workers,
+            system_prompts=system_prompts,
+        )
+        for i, answer in zip(pending, answers):
+            responses[i] = answer
+
+    if cache is not None and facts_path is not None:
+        for i in pending:
+            response = responses[i]
+            if isinstance(response, str):
+                cache.set(keys[i], response, question=questions[i])
+
+    return responses
+
+
+def _print_cited_facts(response: str, all_facts: list) -> None:
+    """
+    Display the facts cited as [Fact N] in a response, with evidence.
+
+    Args:
+        response: Claude's answer text
+        all_facts: Facts in the numbering used for the prompt
+    """
+    # Unique fact numbers in order of appearance
+    unique_citations = list(dict.fromkeys(_FACT_CITE_RE.findall(response)))
+    if not unique_citations:
+        return
+
+    # Built as plain Text (no markup parsing of claims) and printed in one call
+    lines = [Text("Cited Facts:", style="bold"), Text()]
+    for num_str in unique_citations:
+        idx = int(num_str) - 1
+        if not 0 <= idx < len(all_facts):
+            continue
+        fact = all_facts[idx]
+        lines.append(Text.assemble((f"Fact {num_str}:", "cyan"), " ", fact.get("claim", "")))
+        lines.append(Text(f"  Location: {fact.get('source_location', '')}", style="dim"))
+
+        # Show evidence if available
+        evidence = fact["_evidence"]
+        if evidence:
+            evidence_preview = evidence[:200] + "..." if len(evidence) > 200 else evidence
+            lines.append(Text(f"  Evidence: \"{evidence_preview}\"", style="dim"))
+        lines.append(Text())
+
+    console.print(Group(*lines))
+
+
 @main.command("query")
 @click.argument("facts_file", type=click.Path(exists=True))
 @click.argument("question", type=str)
 @click.option("--interactive", "-i", is_flag=True, help="Enter interactive mode after answering")
 @click.option("--show-facts", is_flag=True, help="Show supporting facts in output")
 @click.option("--deep", is_flag=True, help="Deep search: include surrounding context from source document")
-def query_cmd(facts_file: str, question: str, interactive: bool, show_facts: bool, deep: bool):
+@click.option("--batch", is_flag=True, help="Treat QUESTION as a file with one question per line and answer them concurrently")
+@click.option("--max-workers", default=5, help="Maximum parallel Claude processes for --batch (default: 5)")
+@click.option("--no-cache", is_flag=True, help="Always ask Claude instead of reusing cached answers (cached for 1 hour)")
+@click.option("--top-k", type=int, default=None, help=f"Send only the N facts most relevant to each question (default: {DEFAULT_TOP_K} above {LARGE_CORPUS_FACTS} facts, 0 sends all)")
+@click.option("--semantic", is_flag=True, help="Shortlist facts by embedding similarity as well as keywords (needs fastembed)")
+@click.option("--use-api", is_flag=True, help="Call the Anthropic API directly (needs ANTHROPIC_API_KEY) instead of the claude CLI")
+def query_cmd(
+    facts_file: str,
+    question: str,
+    interactive: bool,
+    show_facts: bool,
+    deep: bool,
+    batch: bool,
+    max_workers: int,
+    no_cache: bool,
+    top_k: int,
+    semantic: bool,
+    use_api: bool,
+):
     """
     Query extracted facts to answer questions.
 
@@ -701,23 +1196,53 @@ def query_cmd(facts_file: str, question: str, interactive: bool, show_facts: boo
 
     Use --deep to include surrounding context from the source document for more
     detailed answers. Automatically finds the source text file.
+
+    Use --batch to pass a file of questions (one per line, '#' for comments)
+    as QUESTION; all questions are sent to Claude concurrently.
+
+    Answers are cached on disk for an hour per facts file and question; pass
+    --no-cache to always query Claude.
+
+    Large facts files are narrowed to the most relevant facts for each question
+    with a keyword index before querying; use --top-k to tune or disable this.
+    --semantic also ranks facts by embedding similarity (fused with keyword
+    ranks), which finds facts worded differently from the question.
     """
-    import json
-    import glob
+    from frfr.cache import ResponseCache, load_json_cached
     from frfr.extraction.claude_client import ClaudeClient
 
     console.print("\n[bold blue]🔍 Querying Knowledge Base[/bold blue]\n")
 
+    if semantic and not embeddings_available():
+        console.print("[red]✗ --semantic requires fastembed (pip install fastembed)[/red]\n")
+        sys.exit(1)
+
     facts_path = Path(facts_file)
     console.print(f"[green]✓[/green] Facts file: [cyan]{facts_path.name}[/cyan]")
     if deep:
         console.print(f"[green]✓[/green] Deep search: [cyan]enabled[/cyan] (will find source text)")
-    console.print(f"[green]✓[/green] Question: [italic]\"{question}\"[/italic]\n")
+
+    questions = [question]
+    if batch:
+        try:
+            with open(question, "r") as f:
+                questions = [
+                    line.strip() for line in f
+                    if line.strip() and not line.lstrip().startswith("#")
+                ]
+        except OSError as e:
+            console.print(f"[red]✗ Error reading questions file: {e}[/red]\n")
+            sys.exit(1)
+        if not questions:
+            console.print("[red]✗ No questions found in questions file[/red]\n")
+            sys.exit(1)
+        console.print(f"[green]✓[/green] Questions: [cyan]{len(questions)}[/cyan] from [cyan]{Path(question).name}[/cyan] (max {max_workers} parallel)\n")
+    else:
+        console.print(f"[green]✓[/green] Question: [italic]\"{question}\"[/italic]\n")
 
     # Load facts
     try:
-        with open(facts_path, "r") as f:
-            data = json.load(f)
+        data = load_json_cached(facts_path)
 
         # Extract facts from consolidated structure
         all_facts = []
@@ -730,13 +1255,14 @@ def query_cmd(facts_file: str, question: str, interactive: bool, show_facts: boo
             console.print("[red]✗ Invalid facts file format[/red]\n")
             sys.exit(1)
 
+        _normalize_evidence(all_facts)
         console.print(f"[dim]Loaded {len(all_facts)} facts[/dim]\n")
     except Exception as e:
         console.print(f"[red]✗ Error loading facts: {e}[/red]\n")
         sys.exit(1)
 
     # Load source text if deep search enabled
-    source_lines = []
+    source = None
     if deep:
         # Try to find source text file automatically
         # First check if any facts have source_doc field
@@ -767,11 +1293,7 @@ def query_cmd(facts_file: str, question: str, interactive: bool, show_facts: boo
         ])
 
         # Search for source text file
-        for pattern in search_patterns:
-            matches = glob.glob(pattern)
-            if matches:
-                source_text_path = matches[0]
-                break
+        source_text_path = _find_first_match(search_patterns)
 
         if not source_text_path:
             console.print("[yellow]⚠ Warning: Could not find source text file automatically[/yellow]")
@@ -779,125 +1301,66 @@ def query_cmd(facts_file: str, question: str, interactive: bool, show_facts: boo
             console.print("[yellow]Continuing without deep search context...[/yellow]\n")
         else:
             try:
-                with open(source_text_path, "r") as f:
-                    source_lines = f.readlines()
+                source = SourceText.from_file(source_text_path)
                 console.print(f"[green]✓[/green] Found source text: [cyan]{Path(source_text_path).name}[/cyan]")
-                console.print(f"[dim]Loaded {len(source_lines)} lines for deep context[/dim]\n")
+                console.print(f"[dim]Loaded {len(source)} lines for deep context[/dim]\n")
             except Exception as e:
                 console.print(f"[yellow]⚠ Warning: Could not load source text: {e}[/yellow]\n")
 
     # Query facts with Claude
     try:
         with console.status("[bold green]Querying facts with Claude..."):
-            claude = ClaudeClient()
-
-            # Build prompt with facts
-            facts_text = ""
-            for i, fact in enumerate(all_facts, 1):
-                claim = fact.get("claim", "")
-                location = fact.get("source_location", "")
-
-                # Get evidence quote (V4 or V5 format)
-                evidence = ""
-                if "evidence_quotes" in fact and fact["evidence_quotes"]:
-                    # V5 format - get first quote
-                    if isinstance(fact["evidence_quotes"], list) and len(fact["evidence_quotes"]) > 0:
-                        evidence = fact["evidence_quotes"][0].get("quote", "")
-                elif "evidence_quote" in fact:
-                    # V4 format
-                    evidence = fact.get("evidence_quote", "")
-
-                facts_text += f"{i}. {claim}\n"
-                facts_text += f"   Location: {location}\n"
-                if evidence:
-                    evidence_preview = evidence[:150] + "..." if len(evidence) > 150 else evidence
-                    facts_text += f"   Evidence: \"{evidence_preview}\"\n"
-
-                # Add surrounding context for deep search
-                if deep and source_lines:
-                    context = _get_surrounding_context(location, source_lines, context_lines=10)
-                    if context:
-                        facts_text += f"   Context: {context[:300]}...\n"
-
-                facts_text += "\n"
-
-            deep_instruction = ""
-            if deep:
-                deep_instruction = """
-DEEP SEARCH MODE: You have access to surrounding context from the source document for each fact.
-Use this context to provide more detailed, nuanced answers. Look for additional details in the
-context that may not be captured in the fact claim itself.
-"""
-
-            prompt = f"""You are answering a question based on extracted facts from a document.
-
-QUESTION: {question}
-
-AVAILABLE FACTS:
-{facts_text}
-{deep_instruction}
-INSTRUCTIONS:
-1. Search through the facts to find information relevant to the question
-2. Provide a clear, direct answer with INLINE CITATIONS
-3. Cite facts inline using [Fact N] notation immediately after each claim
-4. If the facts don't contain enough information to answer, say so clearly
-5. Be precise - only claim what the facts actually support{"" if not deep else " (including details from surrounding context)"}
+            claude = ClaudeClient(use_cli=not use_api)
+
+            deep_context = False
+            if deep and source is not None:
+                _attach_contexts(all_facts, source)
+                deep_context = True
+            cache_variant = "deep" if deep_context else ""
+
+            if top_k is None:
+                top_k = DEFAULT_TOP_K if semantic or len(all_facts) > LARGE_CORPUS_FACTS else 0
+
+            query_context: _QueryContext
+            if 0 < top_k < len(all_facts):
+                # Too many facts for one prompt: shortlist per question
+                query_context = _shortlist_query_context(all_facts, top_k, deep_context, semantic)
+                console.print(f"[dim]Sending the {top_k} most relevant facts per question[/dim]\n")
+
+                cache_variant += f"|top{top_k}" + ("|semantic" if semantic else "")
+            else:
+                # Render facts once; only the question varies between prompts
+                facts_parts = _render_facts(all_facts, deep_context)
+
+                # Facts and instructions are the same for every question
+                query_context = _build_query_context(facts_parts, deep_context)
+
+            cache = None if no_cache else ResponseCache()
+            responses = _answer_questions(
+                claude, questions, query_context, cache, facts_path, cache_variant, max_workers
+            )
 
-Format your response as:
-ANSWER: [your answer with inline citations like "SSO is enabled [Fact 42] using SAML 2.0 [Fact 108]"]
-CONFIDENCE: [High/Medium/Low]
+        # Parse response
+        console.print("[green]✅ Query complete![/green]\n")
 
-Example format:
-ANSWER: Yes, the vendor supports SSO [Fact 42]. The implementation uses SAML 2.0 protocol [Fact 108] and integrates with Azure AD [Fact 234].
-CONFIDENCE: High
-"""
+        for q, response in zip(questions, responses):
+            if batch:
+                console.print(f"[bold cyan]Question:[/bold cyan] [italic]{q}[/italic]")
 
-            response = claude.prompt(prompt)
+            if isinstance(response, Exception):
+                console.print(f"[red]✗ Query failed: {response}[/red]\n")
+                continue
 
-        # Parse response
-        console.print("[green]✅ Query complete![/green]\n")
+            # Display answer
+            console.print("[bold]Response:[/bold]")
+            console.print(response)
+            console.print()
 
-        # Display answer
-        console.print("[bold]Response:[/bold]")
-        console.print(response)
-        console.print()
+            # Extract and display cited facts
+            _print_cited_facts(response, all_facts)
 
-        # Extract and display cited facts
-        import re
-        fact_citations = re.findall(r'\[Fact (\d+)\]', response)
-        if fact_citations:
-            # Get unique fact numbers in order of appearance
-            seen = set()
-            unique_citations = []
-            for num_str in fact_citations:
-                if num_str not in seen:
-                    seen.add(num_str)
-                    unique_citations.append(num_str)
-
-            if show_facts or unique_citations:
-                console.print("[bold]Cited Facts:[/bold]\n")
-                for num_str in unique_citations:
-                    try:
-                        idx = int(num_str) - 1
-                        if 0 <= idx < len(all_facts):
-                            fact = all_facts[idx]
-                            console.print(f"[cyan]Fact {num_str}:[/cyan] {fact.get('claim', '')}")
-                            console.print(f"  [dim]Location: {fact.get('source_location', '')}[/dim]")
-
-                            # Show evidence if available
-                            evidence = ""
-                            if "evidence_quotes" in fact and fact["evidence_quotes"]:
-                                if isinstance(fact["evidence_quotes"], list) and len(fact["evidence_quotes"]) > 0:
-                                    evidence = fact["evidence_quotes"][0].get("quote", "")
-                            elif "evidence_quote" in fact:
-                                evidence = fact.get("evidence_quote", "")
-
-                            if evidence:
-                                evidence_preview = evidence[:200] + "..." if len(evidence) > 200 else evidence
-                                console.print(f"  [dim]Evidence: \"{evidence_preview}\"[/dim]")
-                            console.print()
-                    except (ValueError, IndexError):
-                        pass
+            if batch:
+                console.print("[dim]─" * 60 + "[/dim]\n")
 
         # Interactive mode
         if interactive:
@@ -917,54 +1380,16 @@ CONFIDENCE: High
                     # Query again with new question
                     console.print()
                     with console.status("[bold green]Querying..."):
-                        prompt = f"""You are answering a question based on extracted facts from a document.
-
-QUESTION: {next_question}
-
-AVAILABLE FACTS:
-{facts_text}
-
-INSTRUCTIONS:
-1. Search through the facts to find information relevant to the question
-2. Provide a clear, direct answer with INLINE CITATIONS
-3. Cite facts inline using [Fact N] notation immediately after each claim
-4. If the facts don't contain enough information to answer, say so clearly
-5. Be precise - only claim what the facts actually support
-
-Format your response as:
-ANSWER: [your answer with inline citations like "SSO is enabled [Fact 42] using SAML 2.0 [Fact 108]"]
-CONFIDENCE: [High/Medium/Low]
-
-Example format:
-ANSWER: Yes, the vendor supports SSO [Fact 42]. The implementation uses SAML 2.0 protocol [Fact 108] and integrates with Azure AD [Fact 234].
-CONFIDENCE: High
-"""
-                        response = claude.prompt(prompt)
+                        response = _answer_questions(
+                            claude, [next_question], query_context, cache, facts_path, cache_variant
+                        )[0]
 
                     console.print("\n[bold]Response:[/bold]")
                     console.print(response)
                     console.print()
 
                     # Show cited facts in interactive mode too
-                    fact_citations = re.findall(r'\[Fact (\d+)\]', response)
-                    if fact_citations:
-                        seen = set()
-                        unique_citations = []
-                        for num_str in fact_citations:
-                            if num_str not in seen:
-                                seen.add(num_str)
-                                unique_citations.append(num_str)
-
-                        console.print("[bold]Cited Facts:[/bold]\n")
-                        for num_str in unique_citations:
-                            try:
-                                idx = int(num_str) - 1
-                                if 0 <= idx < len(all_facts):
-                                    fact = all_facts[idx]
-                                    console.print(f"[cyan]Fact {num_str}:[/cyan] {fact.get('claim', '')}")
-                                    console.print(f"  [dim]Location: {fact.get('source_location', '')}[/dim]\n")
-                            except (ValueError, IndexError):
-                                pass
+                    _print_cited_facts(response, all_facts)
 
                 except KeyboardInterrupt:
                     console.print("\n\n[dim]Goodbye![/dim]\n")
@@ -980,10 +1405,21 @@ CONFIDENCE: High
         sys.exit(1)
 
 
+def _verify_quietly(claude: "ClaudeClient") -> None:
+    """Verify the Claude CLI, leaving any error to surface on the first prompt."""
+    try:
+        claude._verify_cli()
+    except RuntimeError:
+        pass
+
+
 @main.command("interactive")
 @click.argument("facts_file", type=click.Path(exists=True))
 @click.option("--show-facts", is_flag=True, help="Show supporting facts with each answer")
-def interactive_cmd(facts_file: str, show_facts: bool):
+@click.option("--top-k", type=int, default=None, help=f"Send only the N facts most relevant to each question (default: {DEFAULT_TOP_K} above {LARGE_CORPUS_FACTS} facts, 0 sends all)")
+@click.option("--no-cache", is_flag=True, help="Always ask Claude instead of reusing cached answers (cached for 1 hour)")
+@click.option("--use-api", is_flag=True, help="Call the Anthropic API directly (needs ANTHROPIC_API_KEY) instead of the claude CLI")
+def interactive_cmd(facts_file: str, show_facts: bool, top_k: int, no_cache: bool, use_api: bool):
     """
     Enter interactive query mode - ask questions about extracted facts.
 
@@ -996,11 +1432,17 @@ def interactive_cmd(facts_file: str, show_facts: bool):
     Commands:
       - Type any question to get an answer
       - /stats - Show database statistics
+      - /batch - Queue the following questions instead of asking each one
+      - /run - Ask all queued questions in a single Claude call
+      - /nocache - Toggle reusing cached answers
       - /help - Show available commands
       - exit, quit, q - Exit interactive mode
+
+    Answers are cached on disk for an hour per facts file and question and
+    shared with the query command; pass --no-cache or use /nocache to always
+    query Claude.
     """
-    import json
-    import re
+    from frfr.cache import ResponseCache, load_json_cached
     from frfr.extraction.claude_client import ClaudeClient
 
     console.print("\n[bold blue]🔍 Interactive Query Mode[/bold blue]\n")
@@ -1009,8 +1451,7 @@ def interactive_cmd(facts_file: str, show_facts: bool):
 
     # Load facts
     try:
-        with open(facts_path, "r") as f:
-            data = json.load(f)
+        data = load_json_cached(facts_path)
 
         # Extract facts from consolidated structure
         all_facts = []
@@ -1025,6 +1466,7 @@ def interactive_cmd(facts_file: str, show_facts: bool):
             console.print("[red]✗ Invalid facts file format[/red]\n")
             sys.exit(1)
 
+        _normalize_evidence(all_facts)
         console.print(f"[green]✓[/green] Loaded [cyan]{len(all_facts)}[/cyan] facts from [cyan]{facts_path.name}[/cyan]")
         if document_names:
             console.print(f"[dim]Documents: {', '.join(document_names)}[/dim]")
@@ -1034,43 +1476,55 @@ def interactive_cmd(facts_file: str, show_facts: bool):
         console.print(f"[red]✗ Error loading facts: {e}[/red]\n")
         sys.exit(1)
 
-    # Build facts text once (for reuse in all queries)
-    facts_text = ""
-    for i, fact in enumerate(all_facts, 1):
-        claim = fact.get("claim", "")
-        location = fact.get("source_location", "")
-
-        # Get evidence quote (V4 or V5 format)
-        evidence = ""
-        if "evidence_quotes" in fact and fact["evidence_quotes"]:
-            if isinstance(fact["evidence_quotes"], list) and len(fact["evidence_quotes"]) > 0:
-                evidence = fact["evidence_quotes"][0].get("quote", "")
-        elif "evidence_quote" in fact:
-            evidence = fact.get("evidence_quote", "")
-
-        facts_text += f"{i}. {claim}\n"
-        facts_text += f"   Location: {location}\n"
-        if evidence:
-            evidence_preview = evidence[:150] + "..." if len(evidence) > 150 else evidence
-            facts_text += f"   Evidence: \"{evidence_preview}\"\n"
-        facts_text += "\n"
+    if top_k is None:
+        top_k = DEFAULT_TOP_K if len(all_facts) > LARGE_CORPUS_FACTS else 0
 
-    # Initialize Claude client
+    query_context: _QueryContext
+    if 0 < top_k < len(all_facts):
+        # Too many facts for one prompt: shortlist per question
+        query_context = _shortlist_query_context(all_facts, top_k)
+        console.print(f"[dim]Sending the {top_k} most relevant facts per question[/dim]\n")
+        cache_variant = f"|top{top_k}"
+    else:
+        # Build the facts context once (for reuse in all queries)
+        query_context = _build_query_context(_render_facts(all_facts))
+        cache_variant = ""
+
+    # Same keys as the query command, so answers are shared between them.
+    # /run answers come from a multi-question prompt with a combined shortlist,
+    # so they are stored apart and never served to a single question.
+    batch_variant = cache_variant + "|batch"
+    cache = ResponseCache()
+    use_cache = not no_cache
+
+    # Facts don't change during the session, so /stats is computed once
+    fact_type_counts = Counter(f.get("fact_type", "unknown") for f in all_facts).most_common()
+    qv_count = sum(1 for f in all_facts if f.get("quantitative_values"))
+
+    # Initialize Claude client; the CLI check runs in the background so the
+    # prompt appears right away (a failed check is raised on the first question)
     try:
-        claude = ClaudeClient()
+        claude = ClaudeClient(use_cli=not use_api, verify=False)
     except Exception as e:
         console.print(f"[red]✗ Failed to initialize Claude: {e}[/red]\n")
         sys.exit(1)
+    if claude.use_cli:
+        threading.Thread(target=_verify_quietly, args=(claude,), daemon=True).start()
 
     # Show help
     console.print("[bold]Interactive Mode Commands:[/bold]")
     console.print("  [cyan]/stats[/cyan]  - Show database statistics")
+    console.print("  [cyan]/batch[/cyan]  - Queue questions, then /run to ask them together")
+    console.print("  [cyan]/nocache[/cyan] - Toggle reusing cached answers")
     console.print("  [cyan]/help[/cyan]   - Show this help message")
     console.print("  [cyan]exit[/cyan]    - Exit interactive mode")
     console.print()
     console.print("[yellow]Type your questions below:[/yellow]")
     console.print("[dim]─" * 60 + "[/dim]\n")
 
+    # Questions queued by /batch; None when not batching
+    batch_questions: Optional[List[str]] = None
+
     # Interactive loop
     while True:
         try:
@@ -1094,27 +1548,83 @@ def interactive_cmd(facts_file: str, show_facts: bool):
                     console.print("[bold]Database Statistics:[/bold]")
                     console.print(f"  Total facts: [cyan]{len(all_facts)}[/cyan]")
 
-                    # Count by fact type
-                    fact_types = {}
-                    for fact in all_facts:
-                        ft = fact.get("fact_type", "unknown")
-                        fact_types[ft] = fact_types.get(ft, 0) + 1
-
                     console.print("\n  [bold]By Type:[/bold]")
-                    for ft, count in sorted(fact_types.items(), key=lambda x: x[1], reverse=True):
+                    for ft, count in fact_type_counts:
                         console.print(f"    {ft}: {count}")
 
-                    # Count facts with quantitative values
-                    qv_count = sum(1 for f in all_facts if f.get("quantitative_values"))
-                    console.print(f"\n  Facts with quantitative values: [cyan]{qv_count}[/cyan] ({qv_count/len(all_facts)*100:.1f}%)")
+                    qv_share = qv_count / len(all_facts) * 100 if all_facts else 0.0
+                    console.print(f"\n  Facts with quantitative values: [cyan]{qv_count}[/cyan] ({qv_share:.1f}%)")
 
                     console.print()
                     continue
 
+                elif cmd == '/nocache':
+                    use_cache = not use_cache
+                    state = "on" if use_cache else "off"
+                    console.print(f"[dim]Answer cache {state}[/dim]\n")
+                    continue
+
+                elif cmd == '/batch':
+                    if batch_questions is None:
+                        batch_questions = []
+                    console.print("[dim]Batch mode: questions are queued until /run[/dim]\n")
+                    continue
+
+                elif cmd == '/run':
+                    if not batch_questions:
+                        console.print("[yellow]No queued questions (use /batch first)[/yellow]\n")
+                        batch_questions = None
+                        continue
+
+                    queued = batch_questions
+                    answers: List[Optional[str]] = [None] * len(queued)
+                    if use_cache:
+                        # A single-question answer is as good as a batched one
+                        for i, q in enumerate(queued):
+                            answers[i] = (
+                                cache.get(cache.make_key(facts_path, q, cache_variant))
+                                or cache.get(cache.make_key(facts_path, q, batch_variant))
+                            )
+                    pending = [i for i, answer in enumerate(answers) if answer is None]
+
+                    console.print()
+                    if pending:
+                        asked = [queued[i] for i in pending]
+                        # Every queued question brings its own shortlist into the shared context
+                        system_prompt = query_context(asked) if callable(query_context) else query_context
+                        with console.status(f"[bold green]Querying {len(asked)} questions..."):
+                            response = claude.prompt(
+                                _build_batch_query_prompt(asked), system_prompt=system_prompt
+                            )
+                        for i, answer in zip(pending, _split_batch_answers(response, len(asked))):
+                            answers[i] = answer
+                            if use_cache and answer:
+                                cache.set(
+                                    cache.make_key(facts_path, queued[i], batch_variant),
+                                    answer,
+                                    question=queued[i],
+                                )
+                    # Cleared only on success so a failed call can be re-run
+                    batch_questions = None
+
+                    for i, (q, answer) in enumerate(zip(queued, answers), 1):
+                        console.print(f"[bold cyan]Question {i}:[/bold cyan] [italic]{q}[/italic]")
+                        console.print("[bold]Response:[/bold]")
+                        console.print(answer or "[yellow]No answer found in response[/yellow]")
+                        console.print()
+                        if show_facts and answer:
+                            _print_cited_facts(answer, all_facts)
+
+                    console.print("[dim]─" * 60 + "[/dim]\n")
+                    continue
+
                 elif cmd == '/help':
                     console.print()
                     console.print("[bold]Available Commands:[/bold]")
                     console.print("  [cyan]/stats[/cyan]  - Show database statistics")
+                    console.print("  [cyan]/batch[/cyan]  - Queue the following questions")
+                    console.print("  [cyan]/run[/cyan]    - Ask all queued questions in one call")
+                    console.print("  [cyan]/nocache[/cyan] - Toggle reusing cached answers")
                     console.print("  [cyan]/help[/cyan]   - Show this help message")
                     console.print("  [cyan]exit[/cyan]    - Exit interactive mode")
                     console.print("\n[bold]Tips:[/bold]")
@@ -1129,32 +1639,18 @@ def interactive_cmd(facts_file: str, show_facts: bool):
                     console.print("[dim]Type /help for available commands[/dim]\n")
                     continue
 
-            # Query with Claude
+            if batch_questions is not None:
+                batch_questions.append(question)
+                console.print(f"[dim]Queued question {len(batch_questions)} (/run to ask)[/dim]\n")
+                continue
+
+            # Query with Claude; the facts context is reused, only the question is new
             console.print()
             with console.status("[bold green]Querying..."):
-                prompt = f"""You are answering a question based on extracted facts from a document.
-
-QUESTION: {question}
-
-AVAILABLE FACTS:
-{facts_text}
-
-INSTRUCTIONS:
-1. Search through the facts to find information relevant to the question
-2. Provide a clear, direct answer with INLINE CITATIONS
-3. Cite facts inline using [Fact N] notation immediately after each claim
-4. If the facts don't contain enough information to answer, say so clearly
-5. Be precise - only claim what the facts actually support
-
-Format your response as:
-ANSWER: [your answer with inline citations like "SSO is enabled [Fact 42] using SAML 2.0 [Fact 108]"]
-CONFIDENCE: [High/Medium/Low]
-
-Example format:
-ANSWER: Yes, the vendor supports SSO [Fact 42]. The implementation uses SAML 2.0 protocol [Fact 108] and integrates with Azure AD [Fact 234].
-CONFIDENCE: High
-"""
-                response = claude.prompt(prompt, max_tokens=4000)
+                response = _answer_questions(
+                    claude, [question], query_context,
+                    cache if use_cache else None, facts_path, cache_variant,
+                )[0]
 
             # Display answer
             console.print("[bold]Response:[/bold]")
@@ -1162,39 +1658,8 @@ CONFIDENCE: High
             console.print()
 
             # Extract and display cited facts
-            fact_citations = re.findall(r'\[Fact (\d+)\]', response)
-            if fact_citations and show_facts:
-                # Get unique fact numbers in order of appearance
-                seen = set()
-                unique_citations = []
-                for num_str in fact_citations:
-                    if num_str not in seen:
-                        seen.add(num_str)
-                        unique_citations.append(num_str)
-
-                console.print("[bold]Cited Facts:[/bold]\n")
-                for num_str in unique_citations:
-                    try:
-                        idx = int(num_str) - 1
-                        if 0 <= idx < len(all_facts):
-                            fact = all_facts[idx]
-                            console.print(f"[cyan]Fact {num_str}:[/cyan] {fact.get('claim', '')}")
-                            console.print(f"  [dim]Location: {fact.get('source_location', '')}[/dim]")
-
-                            # Show evidence if available
-                            evidence = ""
-                            if "evidence_quotes" in fact and fact["evidence_quotes"]:
-                                if isinstance(fact["evidence_quotes"], list) and len(fact["evidence_quotes"]) > 0:
-                                    evidence = fact["evidence_quotes"][0].get("quote", "")
-                            elif "evidence_quote" in fact:
-                                evidence = fact.get("evidence_quote", "")
-
-                            if evidence:
-                                evidence_preview = evidence[:200] + "..." if len(evidence) > 200 else evidence
-                                console.print(f"  [dim]Evidence: \"{evidence_preview}\"[/dim]")
-                            console.print()
-                    except (ValueError, IndexError):
-                        pass
+            if show_facts:
+                _print_cited_facts(response, all_facts)
 
             console.print("[dim]─" * 60 + "[/dim]\n")
 
@@ -9,11 +9,15 @@ from .pdf_extractor import (
     extract_pdf_page_to_text,
     get_pdf_info,
     PDFExtractionError,
+    PDF_BACKEND,
 )
+from .source_text import SourceText
 
 __all__ = [
     "extract_pdf_to_text",
     "extract_pdf_page_to_text",
     "get_pdf_info",
     "PDFExtractionError",
+    "PDF_BACKEND",
+    "SourceText",
 ]
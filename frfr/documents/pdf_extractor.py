@@ -2,50 +2,119 @@
 PDF text extraction module.
 
 Provides a simple API to extract text from PDFs using the best available method:
-- PyPDF2 for text-based PDFs (fast, clean)
+- PyMuPDF for text-based PDFs when installed (MuPDF's C parser, much faster)
+- PyPDF2 for text-based PDFs otherwise (pure Python)
 - Tesseract OCR for scanned PDFs (fallback)
 """
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from PyPDF2 import PdfReader
 from PIL import Image
 import pytesseract
 import subprocess
 
+try:
+    import pymupdf  # type: ignore[import-not-found]
+except ImportError:
+    pymupdf = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Text extraction backend, reported as the "method" of extracted text
+PDF_BACKEND = "pymupdf" if pymupdf is not None else "pypdf2"
+
+# Separator written between pages in extracted text files
+PAGE_BREAK = "\n\n=== PAGE BREAK ===\n\n"
+
+# Characters of extracted text returned as a preview
+PREVIEW_CHARS = 500
+
 
 class PDFExtractionError(Exception):
     """Raised when PDF text extraction fails."""
     pass
 
 
+def _read_pdf_info(pdf_path: str) -> tuple[int, bool]:
+    """Return (page count, is encrypted) using the active backend."""
+    if pymupdf is not None:
+        with pymupdf.open(pdf_path) as doc:
+            # is_encrypted clears once an empty user password is accepted on open
+            return doc.page_count, bool(doc.metadata.get("encryption"))
+    reader = PdfReader(pdf_path)
+    return len(reader.pages), reader.is_encrypted
+
+
+def _iter_range_texts(pdf_path: str, start: int, end: int) -> Iterator[str]:
+    """Yield the text of pages [start, end), opening the PDF once."""
+    if pymupdf is not None:
+        with pymupdf.open(pdf_path) as doc:
+            for i in range(start, end):
+                yield doc[i].get_text("text")
+        return
+
+    reader = PdfReader(pdf_path)
+    for i in range(start, end):
+        yield reader.pages[i].extract_text()
+
+
+def _extract_page_range(pdf_path: str, start: int, end: int) -> list[str]:
+    """Extract text from pages [start, end) in a worker process."""
+    return list(_iter_range_texts(pdf_path, start, end))
+
+
+def _iter_page_texts(pdf_path: Path, num_pages: int, workers: int) -> Iterator[str]:
+    """
+    Yield the text of each page in order.
+
+    With more than one worker, contiguous page ranges are extracted in a
+    process pool; each worker opens the PDF once per range rather than once
+    per page.
+    """
+    if workers <= 1 or num_pages < 2:
+        yield from _iter_range_texts(str(pdf_path), 0, num_pages)
+        return
+
+    # A few ranges per worker keeps the pool busy when pages vary in cost
+    range_size = max(1, -(-num_pages // (workers * 4)))
+    starts = range(0, num_pages, range_size)
+    ends = [min(start + range_size, num_pages) for start in starts]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for texts in executor.map(_extract_page_range, [str(pdf_path)] * len(ends), starts, ends):
+            yield from texts
+
+
 def extract_pdf_to_text(
     pdf_path: str | Path,
     output_path: str | Path,
-    min_text_threshold: int = 50
+    min_text_threshold: int = 50,
+    workers: int = 1,
 ) -> dict[str, any]:
     """
     Extract text from a PDF and save to a text file.
 
     Automatically chooses the best extraction method:
-    1. Tries PyPDF2 direct text extraction first (fast, clean)
+    1. Tries direct text extraction first (PyMuPDF or PyPDF2; fast, clean)
     2. Falls back to OCR for scanned PDFs
 
     Args:
         pdf_path: Path to the input PDF file
         output_path: Path to save the extracted text file
         min_text_threshold: Minimum characters to consider text extraction successful
+        workers: Processes to extract pages with (default: 1, in this process)
 
     Returns:
         dict with extraction metadata:
-            - method: "pypdf2" or "ocr"
+            - method: "pymupdf", "pypdf2" or "ocr"
             - pages: number of pages processed
             - total_chars: total characters extracted
             - output_file: path to output text file
+            - preview: first PREVIEW_CHARS (500) characters of the extracted text
 
     Raises:
         PDFExtractionError: If extraction fails
@@ -60,42 +129,46 @@ def extract_pdf_to_text(
     logger.info(f"Extracting text from: {pdf_path}")
 
     try:
-        # Try PyPDF2 first (fast and clean for text-based PDFs)
-        reader = PdfReader(str(pdf_path))
-        all_text = []
-        method = "pypdf2"
-
-        for page_num, page in enumerate(reader.pages):
-            text = page.extract_text()
-
-            # Check if we got meaningful text
-            if len(text.strip()) < min_text_threshold:
-                logger.warning(
-                    f"Page {page_num + 1}: Low text content ({len(text)} chars), "
-                    "might be scanned. Consider OCR fallback."
-                )
-
-            all_text.append(text)
-
-        # Join all pages
-        full_text = "\n\n=== PAGE BREAK ===\n\n".join(all_text)
+        # Direct text extraction first (fast and clean for text-based PDFs)
+        num_pages, _ = _read_pdf_info(str(pdf_path))
+        method = PDF_BACKEND
+        total_chars = 0
+        preview = ""
 
-        # Save to file
+        # Write each page as it is extracted so only one page is held in memory
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(full_text, encoding='utf-8')
+        with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            for page_num, text in enumerate(_iter_page_texts(pdf_path, num_pages, workers)):
+                # Check if we got meaningful text
+                if len(text.strip()) < min_text_threshold:
+                    logger.warning(
+                        f"Page {page_num + 1}: Low text content ({len(text)} chars), "
+                        "might be scanned. Consider OCR fallback."
+                    )
+
+                if page_num:
+                    f.write(PAGE_BREAK)
+                    total_chars += len(PAGE_BREAK)
+                    if len(preview) < PREVIEW_CHARS:
+                        preview += PAGE_BREAK
+                f.write(text)
+                total_chars += len(text)
+                if len(preview) < PREVIEW_CHARS:
+                    preview += text[:PREVIEW_CHARS]
 
         logger.info(
-            f"✓ Extracted {len(full_text)} characters from {len(reader.pages)} pages "
+            f"✓ Extracted {total_chars} characters from {num_pages} pages "
             f"using {method}"
         )
 
         return {
             "method": method,
-            "pages": len(reader.pages),
-            "total_chars": len(full_text),
+            "pages": num_pages,
+            "total_chars": total_chars,
             "output_file": str(output_path),
             "source_pdf": str(pdf_path.name),  # Original PDF filename
             "source_pdf_path": str(pdf_path),  # Full path to original PDF
+            "preview": preview[:PREVIEW_CHARS],
         }
 
     except Exception as e:
@@ -117,7 +190,7 @@ def extract_pdf_page_to_text(
         min_text_threshold: Minimum characters to consider text extraction successful
 
     Returns:
-        tuple of (text, method) where method is "pypdf2" or "ocr"
+        tuple of (text, method) where method is "pymupdf", "pypdf2" or "ocr"
 
     Raises:
         PDFExtractionError: If extraction fails
@@ -128,22 +201,22 @@ def extract_pdf_page_to_text(
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
     try:
-        reader = PdfReader(str(pdf_path))
+        num_pages, _ = _read_pdf_info(str(pdf_path))
 
-        if page_num >= len(reader.pages):
+        if page_num >= num_pages:
             raise PDFExtractionError(
-                f"Page {page_num} out of range (PDF has {len(reader.pages)} pages)"
+                f"Page {page_num} out of range (PDF has {num_pages} pages)"
             )
 
-        text = reader.pages[page_num].extract_text()
+        text = next(_iter_range_texts(str(pdf_path), page_num, page_num + 1))
 
         if len(text.strip()) >= min_text_threshold:
-            return text, "pypdf2"
+            return text, PDF_BACKEND
         else:
             logger.warning(
                 f"Page {page_num + 1}: Low text content, might need OCR fallback"
             )
-            return text, "pypdf2"
+            return text, PDF_BACKEND
 
     except Exception as e:
         logger.error(f"Page extraction failed: {e}")
@@ -174,11 +247,11 @@ def get_pdf_info(pdf_path: str | Path) -> dict[str, any]:
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
     try:
-        reader = PdfReader(str(pdf_path))
+        num_pages, is_encrypted = _read_pdf_info(str(pdf_path))
 
         return {
-            "pages": len(reader.pages),
-            "is_encrypted": reader.is_encrypted,
+            "pages": num_pages,
+            "is_encrypted": is_encrypted,
             "file_size": pdf_path.stat().st_size,
         }
 
@@ -0,0 +1,77 @@
+"""
+Line-indexed access to extracted source text.
+
+Keeps the text as one bytes buffer plus the byte offset of every line start,
+so a range of lines is a single slice instead of a join over per-line strings.
+Files are memory-mapped, so only the pages a query touches are read and
+repeated queries share the OS page cache.
+"""
+
+import mmap
+from array import array
+from pathlib import Path
+
+
+class SourceText:
+    """Source text buffer with an index of line start offsets."""
+
+    def __init__(self, data: bytes | mmap.mmap):
+        """
+        Index the line starts of a text buffer.
+
+        Args:
+            data: Raw UTF-8 text (bytes or a read-only memory map)
+        """
+        self.data = data
+
+        # line_starts[i] is the offset of line i; a final sentinel marks the end
+        starts = array("q", [0])
+        find = data.find
+        pos = find(b"\n")
+        while pos != -1:
+            starts.append(pos + 1)
+            pos = find(b"\n", pos + 1)
+        if len(data) and data[-1:] != b"\n":
+            starts.append(len(data))  # Unterminated final line
+        self.line_starts = starts
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "SourceText":
+        """
+        Memory-map and index a text file.
+
+        Args:
+            path: Path to the text file
+
+        Returns:
+            SourceText for the file contents
+        """
+        with open(path, "rb") as f:
+            try:
+                return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            except ValueError:
+                # Empty files cannot be mapped
+                return cls(b"")
+
+    def __len__(self) -> int:
+        """Number of lines (an unterminated final line counts)."""
+        return len(self.line_starts) - 1
+
+    def get_lines(self, start: int, end: int) -> str:
+        """
+        Get the text of a range of lines.
+
+        Args:
+            start: First line (0-indexed, inclusive)
+            end: Last line (0-indexed, exclusive)
+
+        Returns:
+            Text of the lines, including their newlines
+        """
+        start = max(0, start)
+        end = min(len(self), end)
+        if start >= end:
+            return ""
+
+        chunk = self.data[self.line_starts[start]:self.line_starts[end]]
+        return chunk.decode("utf-8", errors="replace").replace("\r\n", "\n")
@@ -1,30 +1,86 @@
 """
-Claude CLI client wrapper for making LLM calls via subprocess.
+Claude client wrapper for making LLM calls via the Claude CLI or the Anthropic API.
+
+The CLI (one subprocess per call, authenticated with 'claude login') is the
+default. With use_cli=False calls go through one long-lived Anthropic SDK
+client instead, which keeps its HTTP connections open across calls and marks
+stable prompt prefixes for prompt caching.
 """
 
 import json
 import logging
+import os
 import subprocess
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
+
+from frfr import _json
 
 logger = logging.getLogger(__name__)
 
+# Model used for direct API calls (the CLI uses its own configured model)
+DEFAULT_API_MODEL = "claude-sonnet-4-5"
+
+# Longest single command-line argument passed to the CLI; Linux rejects any
+# argument over 128 KiB (MAX_ARG_STRLEN), so stay safely below it
+MAX_ARG_BYTES = 100_000
+
 
 class ClaudeClient:
     """Wrapper around Claude CLI for headless LLM calls."""
 
-    def __init__(self, claude_command: str = "claude"):
+    # CLI commands already verified in this process; each check starts the CLI
+    _verified_commands: set = set()
+    _verify_lock = threading.Lock()
+
+    def __init__(
+        self,
+        claude_command: str = "claude",
+        use_cli: bool = True,
+        model: str = DEFAULT_API_MODEL,
+        api_key: Optional[str] = None,
+        verify: bool = True,
+    ):
         """
         Initialize Claude client.
 
         Args:
             claude_command: Path to claude CLI (default: "claude")
+            use_cli: Call the claude CLI (default); False uses the Anthropic API
+            model: Model for API calls (ignored for the CLI)
+            api_key: API key for API calls (default: ANTHROPIC_API_KEY env var)
+            verify: Check the CLI now (default); False defers the check to the
+                first prompt so callers can start up without waiting on it
         """
         self.claude_command = claude_command
-        self._verify_cli()
+        self.use_cli = use_cli
+        self.model = model
+        self._api = None
+
+        if use_cli:
+            if verify:
+                self._verify_cli()
+        else:
+            import anthropic
+
+            if not (api_key or os.environ.get("ANTHROPIC_API_KEY")):
+                raise RuntimeError("ANTHROPIC_API_KEY is not set; it is required for API calls")
+            try:
+                self._api = anthropic.Anthropic(api_key=api_key)
+            except anthropic.AnthropicError as e:
+                raise RuntimeError(f"Failed to initialize Anthropic API client: {e}")
+
+    def _verify_cli(self) -> None:
+        """Verify Claude CLI is available (once per command per process)."""
+        with self._verify_lock:
+            if self.claude_command in self._verified_commands:
+                return
+            self._run_version_check()
+            self._verified_commands.add(self.claude_command)
 
-    def _verify_cli(self):
-        """Verify Claude CLI is available."""
+    def _run_version_check(self) -> None:
+        """Run 'claude --version' and raise if the CLI is unusable."""
         try:
             result = subprocess.run(
                 [self.claude_command, "--version"],
@@ -34,7 +90,7 @@ class ClaudeClient:
             )
             if result.returncode != 0:
                 raise RuntimeError(f"Claude CLI returned error: {result.stderr}")
-            logger.info(f"Claude CLI version: {result.stdout.strip()}")
+            logger.info("Claude CLI version: %s", result.stdout.strip())
         except FileNotFoundError:
             raise RuntimeError(
                 f"Claude CLI not found at '{self.claude_command}'. "
@@ -49,6 +105,7 @@ class ClaudeClient:
         system_prompt: Optional[str] = None,
         max_tokens: int = 4000,
         timeout: int = 600,
+        cached_prefix: Optional[str] = None,
     ) -> str:
         """
         Send a prompt to Claude and get the response.
@@ -58,6 +115,10 @@ class ClaudeClient:
             system_prompt: Optional system prompt
             max_tokens: Maximum tokens in response
             timeout: Timeout in seconds
+            cached_prefix: Optional leading text shared by many prompts (e.g.
+                instructions and facts). It is sent ahead of prompt, unchanged,
+                so consecutive calls share a byte-identical prefix that the
+                backend can serve from its prompt cache.
 
         Returns:
             Response text from Claude
@@ -65,6 +126,12 @@ class ClaudeClient:
         Raises:
             RuntimeError: If the CLI call fails
         """
+        if not self.use_cli:
+            return self._prompt_api(prompt, system_prompt, max_tokens, timeout, cached_prefix)
+
+        # No-op once verified; covers clients created with verify=False
+        self._verify_cli()
+
         cmd = [
             self.claude_command,
             "-p",  # Print mode (non-interactive)
@@ -72,15 +139,23 @@ class ClaudeClient:
             "json",
         ]
 
-        if system_prompt:
-            cmd.extend(["--system-prompt", system_prompt])
+        if cached_prefix:
+            # Stable part first, varying part last, so only the tail differs
+            prompt = f"{cached_prefix}\n\n{prompt}"
 
-        cmd.append(prompt)
+        if system_prompt:
+            if len(system_prompt.encode("utf-8")) < MAX_ARG_BYTES:
+                cmd.extend(["--system-prompt", system_prompt])
+            else:
+                # Too long for a single argument; send it ahead of the prompt
+                prompt = f"{system_prompt}\n\n{prompt}"
 
         try:
-            logger.debug(f"Calling Claude CLI with prompt length: {len(prompt)}")
+            logger.debug("Calling Claude CLI with prompt length: %d", len(prompt))
+            # The prompt goes through stdin, so its size is not limited by argv
             result = subprocess.run(
                 cmd,
+                input=prompt,
                 capture_output=True,
                 text=True,
                 timeout=timeout,
@@ -92,37 +167,132 @@ class ClaudeClient:
 
             # Parse JSON response
             try:
-                response = json.loads(result.stdout)
+                response = _json.loads(result.stdout)
                 if response.get("is_error"):
                     raise RuntimeError(f"Claude returned error: {response.get('result')}")
 
                 # Extract the result text
-                result_text = response.get("result", "")
+                result_text: str = response.get("result", "")
 
                 # Log usage stats
                 usage = response.get("usage", {})
                 cost = response.get("total_cost_usd", 0)
                 logger.info(
-                    f"Claude response: {usage.get('input_tokens', 0)} input tokens, "
-                    f"{usage.get('output_tokens', 0)} output tokens, "
-                    f"${cost:.4f} cost"
+                    "Claude response: %d input tokens, %d output tokens, $%.4f cost",
+                    usage.get("input_tokens", 0),
+                    usage.get("output_tokens", 0),
+                    cost,
                 )
 
                 return result_text
 
             except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse Claude response as JSON: {e}")
-                logger.error(f"Response: {result.stdout[:500]}")
+                logger.error("Failed to parse Claude response as JSON: %s", e)
+                logger.error("Response: %s", result.stdout[:500])
                 raise RuntimeError(f"Invalid JSON response from Claude: {e}")
 
         except subprocess.TimeoutExpired:
             raise RuntimeError(f"Claude CLI timed out after {timeout}s")
         except Exception as e:
-            logger.error(f"Claude CLI call failed: {e}")
+            logger.error("Claude CLI call failed: %s", e)
             raise
 
+    def _prompt_api(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_tokens: int,
+        timeout: int,
+        cached_prefix: Optional[str],
+    ) -> str:
+        """
+        Send a prompt through the Anthropic API (see prompt() for arguments).
+
+        The system prompt and cached_prefix are sent as separate blocks marked
+        with cache_control, so repeated calls reuse them from the prompt cache.
+        """
+        import anthropic
+
+        cache_control = {"type": "ephemeral"}
+
+        content: Union[str, List[Dict[str, Any]]] = prompt
+        if cached_prefix:
+            content = [
+                {"type": "text", "text": cached_prefix, "cache_control": cache_control},
+                {"type": "text", "text": prompt},
+            ]
+
+        request: Dict[str, Any] = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": content}],
+            "timeout": timeout,
+        }
+        if system_prompt:
+            request["system"] = [
+                {"type": "text", "text": system_prompt, "cache_control": cache_control}
+            ]
+
+        assert self._api is not None, "API client is only created with use_cli=False"
+        try:
+            logger.debug("Calling Anthropic API with prompt length: %d", len(prompt))
+            message = self._api.messages.create(**request)
+        except anthropic.APIError as e:
+            logger.error("Anthropic API call failed: %s", e)
+            raise RuntimeError(f"Anthropic API call failed: {e}")
+
+        usage = message.usage
+        logger.info(
+            "Claude response: %d input tokens, %d cached input tokens, %d output tokens",
+            usage.input_tokens,
+            getattr(usage, "cache_read_input_tokens", 0) or 0,
+            usage.output_tokens,
+        )
+
+        return "".join(block.text for block in message.content if block.type == "text")
+
+    def prompt_many(
+        self,
+        prompts: List[str],
+        max_workers: int = 5,
+        system_prompts: Optional[List[Optional[str]]] = None,
+        **kwargs: Any,
+    ) -> List[Union[str, Exception]]:
+        """
+        Send several prompts concurrently and collect the responses.
+
+        Each call is a separate CLI process, so threads overlap the round trips
+        while max_workers bounds how many requests are in flight at once.
+
+        Args:
+            prompts: Prompts to send
+            max_workers: Maximum parallel Claude processes
+            system_prompts: Optional per-prompt system prompts (overrides a
+                system_prompt passed in kwargs)
+            **kwargs: Passed through to prompt()
+
+        Returns:
+            Responses in input order. A prompt that fails yields its exception
+            instead of raising, so one bad call does not discard the batch.
+        """
+        def run(prompt: str, system_prompt: Optional[str] = None) -> Union[str, Exception]:
+            try:
+                if system_prompts is not None:
+                    return self.prompt(prompt, **{**kwargs, "system_prompt": system_prompt})
+                return self.prompt(prompt, **kwargs)
+            except Exception as e:
+                return e
+
+        if not prompts:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(prompts)))) as executor:
+            if system_prompts is not None:
+                return list(executor.map(run, prompts, system_prompts))
+            return list(executor.map(run, prompts))
+
 
-def test_claude_client():
+def test_claude_client() -> None:
     """Test the Claude client."""
     client = ClaudeClient()
     result = client.prompt("What is 2+2? Respond with just the number.")
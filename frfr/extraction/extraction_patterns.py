@@ -7,11 +7,222 @@ control information from SOC 2 reports and similar compliance documents.
 """
 
 import re
-from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    import hyperscan  # type: ignore[import-not-found,import-untyped]
+except ImportError:
+    hyperscan = None  # type: ignore[assignment]
+
+try:
+    import re2  # type: ignore[import-not-found,import-untyped]
+except ImportError:
+    re2 = None  # type: ignore[assignment]
+
+# Engine for the extraction patterns: RE2 (linear time, no
+# backtracking) when google-re2 is installed, otherwise Python's re
+REGEX_ENGINE = "re2" if re2 is not None else "re"
+
+# Frequency phrase -> normalized form, checked in order; the first term found
+# in the text wins (so "semi-annually" normalizes to "annually")
+FREQUENCY_NORMALIZATION = (
+    ("daily", "daily"),
+    ("every day", "daily"),
+    ("weekly", "weekly"),
+    ("every week", "weekly"),
+    ("monthly", "monthly"),
+    ("every month", "monthly"),
+    ("quarterly", "quarterly"),
+    ("every quarter", "quarterly"),
+    ("annually", "annually"),
+    ("yearly", "annually"),
+    ("every year", "annually"),
+    ("real-time", "continuous"),
+    ("continuous", "continuous"),
+)
+
+# Roles too generic to count as a specific WHO (see calculate_specificity_score)
+GENERIC_ROLES = frozenset({"management", "personnel", "staff", "it personnel"})
+
+# Terms that make a claim less specific (see calculate_specificity_score)
+VAGUE_TERMS = ("periodically", "regularly", "as needed", "as appropriate", "certain", "various")
+
+# All vague terms in one pattern, so a claim is scanned once. It is matched
+# against the lowercased claim: a case-sensitive scan of lower() text is
+# several times faster than re.IGNORECASE on these literal alternatives
+_VAGUE_TERMS_RE = re.compile("|".join(re.escape(term) for term in VAGUE_TERMS))
+
+
+def _compile_all(patterns: List[str], flags: int = re.IGNORECASE) -> Tuple[re.Pattern, ...]:
+    """Compile a list of patterns once, at import time."""
+    return tuple(re.compile(p, flags) for p in patterns)
+
+
+def _compile_any(patterns: Tuple[re.Pattern, ...]) -> re.Pattern:
+    """
+    Fuse compiled patterns into one alternation, to test whether any matches.
+
+    At each position only the first alternative that matches is reported, so
+    a fused pattern finds fewer matches than scanning each pattern (a greedy
+    role match can swallow later roles); use it for search(), not finditer().
+    """
+    return re.compile("|".join(f"(?:{p.pattern})" for p in patterns), patterns[0].flags)
+
+
+def _to_re2_syntax(pattern: str) -> str:
+    """
+    Rewrite a pattern so RE2's whitespace class matches what re's matches on
+    ASCII text (re's also covers vertical tab and the ASCII separators).
+    """
+    out: List[str] = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            escape = pattern[i:i + 2]
+            if escape == r"\s":
+                extra = r"\s\x0b\x1c-\x1f"
+                out.append(extra if in_class else f"[{extra}]")
+            else:
+                out.append(escape)
+            i += 2
+            continue
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        out.append(char)
+        i += 1
+    return "".join(out)
+
+
+def _compile_linear(pattern: re.Pattern) -> Any:
+    """
+    Compile an RE2 equivalent of a pattern, if google-re2 is installed.
+
+    RE2 matches in linear time with the same leftmost-first alternation as
+    re, so it reports the same matches on ASCII text without backtracking.
+
+    Args:
+        pattern: Compiled re pattern (IGNORECASE is the only flag honored)
+
+    Returns:
+        RE2 pattern, or None when google-re2 is unavailable or rejects it
+    """
+    if re2 is None:
+        return None
+
+    options = re2.Options()
+    options.case_sensitive = not pattern.flags & re.IGNORECASE
+    options.max_mem = 8 << 20
+    try:
+        return re2.compile(_to_re2_syntax(pattern.pattern), options)
+    except re2.error:
+        return None
+
+
+# RE2 equivalents of the extraction patterns (see _finditer)
+_LINEAR_PATTERNS: Dict[re.Pattern, Any] = {}
+
+
+def _linear(patterns: Tuple[re.Pattern, ...]) -> Tuple[re.Pattern, ...]:
+    """Register RE2 equivalents for patterns scanned with _finditer."""
+    for pattern in patterns:
+        linear = _compile_linear(pattern)
+        if linear is not None:
+            _LINEAR_PATTERNS[pattern] = linear
+    return patterns
+
+
+def _finditer(pattern: re.Pattern, text: str) -> Iterator[Any]:
+    """
+    Iterate over the matches of a pattern, with RE2 when one is registered.
+
+    RE2's word-boundary, digit and word classes are ASCII-only while re's
+    are Unicode-aware, so only ASCII text goes through RE2.
+    """
+    linear = _LINEAR_PATTERNS.get(pattern)
+    if linear is not None and text.isascii():
+        matches: Iterator[Any] = linear.finditer(text)
+        return matches
+    return pattern.finditer(text)
+
+
+def _build_prefilter(pattern_groups: List[Tuple[re.Pattern, ...]]) -> Any:
+    """
+    Compile pattern groups into one Hyperscan database, if hyperscan is installed.
+
+    The database only answers which groups match somewhere in a text, in one
+    pass; extraction itself still uses re, so results are unchanged.
+
+    Args:
+        pattern_groups: Groups of patterns; a group's id is its position
+
+    Returns:
+        Hyperscan database, or None when hyperscan is unavailable
+    """
+    if hyperscan is None:
+        return None
+
+    expressions: List[bytes] = []
+    ids: List[int] = []
+    for group_id, patterns in enumerate(pattern_groups):
+        for pattern in patterns:
+            # Python's \s also matches \x1c-\x1f; none of these patterns use \s
+            # inside a character class
+            expressions.append(pattern.pattern.replace(r"\s", r"[\s\x1c-\x1f]").encode("ascii"))
+            ids.append(group_id)
+
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+    try:
+        db = hyperscan.Database()
+        db.compile(expressions=expressions, ids=ids, elements=len(expressions), flags=[flags] * len(expressions))
+    except hyperscan.error:
+        return None
+    return db
+
+
+def _matching_groups(db: Any, text: str) -> Optional[Set[int]]:
+    """
+    Ids of the prefilter groups with a match in text.
+
+    Hyperscan's word-boundary, digit and whitespace classes are ASCII-only
+    while re's are Unicode-aware, so only ASCII text is prefiltered.
+
+    Returns:
+        Matching group ids, or None if every group must be scanned
+    """
+    if db is None or not text.isascii():
+        return None
+
+    found: Set[int] = set()
+
+    def on_match(group_id: int, start: int, end: int, flags: int, context: Any) -> None:
+        found.add(group_id)
+
+    db.scan(text.encode("ascii"), match_event_handler=on_match)
+    return found
+
+
+def _unique_matches(patterns: Tuple[re.Pattern, ...], text: str) -> List[str]:
+    """
+    Distinct matches of several patterns, pattern by pattern in order.
+
+    Each pattern scans the text separately, so a match of one pattern never
+    hides an overlapping match of another ("Security Officer" within "Chief
+    Information Security Officer"). Repeated matches are kept once, in the
+    order first seen.
+    """
+    matches = [
+        match.group(0) for pattern in patterns for match in _finditer(pattern, text)
+    ]
+    return list(dict.fromkeys(matches))
 
 
-@dataclass
+@dataclass(slots=True)
 class QuantitativeValue:
     """Structured representation of a quantitative value."""
     value: str
@@ -19,7 +230,7 @@ class QuantitativeValue:
     normalized: Optional[str] = None  # Normalized representation
 
 
-@dataclass
+@dataclass(slots=True)
 class ControlTableRow:
     """Parsed control table row (3-column SOC 2 format)."""
     control_description: str
@@ -36,7 +247,7 @@ class ExtractionPatterns:
     """
 
     # Frequency patterns
-    FREQUENCY_PATTERNS = [
+    FREQUENCY_PATTERNS: ClassVar[Tuple[re.Pattern, ...]] = _linear(_compile_all([
         # Specific frequencies
         r'\b(daily|weekly|monthly|quarterly|semi-annually|annually|yearly)\b',
         r'\bevery\s+\d+\s+(day|days|week|weeks|month|months|quarter|quarters|year|years)\b',
@@ -46,192 +257,196 @@ class ExtractionPatterns:
         r'\bwithin\s+\d+\s+(hour|hours|day|days|business\s+days?)\b',
         r'\b(at\s+least|no\s+less\s+than|minimum\s+of)\s+\d+\s+times?\s+(per|each)\s+(day|week|month|quarter|year)\b',
         r'\bon\s+a\s+(daily|weekly|monthly|quarterly|yearly|regular)\s+basis\b',
-    ]
+    ]))
 
     # Duration patterns
-    DURATION_PATTERNS = [
+    DURATION_PATTERNS: ClassVar[Tuple[re.Pattern, ...]] = _linear(_compile_all([
         r'\b\d+\s+(day|days|week|weeks|month|months|quarter|quarters|year|years)\b',
         r'\b\d+\s+(hour|hours|minute|minutes|second|seconds)\b',
         r'\b\d+-(?:day|week|month|year)\s+(?:period|retention|window)\b',
-    ]
+    ]))
 
     # Sample size patterns
-    SAMPLE_SIZE_PATTERNS = [
+    SAMPLE_SIZE_PATTERNS: ClassVar[Tuple[re.Pattern, ...]] = _linear(_compile_all([
         r'\bsampled?\s+\d+\s+(?:of\s+\d+)?\s*(?:items?|users?|employees?|tickets?|controls?|instances?|requests?|reviews?|reports?)?\b',
         r'\bsample\s+of\s+\d+\b',
         r'\binspected\s+(?:all\s+)?\d+\s+(?:items?|users?|employees?|tickets?|controls?|instances?|requests?|reviews?|reports?)\b',
         r'\btested\s+\d+\s+(?:items?|users?|employees?|tickets?|controls?|instances?)\b',
         r'\b(?:reviewed|examined|analyzed)\s+\d+\s+(?:out\s+of\s+)?\d*\s*(?:items?|samples?)\b',
-    ]
+    ]))
 
     # Percentage/threshold patterns
-    PERCENTAGE_PATTERNS = [
+    PERCENTAGE_PATTERNS: ClassVar[Tuple[re.Pattern, ...]] = _linear(_compile_all([
         r'\b\d+(?:\.\d+)?%\b',
         r'\b\d+\s+percent\b',
         r'\b(?:greater|less|more|fewer)\s+than\s+\d+%?\b',
         r'\b(?:at|above|below|exceeds|falls\s+below)\s+\d+%?\b',
         r'\buptime\s+of\s+\d+(?:\.\d+)?%\b',
-    ]
+    ]))
 
     # Count patterns
-    COUNT_PATTERNS = [
+    COUNT_PATTERNS: ClassVar[Tuple[re.Pattern, ...]] = _linear(_compile_all([
         r'\b\d+\s+(?:employees?|users?|offices?|countries|locations?|servers?|systems?|controls?|policies|procedures?)\b',
         r'\b\d+\+?\s+(?:employees?|users?|offices?)\b',
         r'\b(?:over|more\s+than|approximately)\s+\d+(?:,\d+)?\s+(?:employees?|users?|offices?|countries)\b',
-    ]
+    ]))
 
     # Technical specification patterns
-    ENCRYPTION_PATTERNS = [
+    ENCRYPTION_PATTERNS: ClassVar[Tuple[re.Pattern, ...]] = _linear(_compile_all([
         r'\b(?:TLS|SSL)\s+(?:v?(?:1\.0|1\.1|1\.2|1\.3))?\b',
         r'\b(?:AES|RSA|SHA|MD5)-?\d+\b',
         r'\b\d+-bit\s+(?:encryption|key|algorithm)\b',
         r'\b(?:AES|RSA|SHA|DES|3DES|Blowfish|bcrypt)\b',
-    ]
+    ]))
 
-    AUTHENTICATION_PATTERNS = [
+    AUTHENTICATION_PATTERNS: ClassVar[Tuple[re.Pattern, ...]] = _linear(_compile_all([
         r'\b(?:two|2|multi)[-\s]?factor\s+authentication\b',
         r'\b(?:MFA|2FA|SSO|SAML|OAuth|LDAP|AD|Kerberos)\b',
         r'\bpassword\s+(?:complexity|length|history|age)\b',
         r'\b(?:minimum|maximum)\s+password\s+(?:length|age)\s+of\s+\d+\b',
-    ]
+    ]))
 
-    NETWORK_PATTERNS = [
+    NETWORK_PATTERNS: ClassVar[Tuple[re.Pattern, ...]] = _linear(_compile_all([
         r'\b(?:firewall|IDS|IPS|DMZ|VPN|VLAN)\b',
         r'\b(?:port|ports)\s+\d+(?:\s+and\s+\d+)?\b',
         r'\b(?:stateful|stateless)\s+(?:packet\s+)?inspection\b',
         r'\b(?:inbound|outbound)\s+(?:traffic|connections?|rules?)\b',
-    ]
+    ]))
 
     # Role/WHO patterns
-    ROLE_PATTERNS = [
+    ROLE_PATTERNS: ClassVar[Tuple[re.Pattern, ...]] = _linear(_compile_all([
         r'\b(?:Chief|Senior|VP\s+of|Vice\s+President\s+of|Director\s+of|Manager\s+of|Head\s+of)\s+[A-Z][a-zA-Z\s]+\b',
         r'\b(?:Security|IT|Privacy|Compliance|Risk|Audit|Operations?|Engineering)\s+(?:Team|Officer|Administrator|Manager|Personnel|Staff|Department)\b',
         r'\b(?:CISO|CIO|CTO|CPO|DPO|CSO)\b',
         r'\b(?:authorized|designated|responsible)\s+personnel\b',
-    ]
+    ]))
+
+    # Encryption, authentication and network specs all become "System uses X"
+    # facts, so control rows collect them together
+    TECHNICAL_SPEC_PATTERNS: ClassVar[Tuple[re.Pattern, ...]] = (
+        ENCRYPTION_PATTERNS + AUTHENTICATION_PATTERNS + NETWORK_PATTERNS
+    )
+
+    # Quantitative value type and patterns, in extract_all_quantitative order.
+    # Each pattern is scanned on its own: fusing them into one alternation
+    # would drop matches that overlap an earlier pattern's match
+    _QUANTITATIVE_CATEGORIES: ClassVar[Tuple[Tuple[str, Tuple[re.Pattern, ...]], ...]] = (
+        ("frequency", FREQUENCY_PATTERNS),
+        ("duration", DURATION_PATTERNS),
+        ("sample_size", SAMPLE_SIZE_PATTERNS),
+        ("percentage", PERCENTAGE_PATTERNS),
+        ("count", COUNT_PATTERNS),
+    )
+
+    # Which quantitative categories occur at all, found in one Hyperscan pass
+    # (None without hyperscan); group ids index _QUANTITATIVE_CATEGORIES
+    _QUANTITATIVE_PREFILTER: ClassVar[Any] = _build_prefilter([
+        FREQUENCY_PATTERNS,
+        DURATION_PATTERNS,
+        SAMPLE_SIZE_PATTERNS,
+        PERCENTAGE_PATTERNS,
+        COUNT_PATTERNS,
+    ])
+
+    @classmethod
+    def _iter_quantitative(
+        cls, value_type: str, patterns: Tuple[re.Pattern, ...], text: str
+    ) -> Iterator[QuantitativeValue]:
+        """Yield a QuantitativeValue for each match of each category pattern."""
+        normalize = cls._normalize_frequency if value_type == "frequency" else None
+        for pattern in patterns:
+            for match in _finditer(pattern, text):
+                value = match.group(0)
+                yield QuantitativeValue(
+                    value=value,
+                    type=value_type,
+                    normalized=normalize(value) if normalize else None
+                )
 
     @classmethod
     def extract_frequencies(cls, text: str) -> List[QuantitativeValue]:
         """Extract all frequency mentions from text."""
-        frequencies = []
-        for pattern in cls.FREQUENCY_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                frequencies.append(QuantitativeValue(
-                    value=match.group(0),
-                    type="frequency",
-                    normalized=cls._normalize_frequency(match.group(0))
-                ))
-        return frequencies
+        return list(cls._iter_quantitative("frequency", cls.FREQUENCY_PATTERNS, text))
 
     @classmethod
     def extract_durations(cls, text: str) -> List[QuantitativeValue]:
         """Extract all duration mentions from text."""
-        durations = []
-        for pattern in cls.DURATION_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                durations.append(QuantitativeValue(
-                    value=match.group(0),
-                    type="duration"
-                ))
-        return durations
+        return list(cls._iter_quantitative("duration", cls.DURATION_PATTERNS, text))
 
     @classmethod
     def extract_sample_sizes(cls, text: str) -> List[QuantitativeValue]:
         """Extract all sample size mentions from text."""
-        samples = []
-        for pattern in cls.SAMPLE_SIZE_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                samples.append(QuantitativeValue(
-                    value=match.group(0),
-                    type="sample_size"
-                ))
-        return samples
+        return list(cls._iter_quantitative("sample_size", cls.SAMPLE_SIZE_PATTERNS, text))
 
     @classmethod
     def extract_percentages(cls, text: str) -> List[QuantitativeValue]:
         """Extract all percentage/threshold mentions from text."""
-        percentages = []
-        for pattern in cls.PERCENTAGE_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                percentages.append(QuantitativeValue(
-                    value=match.group(0),
-                    type="percentage"
-                ))
-        return percentages
+        return list(cls._iter_quantitative("percentage", cls.PERCENTAGE_PATTERNS, text))
 
     @classmethod
     def extract_counts(cls, text: str) -> List[QuantitativeValue]:
         """Extract all count mentions from text."""
-        counts = []
-        for pattern in cls.COUNT_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                counts.append(QuantitativeValue(
-                    value=match.group(0),
-                    type="count"
-                ))
-        return counts
+        return list(cls._iter_quantitative("count", cls.COUNT_PATTERNS, text))
+
+    @classmethod
+    def iter_all_quantitative(cls, text: str) -> Iterator[QuantitativeValue]:
+        """
+        Yield all quantitative values in text, one category at a time.
+
+        Each category is only scanned once the previous one is exhausted, so a
+        consumer that stops early skips the remaining categories.
+        """
+        present = _matching_groups(cls._QUANTITATIVE_PREFILTER, text)
+
+        # Skip categories the prefilter found no match for
+        for group_id, (value_type, patterns) in enumerate(cls._QUANTITATIVE_CATEGORIES):
+            if present is None or group_id in present:
+                yield from cls._iter_quantitative(value_type, patterns, text)
 
     @classmethod
     def extract_all_quantitative(cls, text: str) -> List[QuantitativeValue]:
         """Extract all quantitative values from text."""
-        return (
-            cls.extract_frequencies(text) +
-            cls.extract_durations(text) +
-            cls.extract_sample_sizes(text) +
-            cls.extract_percentages(text) +
-            cls.extract_counts(text)
-        )
+        return list(cls.iter_all_quantitative(text))
 
     @classmethod
     def extract_encryption_specs(cls, text: str) -> List[str]:
         """Extract encryption specifications."""
-        specs = []
-        for pattern in cls.ENCRYPTION_PATTERNS:
-            specs.extend(re.findall(pattern, text, re.IGNORECASE))
-        return list(set(specs))
+        return _unique_matches(cls.ENCRYPTION_PATTERNS, text)
 
     @classmethod
     def extract_authentication_specs(cls, text: str) -> List[str]:
         """Extract authentication specifications."""
-        specs = []
-        for pattern in cls.AUTHENTICATION_PATTERNS:
-            specs.extend(re.findall(pattern, text, re.IGNORECASE))
-        return list(set(specs))
+        return _unique_matches(cls.AUTHENTICATION_PATTERNS, text)
 
     @classmethod
     def extract_network_specs(cls, text: str) -> List[str]:
         """Extract network specifications."""
-        specs = []
-        for pattern in cls.NETWORK_PATTERNS:
-            specs.extend(re.findall(pattern, text, re.IGNORECASE))
-        return list(set(specs))
+        return _unique_matches(cls.NETWORK_PATTERNS, text)
+
+    @classmethod
+    def extract_technical_specs(cls, text: str) -> List[str]:
+        """Extract encryption, authentication and network specifications together."""
+        return _unique_matches(cls.TECHNICAL_SPEC_PATTERNS, text)
 
     @classmethod
     def extract_roles(cls, text: str) -> List[str]:
         """Extract role/WHO mentions."""
-        roles = []
-        for pattern in cls.ROLE_PATTERNS:
-            roles.extend(re.findall(pattern, text, re.IGNORECASE))
-        return list(set(roles))
+        return _unique_matches(cls.ROLE_PATTERNS, text)
 
-    @classmethod
-    def _normalize_frequency(cls, freq_text: str) -> str:
-        """Normalize frequency to standard form."""
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _normalize_frequency(freq_text: str) -> str:
+        """
+        Normalize frequency to standard form.
+
+        Cached because the same few phrases ("quarterly", "annually", ...)
+        recur throughout a report.
+        """
         freq_lower = freq_text.lower()
-        if "daily" in freq_lower or "every day" in freq_lower:
-            return "daily"
-        elif "weekly" in freq_lower or "every week" in freq_lower:
-            return "weekly"
-        elif "monthly" in freq_lower or "every month" in freq_lower:
-            return "monthly"
-        elif "quarterly" in freq_lower or "every quarter" in freq_lower:
-            return "quarterly"
-        elif "annually" in freq_lower or "yearly" in freq_lower or "every year" in freq_lower:
-            return "annually"
-        elif "real-time" in freq_lower or "continuous" in freq_lower:
-            return "continuous"
-        else:
-            return freq_text
+        for term, normalized in FREQUENCY_NORMALIZATION:
+            if term in freq_lower:
+                return normalized
+        return freq_text
 
 
 class ControlTableParser:
@@ -244,8 +459,8 @@ class ControlTableParser:
     """
 
     # Patterns for identifying table sections
-    CONTROL_START_PATTERN = r'^[A-Z]{2,3}\d+\.\d+\s+'  # e.g., "CC6.1 ", "PI1.2 "
-    TEST_INTRO_PATTERNS = [
+    CONTROL_START_PATTERN: ClassVar[re.Pattern] = re.compile(r'^[A-Z]{2,3}\d+\.\d+\s+')  # e.g., "CC6.1 ", "PI1.2 "
+    TEST_INTRO_PATTERNS: ClassVar[Tuple[re.Pattern, ...]] = _compile_all([
         r'Inspected\s+',
         r'Observed\s+',
         r'Performed\s+',
@@ -254,8 +469,11 @@ class ControlTableParser:
         r'Examined\s+',
         r'Validated\s+',
         r'Tested\s+',
-    ]
-    RESULT_PATTERN = r'\bNo\s+Exceptions?\s+Noted\b'
+    ])
+    RESULT_PATTERN: ClassVar[re.Pattern] = re.compile(r'\bNo\s+Exceptions?\s+Noted\b', re.IGNORECASE)
+
+    # Any test intro, in one search instead of one per pattern
+    _TEST_INTRO_RE: ClassVar[re.Pattern] = _compile_any(TEST_INTRO_PATTERNS)
 
     @classmethod
     def parse_control_rows(cls, text: str, start_line: int = 0) -> List[ControlTableRow]:
@@ -270,49 +488,44 @@ class ControlTableParser:
             List of parsed ControlTableRow objects
         """
         rows = []
-        lines = text.split('\n')
+        lines = [line.strip() for line in text.split('\n')]
+        num_lines = len(lines)
+
+        # Classify every line once; the loops below revisit lines repeatedly
+        test_intro_search = cls._TEST_INTRO_RE.search
+        result_search = cls.RESULT_PATTERN.search
+        is_test_intro_line = [test_intro_search(line) is not None for line in lines]
+        is_result_line = [result_search(line) is not None for line in lines]
 
         i = 0
-        while i < len(lines):
-            line = lines[i].strip()
+        while i < num_lines:
+            line = lines[i]
 
             # Check if this is a control description
-            control_id_match = re.match(cls.CONTROL_START_PATTERN, line)
+            control_id_match = cls.CONTROL_START_PATTERN.match(line)
             if control_id_match:
                 control_id = control_id_match.group(0).strip()
 
-                # Accumulate control description until we hit test performed
-                control_lines = []
+                # Control description runs until we hit test performed
                 j = i
-                while j < len(lines):
-                    current_line = lines[j].strip()
-
+                while j < num_lines:
                     # Check if we hit a test intro pattern
-                    is_test = any(re.search(pattern, current_line, re.IGNORECASE)
-                                for pattern in cls.TEST_INTRO_PATTERNS)
-                    if is_test and j > i:
+                    if is_test_intro_line[j] and j > i:
                         break
-
-                    control_lines.append(current_line)
                     j += 1
 
-                control_desc = ' '.join(control_lines)
-
-                # Now accumulate test performed until we hit results
-                test_lines = []
-                while j < len(lines):
-                    current_line = lines[j].strip()
-
-                    # Check if we hit the results pattern
-                    if re.search(cls.RESULT_PATTERN, current_line, re.IGNORECASE):
-                        test_lines.append(current_line)
-                        j += 1
-                        break
+                # Joined as one slice; blank lines stay in so evidence text
+                # matches the source spacing
+                control_desc = ' '.join(lines[i:j])
 
-                    test_lines.append(current_line)
+                # Test performed runs through the results line
+                test_start = j
+                while j < num_lines:
                     j += 1
+                    if is_result_line[j - 1]:
+                        break
 
-                test_performed = ' '.join(test_lines)
+                test_performed = ' '.join(lines[test_start:j])
 
                 # Extract results (usually just "No Exceptions Noted")
                 test_results = "No Exceptions Noted" if "No Exception" in test_performed else "Unknown"
@@ -331,35 +544,29 @@ class ControlTableParser:
             else:
                 # Try to identify control rows by test pattern markers
                 # This catches controls without explicit control IDs
-                is_test_intro = any(re.search(pattern, line, re.IGNORECASE)
-                                   for pattern in cls.TEST_INTRO_PATTERNS)
-
-                if is_test_intro:
-                    # Backtrack to find control description
+                if is_test_intro_line[i]:
+                    # Backtrack to find control description (collected
+                    # last line first, then reversed once)
                     control_lines = []
                     k = i - 1
-                    while k >= 0 and not re.search(cls.RESULT_PATTERN, lines[k], re.IGNORECASE):
-                        if lines[k].strip():
-                            control_lines.insert(0, lines[k].strip())
+                    while k >= 0 and not is_result_line[k]:
+                        if lines[k]:
+                            control_lines.append(lines[k])
                         k -= 1
                         if len(control_lines) > 5:  # Reasonable limit
                             break
+                    control_lines.reverse()
 
                     control_desc = ' '.join(control_lines) if control_lines else ""
 
-                    # Accumulate test and results
-                    test_lines = []
+                    # Test and results run through the results line
                     j = i
-                    while j < len(lines):
-                        current_line = lines[j].strip()
-                        test_lines.append(current_line)
-
-                        if re.search(cls.RESULT_PATTERN, current_line, re.IGNORECASE):
-                            j += 1
-                            break
+                    while j < num_lines:
                         j += 1
+                        if is_result_line[j - 1]:
+                            break
 
-                    test_performed = ' '.join(test_lines)
+                    test_performed = ' '.join(lines[i:j])
                     test_results = "No Exceptions Noted" if "No Exception" in test_performed else "Unknown"
 
                     if control_desc:
@@ -399,30 +606,31 @@ class ControlTableParser:
         Returns:
             List of fact dictionaries
         """
-        facts = []
-
         # Extract from control description
         control_text = row.control_description
 
+        # Fields shared by every fact from this row, built once per row
+        location = f"Lines {row.start_line}-{row.end_line}"
+        control_ref = {"source_location": location, "evidence_quote": control_text}
+
         # Fact 1: Main control statement (existence)
-        facts.append({
+        facts: List[Dict] = [{
             "claim": control_text,
             "fact_type": "technical_control",
-            "source_location": f"Lines {row.start_line}-{row.end_line}",
-            "evidence_quote": control_text,
-        })
-
-        # Fact 2-N: Extract quantitative values
-        quantitative_values = ExtractionPatterns.extract_all_quantitative(control_text)
-        for qv in quantitative_values:
-            if qv.type == "frequency":
-                facts.append({
-                    "claim": f"Control performed {qv.value}",
-                    "fact_type": "process",
-                    "quantitative_values": [qv.value],
-                    "source_location": f"Lines {row.start_line}-{row.end_line}",
-                    "evidence_quote": control_text,
-                })
+            **control_ref,
+        }]
+
+        # Fact 2-N: Frequencies (the only quantitative values turned into facts),
+        # consumed straight from the match generator without a list
+        for qv in ExtractionPatterns._iter_quantitative(
+            "frequency", ExtractionPatterns.FREQUENCY_PATTERNS, control_text
+        ):
+            facts.append({
+                "claim": f"Control performed {qv.value}",
+                "fact_type": "process",
+                "quantitative_values": [qv.value],
+                **control_ref,
+            })
 
         # Fact N+1: Roles mentioned
         roles = ExtractionPatterns.extract_roles(control_text)
@@ -431,35 +639,28 @@ class ControlTableParser:
                 "claim": f"{role} is responsible for control execution",
                 "fact_type": "organizational",
                 "process_details": {"who": role},
-                "source_location": f"Lines {row.start_line}-{row.end_line}",
-                "evidence_quote": control_text,
+                **control_ref,
             })
 
         # Fact N+2: Technical specifications
-        encryption_specs = ExtractionPatterns.extract_encryption_specs(control_text)
-        auth_specs = ExtractionPatterns.extract_authentication_specs(control_text)
-        network_specs = ExtractionPatterns.extract_network_specs(control_text)
-
-        all_specs = encryption_specs + auth_specs + network_specs
-        for spec in all_specs:
+        for spec in ExtractionPatterns.extract_technical_specs(control_text):
             facts.append({
                 "claim": f"System uses {spec}",
                 "fact_type": "technical_control",
                 "entities": [spec],
-                "source_location": f"Lines {row.start_line}-{row.end_line}",
-                "evidence_quote": control_text,
+                **control_ref,
             })
 
         # Extract from test performed
         test_text = row.test_performed
-        sample_sizes = ExtractionPatterns.extract_sample_sizes(test_text)
-
-        for sample in sample_sizes:
+        for sample in ExtractionPatterns._iter_quantitative(
+            "sample_size", ExtractionPatterns.SAMPLE_SIZE_PATTERNS, test_text
+        ):
             facts.append({
                 "claim": f"Auditor tested {sample.value}",
                 "fact_type": "test_result",
                 "quantitative_values": [sample.value],
-                "source_location": f"Lines {row.start_line}-{row.end_line}",
+                "source_location": location,
                 "evidence_quote": test_text,
             })
 
@@ -484,35 +685,36 @@ def calculate_specificity_score(fact_dict: Dict) -> float:
     Returns:
         Specificity score from 0.0 to 1.0
     """
+    get = fact_dict.get
+    process_details = get("process_details")
+    if not isinstance(process_details, dict):
+        process_details = {}
+    who = process_details.get("who")
+
     score = 0.3  # Base score
 
     # Check for quantitative values
-    if fact_dict.get("quantitative_values") and len(fact_dict["quantitative_values"]) > 0:
+    if get("quantitative_values"):
         score += 0.2
 
     # Check for named entities
-    if fact_dict.get("entities") and len(fact_dict["entities"]) > 0:
+    if get("entities"):
         score += 0.2
 
     # Check for specific roles
-    process_details = fact_dict.get("process_details") or {}
-    who = process_details.get("who", "") if isinstance(process_details, dict) else ""
-    if who and who.lower() not in ["management", "personnel", "staff", "it personnel"]:
+    if who and who.lower() not in GENERIC_ROLES:
         score += 0.2
 
     # Check for process details
-    if isinstance(process_details, dict):
-        if process_details.get("who"):
-            score += 0.1
-        if process_details.get("when"):
-            score += 0.1
-        if process_details.get("how"):
-            score += 0.1
+    if who:
+        score += 0.1
+    if process_details.get("when"):
+        score += 0.1
+    if process_details.get("how"):
+        score += 0.1
 
     # Penalize vague terms
-    claim = fact_dict.get("claim", "").lower()
-    vague_terms = ["periodically", "regularly", "as needed", "as appropriate", "certain", "various"]
-    if any(term in claim for term in vague_terms):
+    if _VAGUE_TERMS_RE.search(get("claim", "").lower()):
         score -= 0.2
 
     # Clamp to [0.0, 1.0]
@@ -5,10 +5,13 @@ LLM-based fact extraction with chunking and summarization.
 import json
 import logging
 import os
+import re
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from frfr import _json
+from frfr.cache import SummaryCache
 from frfr.extraction.schemas import ExtractedFact, FactExtractionResult
 from frfr.extraction.claude_client import ClaudeClient
 from frfr.extraction.extraction_patterns import (
@@ -31,6 +34,270 @@ from frfr.validation.fact_validator import FactValidator
 
 logger = logging.getLogger(__name__)
 
+# Characters of document text sent verbatim to the summarization prompt; the
+# rest of a longer document is summarized section by section first
+SUMMARY_WINDOW = 30000
+
+SECTION_SUMMARY_PROMPT = """You are summarizing one section of a document so that a later step can analyze the structure of the whole document.
+
+Document: {document_name}
+Section {number} of {total} (after the opening section)
+
+In under 200 words, describe:
+- Section headings or control categories in this section
+- The kinds of factual claims it contains (controls, test procedures, findings, requirements, specifications)
+- Any table layout and its columns
+- Key systems, technologies, roles, frequencies and other quantitative details
+
+Section text:
+{section}
+
+RESPOND WITH THE SUMMARY ONLY:"""
+
+# Body of the first ```json fence, or failing that the first plain ``` fence
+_JSON_FENCE_RE = re.compile(r"```json(.*?)```", re.DOTALL)
+_FENCE_RE = re.compile(r"```(.*?)```", re.DOTALL)
+
+
+def _parse_json_response(content: str) -> Any:
+    """
+    Parse JSON from a Claude response, unwrapping a markdown code fence.
+
+    Args:
+        content: Response text
+
+    Returns:
+        Decoded JSON
+
+    Raises:
+        json.JSONDecodeError: If neither the response nor a fenced block in it
+            is valid JSON
+    """
+    try:
+        return _json.loads(content)
+    except json.JSONDecodeError:
+        match = _JSON_FENCE_RE.search(content) or _FENCE_RE.search(content)
+        if not match:
+            raise
+        return _json.loads(match.group(1).strip())
+
+
+# Capitalized word runs in a quantitative value's context (products/tools)
+_ENTITY_RE = re.compile(r'\b([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)*)\b')
+
+
+def _context_around(text: str, text_lower: str, value: str, window: int = 200) -> Optional[str]:
+    """
+    Text around the first case-insensitive occurrence of a value.
+
+    Args:
+        text: Text to search
+        text_lower: text.lower(), computed once by the caller
+        value: Literal value to find
+        window: Characters of context to keep on each side
+
+    Returns:
+        Context with whitespace collapsed, or None if the value does not occur
+    """
+    if len(text_lower) == len(text):
+        # Offsets in text_lower line up with text
+        value_lower = value.lower()
+        start = text_lower.find(value_lower)
+        if start < 0:
+            return None
+        end = start + len(value_lower)
+    else:
+        # lower() changed the length (e.g. "İ"), so search the original text
+        match = re.search(re.escape(value), text, re.IGNORECASE)
+        if not match:
+            return None
+        start, end = match.span()
+    return " ".join(text[max(0, start - window):end + window].split()) or None
+
+
+# Instructions shared by every chunk extraction call. They go out unchanged as
+# the system prompt, so the API serves them from its prompt cache; anything
+# that varies by document or chunk belongs in the user message instead.
+CHUNK_EXTRACTION_SYSTEM_PROMPT = """You extract structured facts from document chunks. Each request gives a document summary with extraction guidance, then one chunk to extract facts from.
+""" + build_v4_enhanced_prompt_additions() + """
+
+CRITICAL EXTRACTION INSTRUCTIONS:
+
+**EXTRACTION PHILOSOPHY**: This system aims to EXCEED human analysis capabilities. Extract facts with MAXIMUM DEPTH and SPECIFICITY. Every distinct technical detail, every specific configuration, every quantitative value, every process step is a separate fact.
+
+Extract MANY facts per chunk. Follow the document type, structural pattern and extraction guidance given with the document summary.
+
+**AGGRESSIVE EXTRACTION MODE** - Extract:
+
+1. **Specific implementations** - Leave NO technical detail behind
+   - Named entities: AWS, AWS RDS, AWS EC2, Splunk Enterprise 9.0, Okta SSO, TLS 1.2, TLS 1.3, AES-256-GCM, SHA-256, RSA-4096, NIST SP 800-53 Rev 5, ISO 27001:2013, OWASP Top 10, HIPAA, SOX, etc.
+   - Extract EVERY technology mentioned, with versions when available
+   - Extract EVERY protocol, algorithm, encryption method, key size
+   - Extract EVERY third-party tool, vendor name, service provider
+
+2. **Concrete processes** - Extract EVERY process detail
+   - WHO: Extract every role, title, team, department, person mentioned (IT manager, Security team, CISO, VP of Engineering, authorized personnel, third-party auditor)
+   - WHEN: Extract every frequency, schedule, timeframe (daily, weekly, monthly, quarterly, annually, semi-annually, real-time, within 24 hours, every 90 days)
+   - HOW: Extract every procedure, methodology, workflow step (automated script, manual review, ticketing system, approval workflow, penetration testing, vulnerability scanning)
+
+3. **Technical details** - Extract EVERY quantitative value
+   - Numbers with units: 90 days, 365 days, 256-bit, 4096-bit, 8 characters, 16 characters, 8GB RAM, 100GB storage
+   - Percentages: 99.9%, 99.95%, 5% error rate, 80% CPU threshold
+   - Frequencies: daily at 2 AM, weekly on Sundays, monthly on first Monday
+   - Thresholds: temperature >80°F, <3 failed login attempts, CPU >80%, disk >90%
+   - Capacity metrics: RTO of 4 hours, RPO of 15 minutes, 99.95% uptime SLA
+   - Temperature ranges, humidity levels, power specifications
+
+4. **Organizational facts** - Extract EVERY organizational detail
+   - Team sizes: 8-person IT team, 3 security engineers, 50+ developers
+   - Locations: Alpharetta GA, data center in Virginia, office in London
+   - Reporting structures: reports to CISO, overseen by Board, managed by VP
+   - Responsibilities: responsible for patch management, accountable for backups
+
+5. **Compliance statements** - Extract EVERY compliance detail
+   - Standards: meets NIST SP 800-53, follows ISO 27001:2013, complies with GDPR Article 32
+   - Certifications: SOC 2 Type 2 certified, PCI DSS Level 1, HIPAA compliant
+   - Requirements: required by policy, mandated by regulation, enforced by contract
+
+6. **Test results** - Extract EVERY test detail
+   - What was tested: user authentication, firewall rules, backup restoration, disaster recovery plan
+   - How it was tested: inspection, observation, inquiry, re-performance, automated testing, manual review
+   - Sample sizes: 25 of 100 users, all 50 servers, representative sample of 10%
+   - Results: no exceptions noted, 3 deviations found, all tests passed, remediation required
+
+**DEPTH INSTRUCTIONS**:
+- If a paragraph describes a control, extract 5-10 distinct facts from it
+- If a sentence contains multiple technical details, create a separate fact for each
+- If a list has 5 items, create 5 separate facts (one per item)
+- Extract facts about the same control at different specificity levels:
+  - High-level: "Uses firewalls for network security"
+  - Mid-level: "Firewall rules restrict inbound traffic"
+  - Detailed: "Firewall configured to allow only ports 80 and 443 for inbound HTTPS traffic with stateful packet inspection"
+
+ENHANCED METADATA EXTRACTION:
+
+For EACH fact, you must also provide:
+- **fact_type**: One of: technical_control, organizational, process, metric, CUEC, test_result, architecture, compliance
+- **control_family**: One of: access_control, encryption, monitoring, backup_recovery, change_management, incident_response, physical_security, network_security
+- **specificity_score**: 0.0-1.0 (0.0=generic "uses firewalls", 1.0=specific "uses Palo Alto PA-5220 firewalls with IDS/IPS enabled")
+- **entities**: List of named entities (tools, technologies, protocols, standards) mentioned in this fact
+- **quantitative_values**: List of quantitative values (numbers, percentages, timeframes, ranges)
+- **process_details**: If this is a process fact, extract: {"who": "role", "when": "frequency", "how": "procedure"}
+- **section_context**: The section given in CHUNK INFO
+- **related_control_ids**: List of control IDs mentioned (e.g., CC6.1, A.1.2)
+
+SPECIFICITY EXAMPLES:
+❌ Low specificity (0.3): "LNRS engineers use several monitoring tools"
+✅ High specificity (0.9): "LNRS uses Splunk Enterprise for log aggregation and Datadog for infrastructure monitoring with alerts sent when CPU exceeds 80%"
+
+❌ Low specificity (0.2): "Temperature and humidity levels are monitored"
+✅ High specificity (0.9): "Data center temperature maintained at 68°F with alerts triggered at ±5°F variance"
+
+GENERAL RULES:
+- Each distinct claim is a separate fact
+- DO NOT skip facts because they seem similar - extract all distinct claims
+- Prioritize specific, detailed facts over generic statements
+- When in doubt, extract it - more facts is better than fewer
+
+**V5: EVIDENCE REQUIREMENTS** (CRITICAL):
+
+Each fact must have supporting evidence. You have TWO options:
+
+**Option 1: Single Evidence (most common)**
+Use when all evidence is in one place:
+```
+"evidence_quote": "Exact WORD-FOR-WORD text from chunk"
+```
+
+**Option 2: Multiple Evidence (V5 - use when appropriate)**
+Use when a fact combines information from different locations:
+```
+"evidence_quotes": [
+  {
+    "quote": "First supporting quote (EXACT text)",
+    "source_location": "Lines X-Y",
+    "relevance": "What this quote supports (optional)"
+  },
+  {
+    "quote": "Second supporting quote (EXACT text)",
+    "source_location": "Lines Z-W",
+    "relevance": "What this quote supports (optional)"
+  }
+]
+```
+
+**When to use multiple quotes:**
+- Fact mentions frequency from one location AND implementation details from another
+- Combining policy statement with implementation evidence
+- Multiple test results supporting the same conclusion
+- Technology mentioned in one place, configuration in another
+
+**Quote rules (apply to both formats):**
+- Copy text WORD-FOR-WORD from the chunk
+- DO NOT paraphrase, summarize, or rephrase
+- DO NOT change wording, even slightly
+- If exact text is unclear, extract a longer quote to be safe
+
+WHAT TO EXTRACT (be extremely thorough):
+✓ Specific technology implementations with versions ("uses AWS RDS PostgreSQL 13.7", "configured with Duo MFA", "utilizes Okta SSO")
+✓ Security controls with specifics ("firewall rules restrict inbound traffic to ports 80/443", "AES-256-GCM encryption at rest", "logs retained for 365 days")
+✓ Procedures with details ("reviewed quarterly by IT management", "approved by CISO", "penetration tests conducted annually by Acme Security")
+✓ Organizational structures ("managed by 8-person IT team", "overseen by VP of Security", "performed by AWS as subservice organization")
+✓ Technical configurations ("TLS 1.3 with perfect forward secrecy", "bcrypt password hashing with cost factor 12", "daily incremental backups at 2 AM UTC")
+✓ Compliance assertions ("meets NIST SP 800-53 Rev 5", "follows ISO 27001:2013", "complies with GDPR Article 32")
+✓ Quantitative metrics ("RTO of 4 hours", "RPO of 15 minutes", "99.95% uptime SLA", "maximum 3 failed login attempts")
+
+WHAT TO SKIP:
+✗ Document metadata ("This is a SOC2 report", "Examination period was...")
+✗ Legal boilerplate ("Confidential information", "Trade secrets", "Not for distribution")
+✗ Table of contents items
+✗ Page numbers or section headers alone
+
+RESPOND WITH VALID JSON ARRAY:
+[
+  {
+    "claim": "Clear, specific assertion (be granular - separate claims into individual facts)",
+    "source_doc": "Document name from CHUNK INFO",
+    "source_location": "Lines X-Y (overall range)",
+    "evidence_quote": "Exact text from chunk (use for single evidence)",
+    "confidence": 0.95,
+    "fact_type": "technical_control",
+    "control_family": "encryption",
+    "specificity_score": 0.9,
+    "entities": ["AWS", "AES-256"],
+    "quantitative_values": ["256-bit"],
+    "process_details": {"who": "IT team", "when": "daily", "how": "automated script"},
+    "section_context": "Section from CHUNK INFO",
+    "related_control_ids": ["CC6.1"]
+  },
+  {
+    "claim": "V5 example with multiple evidence quotes",
+    "source_doc": "Document name from CHUNK INFO",
+    "source_location": "Lines X-Z (overall range)",
+    "evidence_quotes": [
+      {
+        "quote": "First exact quote from chunk",
+        "source_location": "Lines X-Y",
+        "relevance": "Frequency"
+      },
+      {
+        "quote": "Second exact quote from chunk",
+        "source_location": "Lines Z-W",
+        "relevance": "Who performs"
+      }
+    ],
+    "confidence": 0.95,
+    "fact_type": "process",
+    "control_family": "monitoring",
+    "specificity_score": 0.9,
+    "entities": ["Acme Security"],
+    "quantitative_values": ["quarterly"],
+    "process_details": {"who": "Acme Security", "when": "quarterly", "how": "third-party assessment"},
+    "section_context": "Section from CHUNK INFO",
+    "related_control_ids": []
+  }
+]"""
+
 
 class FactExtractor:
     """Extracts facts from documents using LLM with chunking strategy."""
@@ -41,6 +308,7 @@ class FactExtractor:
         chunk_size: int = 1000,
         overlap_size: int = 200,
         max_workers: int = 5,
+        summary_cache: Optional[SummaryCache] = None,
     ):
         """
         Initialize fact extractor.
@@ -50,11 +318,14 @@ class FactExtractor:
             chunk_size: Number of lines per chunk
             overlap_size: Number of lines to overlap between chunks
             max_workers: Maximum number of parallel Claude processes
+            summary_cache: Optional cache of document summaries, so
+                re-processing a document skips the summarization call
         """
         self.client = ClaudeClient(claude_command=claude_command)
         self.chunk_size = chunk_size
         self.overlap_size = overlap_size
         self.max_workers = max_workers
+        self.summary_cache = summary_cache
 
     def summarize_document(self, text: str, document_name: str) -> dict:
         """
@@ -128,40 +399,92 @@ Analyze this document deeply and provide a comprehensive summary:
 Provide your response as valid JSON with these keys:
 document_type, structural_pattern, section_types (array of objects), table_structure (object or null), section_headings (array), fact_density_pattern, primary_topics (array), key_entities (array), scope (string), extraction_guidance (string).
 
-Document text (first 30000 characters):
-{text[:30000]}
-
-RESPOND ONLY WITH VALID JSON:"""
+Document text (first {SUMMARY_WINDOW} characters):
+{text[:SUMMARY_WINDOW]}"""
+        prompt_end = "\n\nRESPOND ONLY WITH VALID JSON:"
+        rest = text[SUMMARY_WINDOW:]
+
+        summary_cache = self.summary_cache
+        cache_key = ""
+        if summary_cache is not None:
+            # Covers the whole document, so text past the window counts too
+            cache_key = summary_cache.make_key(prompt + prompt_end + rest)
+            cached = summary_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Using cached summary: {cached.get('document_type', 'unknown type')}")
+                return cached
 
         try:
+            if rest:
+                # Map: summarize the text past the window in parallel sections;
+                # reduce: the main prompt sees those alongside the first window
+                section_summaries = self._summarize_sections(rest, document_name)
+                if section_summaries:
+                    prompt += (
+                        "\n\nSummaries of the rest of the document, in order:\n\n"
+                        + "\n\n".join(section_summaries)
+                    )
+            prompt += prompt_end
+
             # Use Claude CLI with longer response for detailed analysis
             content = self.client.prompt(prompt, max_tokens=3000)
 
-            # Try to parse JSON
-            try:
-                summary = json.loads(content)
-            except json.JSONDecodeError:
-                # Try to extract JSON from markdown code blocks
-                if "```json" in content:
-                    json_start = content.find("```json") + 7
-                    json_end = content.find("```", json_start)
-                    content = content[json_start:json_end].strip()
-                    summary = json.loads(content)
-                elif "```" in content:
-                    json_start = content.find("```") + 3
-                    json_end = content.find("```", json_start)
-                    content = content[json_start:json_end].strip()
-                    summary = json.loads(content)
-                else:
-                    raise
+            summary = _parse_json_response(content)
 
             logger.info(f"Summary generated: {summary.get('document_type', 'unknown type')}")
+            if summary_cache is not None:
+                summary_cache.set(cache_key, summary)
             return summary
 
         except Exception as e:
             logger.error(f"Failed to generate summary: {e}")
             raise
 
+    def _summarize_sections(self, text: str, document_name: str) -> List[str]:
+        """
+        Summarize text in SUMMARY_WINDOW-sized sections, in parallel.
+
+        Sections end at a line break where possible. A section whose call
+        fails is left out rather than failing the whole summary.
+
+        Args:
+            text: Text to summarize (the document past the first window)
+            document_name: Name of the document
+
+        Returns:
+            Section summaries, in document order
+        """
+        sections = []
+        start = 0
+        while start < len(text):
+            end = min(start + SUMMARY_WINDOW, len(text))
+            if end < len(text):
+                newline = text.rfind("\n", start, end)
+                if newline > start:
+                    end = newline + 1
+            sections.append(text[start:end])
+            start = end
+
+        logger.info(f"Summarizing {len(sections)} additional sections of {document_name}")
+        prompts = [
+            SECTION_SUMMARY_PROMPT.format(
+                document_name=document_name,
+                number=i,
+                total=len(sections),
+                section=section,
+            )
+            for i, section in enumerate(sections, 1)
+        ]
+        responses = self.client.prompt_many(prompts, max_workers=self.max_workers, max_tokens=400)
+
+        summaries = []
+        for i, response in enumerate(responses, 1):
+            if isinstance(response, Exception):
+                logger.warning(f"Failed to summarize section {i}: {response}")
+                continue
+            summaries.append(f"Section {i}/{len(sections)}:\n{response.strip()}")
+        return summaries
+
     def chunk_text(self, text: str) -> List[tuple[int, str, int, int]]:
         """
         Split text into overlapping chunks by lines.
@@ -172,15 +495,25 @@ RESPOND ONLY WITH VALID JSON:"""
         Returns:
             List of (chunk_id, chunk_text, start_line, end_line) tuples
         """
-        lines = text.split("\n")
+        # Offset of every line start plus a sentinel one past the end, so a
+        # range of lines is one slice of text instead of a split and re-join
+        line_starts = [0]
+        find = text.find
+        pos = find("\n")
+        while pos != -1:
+            line_starts.append(pos + 1)
+            pos = find("\n", pos + 1)
+        num_lines = len(line_starts)
+        line_starts.append(len(text) + 1)
+
         chunks = []
         chunk_id = 0
 
         start = 0
-        while start < len(lines):
-            end = min(start + self.chunk_size, len(lines))
-            chunk_lines = lines[start:end]
-            chunk_text = "\n".join(chunk_lines)
+        while start < num_lines:
+            end = min(start + self.chunk_size, num_lines)
+            # Slice up to (not including) the newline that ends the last line
+            chunk_text = text[line_starts[start]:line_starts[end] - 1]
 
             chunks.append((chunk_id, chunk_text, start + 1, end))  # 1-indexed line numbers
 
@@ -189,12 +522,46 @@ RESPOND ONLY WITH VALID JSON:"""
             start += self.chunk_size - self.overlap_size
 
             # If we're at the end, break
-            if end >= len(lines):
+            if end >= num_lines:
                 break
 
         logger.info(f"Split document into {len(chunks)} chunks")
         return chunks
 
+    def count_chunks(
+        self,
+        text_file: str | Path,
+        start_chunk: int = 0,
+        end_chunk: Optional[int] = None,
+    ) -> int:
+        """
+        Count the chunks extract_from_document() will process, without chunking.
+
+        Only newlines are counted, so callers can size progress bars before the
+        document is read and summarized.
+
+        Args:
+            text_file: Path to extracted text file
+            start_chunk: First chunk to process
+            end_chunk: Last chunk to process (inclusive, optional)
+
+        Returns:
+            Number of chunks in the requested range
+        """
+        num_lines = 1  # chunk_text() splits on "\n", so n newlines make n + 1 lines
+        with open(text_file, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                num_lines += block.count(b"\n")
+
+        step = self.chunk_size - self.overlap_size
+        if num_lines <= self.chunk_size:
+            total_chunks = 1
+        else:
+            total_chunks = 1 + -(-(num_lines - self.chunk_size) // step)
+
+        last_chunk = total_chunks - 1 if end_chunk is None else min(end_chunk, total_chunks - 1)
+        return max(0, last_chunk - max(0, start_chunk) + 1)
+
     def _process_single_chunk(
         self,
         chunk_info: tuple,
@@ -237,17 +604,21 @@ RESPOND ONLY WITH VALID JSON:"""
 
         # Validate each fact
         validated_facts = []
+        # Dumped once per fact; kept in step with recovered fields for saving
+        validated_dicts = []
         stats = {"extracted": len(facts), "validated": 0, "rejected": 0, "recovered": 0}
 
         for fact in facts:
+            fact_dict = fact.model_dump()
+
             # V4.4: Skip validation for auto-generated facts since we know context exists
             if getattr(fact, 'auto_generated', False):
                 validated_facts.append(fact)
+                validated_dicts.append(fact_dict)
                 stats["validated"] += 1
                 logger.debug(f"Skipped validation for auto-generated fact: {fact.claim[:60]}...")
                 continue
 
-            fact_dict = fact.model_dump()
             # V4.5: Pass chunk_text to validate against chunk instead of full document
             validation_result = validator.validate_fact(fact_dict, existing_fact_count + len(validated_facts), chunk_text=chunk_text)
 
@@ -256,10 +627,13 @@ RESPOND ONLY WITH VALID JSON:"""
                 if validation_result.was_recovered:
                     fact.evidence_quote = validation_result.corrected_quote
                     fact.source_location = validation_result.corrected_location
+                    fact_dict["evidence_quote"] = fact.evidence_quote
+                    fact_dict["source_location"] = fact.source_location
                     stats["recovered"] += 1
                     logger.info(f"Recovered fact from chunk {chunk_id}: {fact.claim[:60]}...")
 
                 validated_facts.append(fact)
+                validated_dicts.append(fact_dict)
                 stats["validated"] += 1
             else:
                 stats["rejected"] += 1
@@ -269,7 +643,6 @@ RESPOND ONLY WITH VALID JSON:"""
                 )
 
         # Save validated facts
-        validated_dicts = [fact.model_dump() for fact in validated_facts]
         session.save_chunk_facts(document_name, chunk_id, validated_dicts)
 
         logger.info(
@@ -441,31 +814,35 @@ RESPOND ONLY WITH VALID JSON:"""
         """
         enriched_facts = []
 
+        # Lowercase the pre-parsed specs and roles once, not once per fact
+        all_specs = (
+            pre_parsed["technical_specs"]["encryption"] +
+            pre_parsed["technical_specs"]["authentication"] +
+            pre_parsed["technical_specs"]["network"]
+        )
+        specs_lower = [(spec, spec.lower()) for spec in all_specs]
+        roles_lower = [(role, role.lower()) for role in pre_parsed["roles"]]
+
         for fact in facts:
-            # Recalculate specificity score based on actual content
-            fact_dict = fact.model_dump()
-            recalculated_score = calculate_specificity_score(fact_dict)
+            # Recalculate specificity score based on actual content. The score
+            # only reads a few top-level fields, so pass the model's own field
+            # dict rather than serializing the whole fact with model_dump()
+            recalculated_score = calculate_specificity_score(vars(fact))
 
             # Update if recalculated score differs significantly
             if fact.specificity_score is None or abs(fact.specificity_score - recalculated_score) > 0.1:
                 fact.specificity_score = recalculated_score
 
             # V4: Validate technical specs were extracted as entities
-            all_specs = (
-                pre_parsed["technical_specs"]["encryption"] +
-                pre_parsed["technical_specs"]["authentication"] +
-                pre_parsed["technical_specs"]["network"]
-            )
             claim_lower = fact.claim.lower()
-            specs_in_claim = [spec for spec in all_specs if spec.lower() in claim_lower]
+            specs_in_claim = [spec for spec, spec_lower in specs_lower if spec_lower in claim_lower]
 
             if specs_in_claim:
-                existing_entities = fact.entities or []
-                all_entities = list(set(existing_entities + specs_in_claim))
-                fact.entities = all_entities
+                # Ordered dedup keeps entities in a stable order across runs
+                fact.entities = list(dict.fromkeys((*(fact.entities or ()), *specs_in_claim)))
 
             # Validate roles were extracted in process_details
-            roles_in_claim = [role for role in pre_parsed["roles"] if role.lower() in claim_lower]
+            roles_in_claim = [role for role, role_lower in roles_lower if role_lower in claim_lower]
             if roles_in_claim:
                 process_details = fact.process_details or {}
                 if not process_details.get("who"):
@@ -582,12 +959,19 @@ RESPOND ONLY WITH VALID JSON:"""
         # Combine all fact text
         all_fact_text = " ".join([f.claim.lower() for f in facts])
 
+        # Values repeat across the pre-parsed lists (a frequency often appears
+        # many times in a chunk), so each distinct value is searched for once
+        found = {}
+
+        def covered(value: str) -> bool:
+            key = value.lower()
+            if key not in found:
+                found[key] = key in all_fact_text
+            return found[key]
+
         # Check quantitative coverage
         qv_total = len(pre_parsed["quantitative_values"])
-        qv_extracted = 0
-        for qv in pre_parsed["quantitative_values"]:
-            if qv.value.lower() in all_fact_text:
-                qv_extracted += 1
+        qv_extracted = sum(1 for qv in pre_parsed["quantitative_values"] if covered(qv.value))
 
         qv_coverage = qv_extracted / qv_total if qv_total > 0 else 1.0
 
@@ -598,19 +982,13 @@ RESPOND ONLY WITH VALID JSON:"""
             pre_parsed["technical_specs"]["network"]
         )
         specs_total = len(all_specs)
-        specs_extracted = 0
-        for spec in all_specs:
-            if spec.lower() in all_fact_text:
-                specs_extracted += 1
+        specs_extracted = sum(1 for spec in all_specs if covered(spec))
 
         specs_coverage = specs_extracted / specs_total if specs_total > 0 else 1.0
 
         # Check roles coverage
         roles_total = len(pre_parsed["roles"])
-        roles_extracted = 0
-        for role in pre_parsed["roles"]:
-            if role.lower() in all_fact_text:
-                roles_extracted += 1
+        roles_extracted = sum(1 for role in pre_parsed["roles"] if covered(role))
 
         roles_coverage = roles_extracted / roles_total if roles_total > 0 else 1.0
 
@@ -655,6 +1033,7 @@ RESPOND ONLY WITH VALID JSON:"""
             List of generated facts for missing quantitative values
         """
         all_fact_text = " ".join([f.claim.lower() for f in existing_facts])
+        chunk_lower = chunk_text.lower()
         missing_facts = []
 
         # V4.6: If target_count is specified, we'll do aggressive generation
@@ -680,20 +1059,8 @@ RESPOND ONLY WITH VALID JSON:"""
             if already_has_qv:
                 continue
 
-            # Try to find context around this value in chunk_text
-            qv_escaped = qv.value.replace("(", "\\(").replace(")", "\\)").replace("[", "\\[").replace("]", "\\]")
-            context_match = None
-            try:
-                import re
-                # Expand context window to 200 chars each side for better context
-                pattern = f".{{0,200}}{qv_escaped}.{{0,200}}"
-                match = re.search(pattern, chunk_text, re.IGNORECASE | re.DOTALL)
-                if match:
-                    context_match = match.group(0).strip()
-                    # Clean up newlines and extra whitespace
-                    context_match = " ".join(context_match.split())
-            except:
-                pass
+            # Find context around this value in chunk_text (200 chars each side)
+            context_match = _context_around(chunk_text, chunk_lower, qv.value)
 
             if not context_match:
                 logger.debug(f"Could not find context for QV: {qv.value}")
@@ -812,14 +1179,8 @@ RESPOND ONLY WITH VALID JSON:"""
                     claim = f"Capacity specified as {qv.value}"
 
             # Extract any entities from context
-            entities = []
-            entity_patterns = [
-                r'\b([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)*)\b',  # Capitalized words (products/tools)
-            ]
-            for pattern in entity_patterns:
-                matches = re.findall(pattern, context_match)
-                entities.extend([m for m in matches if len(m) > 2])
-            entities = list(set(entities))[:5]  # Limit to 5 unique entities
+            entities = [m for m in _ENTITY_RE.findall(context_match) if len(m) > 2]
+            entities = list(dict.fromkeys(entities))[:5]  # First 5 unique entities
 
             missing_facts.append(ExtractedFact(
                 claim=claim,
@@ -849,18 +1210,8 @@ RESPOND ONLY WITH VALID JSON:"""
                 if len(missing_facts) >= target_count:
                     break
 
-                # Try to find context around this value in chunk_text
-                qv_escaped = qv.value.replace("(", "\\(").replace(")", "\\)").replace("[", "\\[").replace("]", "\\]")
-                context_match = None
-                try:
-                    import re
-                    pattern = f".{{0,200}}{qv_escaped}.{{0,200}}"
-                    match = re.search(pattern, chunk_text, re.IGNORECASE | re.DOTALL)
-                    if match:
-                        context_match = match.group(0).strip()
-                        context_match = " ".join(context_match.split())
-                except:
-                    pass
+                # Find context around this value in chunk_text
+                context_match = _context_around(chunk_text, chunk_lower, qv.value)
 
                 if not context_match:
                     continue
@@ -923,14 +1274,8 @@ RESPOND ONLY WITH VALID JSON:"""
                         claim = f"Percentage specified as {qv.value}"
 
                 # Extract entities from context
-                entities = []
-                entity_patterns = [
-                    r'\b([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)*)\b',
-                ]
-                for pattern in entity_patterns:
-                    matches = re.findall(pattern, context_match)
-                    entities.extend([m for m in matches if len(m) > 2])
-                entities = list(set(entities))[:5]
+                entities = [m for m in _ENTITY_RE.findall(context_match) if len(m) > 2]
+                entities = list(dict.fromkeys(entities))[:5]
 
                 missing_facts.append(ExtractedFact(
                     claim=claim,
@@ -1031,209 +1376,29 @@ When extracting from tables:
 - Be explicit about which column each fact comes from
 """
 
-        # V4: Get anti-generic prompt additions
-        v4_prompt_additions = build_v4_enhanced_prompt_additions()
+        document_block = f"""DOCUMENT SUMMARY:
+{json.dumps(summary, indent=2)}
 
-        prompt = f"""You are extracting structured facts from a document chunk. Use the document summary for context and extraction guidance.
+DOCUMENT TYPE: {doc_type}
+STRUCTURAL PATTERN: {structural_pattern}
 
-DOCUMENT SUMMARY:
-{json.dumps(summary, indent=2)}
+EXTRACTION GUIDANCE:
+{extraction_guidance}
+
+SPECIFIC FACT TYPES TO EXTRACT:
+{fact_density_pattern}
+{table_instructions}"""
 
-CHUNK INFO:
+        prompt = f"""CHUNK INFO:
 - Document: {document_name}
 - Lines: {start_line} to {end_line}
 - Chunk: {chunk_id}
+- Section: {section_context}
 {section_instructions}
 
-{table_instructions}
-
 PRE-PARSED EXTRACTION TARGETS:
 {pre_parsed_guidance if pre_parsed_guidance else "No specific targets pre-identified."}
 
-{v4_prompt_additions}
-
-CRITICAL EXTRACTION INSTRUCTIONS:
-
-**EXTRACTION PHILOSOPHY**: This system aims to EXCEED human analysis capabilities. Extract facts with MAXIMUM DEPTH and SPECIFICITY. Every distinct technical detail, every specific configuration, every quantitative value, every process step is a separate fact.
-
-Based on the document type ({doc_type}), you should extract MANY facts per chunk. This document follows a {structural_pattern} pattern.
-
-{extraction_guidance}
-
-SPECIFIC FACT TYPES TO EXTRACT:
-{fact_density_pattern}
-
-**AGGRESSIVE EXTRACTION MODE** - For this document type, extract:
-
-1. **Specific implementations** - Leave NO technical detail behind
-   - Named entities: AWS, AWS RDS, AWS EC2, Splunk Enterprise 9.0, Okta SSO, TLS 1.2, TLS 1.3, AES-256-GCM, SHA-256, RSA-4096, NIST SP 800-53 Rev 5, ISO 27001:2013, OWASP Top 10, HIPAA, SOX, etc.
-   - Extract EVERY technology mentioned, with versions when available
-   - Extract EVERY protocol, algorithm, encryption method, key size
-   - Extract EVERY third-party tool, vendor name, service provider
-
-2. **Concrete processes** - Extract EVERY process detail
-   - WHO: Extract every role, title, team, department, person mentioned (IT manager, Security team, CISO, VP of Engineering, authorized personnel, third-party auditor)
-   - WHEN: Extract every frequency, schedule, timeframe (daily, weekly, monthly, quarterly, annually, semi-annually, real-time, within 24 hours, every 90 days)
-   - HOW: Extract every procedure, methodology, workflow step (automated script, manual review, ticketing system, approval workflow, penetration testing, vulnerability scanning)
-
-3. **Technical details** - Extract EVERY quantitative value
-   - Numbers with units: 90 days, 365 days, 256-bit, 4096-bit, 8 characters, 16 characters, 8GB RAM, 100GB storage
-   - Percentages: 99.9%, 99.95%, 5% error rate, 80% CPU threshold
-   - Frequencies: daily at 2 AM, weekly on Sundays, monthly on first Monday
-   - Thresholds: temperature >80°F, <3 failed login attempts, CPU >80%, disk >90%
-   - Capacity metrics: RTO of 4 hours, RPO of 15 minutes, 99.95% uptime SLA
-   - Temperature ranges, humidity levels, power specifications
-
-4. **Organizational facts** - Extract EVERY organizational detail
-   - Team sizes: 8-person IT team, 3 security engineers, 50+ developers
-   - Locations: Alpharetta GA, data center in Virginia, office in London
-   - Reporting structures: reports to CISO, overseen by Board, managed by VP
-   - Responsibilities: responsible for patch management, accountable for backups
-
-5. **Compliance statements** - Extract EVERY compliance detail
-   - Standards: meets NIST SP 800-53, follows ISO 27001:2013, complies with GDPR Article 32
-   - Certifications: SOC 2 Type 2 certified, PCI DSS Level 1, HIPAA compliant
-   - Requirements: required by policy, mandated by regulation, enforced by contract
-
-6. **Test results** - Extract EVERY test detail
-   - What was tested: user authentication, firewall rules, backup restoration, disaster recovery plan
-   - How it was tested: inspection, observation, inquiry, re-performance, automated testing, manual review
-   - Sample sizes: 25 of 100 users, all 50 servers, representative sample of 10%
-   - Results: no exceptions noted, 3 deviations found, all tests passed, remediation required
-
-**DEPTH INSTRUCTIONS**:
-- If a paragraph describes a control, extract 5-10 distinct facts from it
-- If a sentence contains multiple technical details, create a separate fact for each
-- If a list has 5 items, create 5 separate facts (one per item)
-- Extract facts about the same control at different specificity levels:
-  - High-level: "Uses firewalls for network security"
-  - Mid-level: "Firewall rules restrict inbound traffic"
-  - Detailed: "Firewall configured to allow only ports 80 and 443 for inbound HTTPS traffic with stateful packet inspection"
-
-ENHANCED METADATA EXTRACTION:
-
-For EACH fact, you must also provide:
-- **fact_type**: One of: technical_control, organizational, process, metric, CUEC, test_result, architecture, compliance
-- **control_family**: One of: access_control, encryption, monitoring, backup_recovery, change_management, incident_response, physical_security, network_security
-- **specificity_score**: 0.0-1.0 (0.0=generic "uses firewalls", 1.0=specific "uses Palo Alto PA-5220 firewalls with IDS/IPS enabled")
-- **entities**: List of named entities (tools, technologies, protocols, standards) mentioned in this fact
-- **quantitative_values**: List of quantitative values (numbers, percentages, timeframes, ranges)
-- **process_details**: If this is a process fact, extract: {{"who": "role", "when": "frequency", "how": "procedure"}}
-- **section_context**: "{section_context}"
-- **related_control_ids**: List of control IDs mentioned (e.g., CC6.1, A.1.2)
-
-SPECIFICITY EXAMPLES:
-❌ Low specificity (0.3): "LNRS engineers use several monitoring tools"
-✅ High specificity (0.9): "LNRS uses Splunk Enterprise for log aggregation and Datadog for infrastructure monitoring with alerts sent when CPU exceeds 80%"
-
-❌ Low specificity (0.2): "Temperature and humidity levels are monitored"
-✅ High specificity (0.9): "Data center temperature maintained at 68°F with alerts triggered at ±5°F variance"
-
-GENERAL RULES:
-- Each distinct claim is a separate fact
-- DO NOT skip facts because they seem similar - extract all distinct claims
-- Prioritize specific, detailed facts over generic statements
-- When in doubt, extract it - more facts is better than fewer
-
-**V5: EVIDENCE REQUIREMENTS** (CRITICAL):
-
-Each fact must have supporting evidence. You have TWO options:
-
-**Option 1: Single Evidence (most common)**
-Use when all evidence is in one place:
-```
-"evidence_quote": "Exact WORD-FOR-WORD text from chunk"
-```
-
-**Option 2: Multiple Evidence (V5 - use when appropriate)**
-Use when a fact combines information from different locations:
-```
-"evidence_quotes": [
-  {{
-    "quote": "First supporting quote (EXACT text)",
-    "source_location": "Lines X-Y",
-    "relevance": "What this quote supports (optional)"
-  }},
-  {{
-    "quote": "Second supporting quote (EXACT text)",
-    "source_location": "Lines Z-W",
-    "relevance": "What this quote supports (optional)"
-  }}
-]
-```
-
-**When to use multiple quotes:**
-- Fact mentions frequency from one location AND implementation details from another
-- Combining policy statement with implementation evidence
-- Multiple test results supporting the same conclusion
-- Technology mentioned in one place, configuration in another
-
-**Quote rules (apply to both formats):**
-- Copy text WORD-FOR-WORD from the chunk
-- DO NOT paraphrase, summarize, or rephrase
-- DO NOT change wording, even slightly
-- If exact text is unclear, extract a longer quote to be safe
-
-WHAT TO EXTRACT (be extremely thorough):
-✓ Specific technology implementations with versions ("uses AWS RDS PostgreSQL 13.7", "configured with Duo MFA", "utilizes Okta SSO")
-✓ Security controls with specifics ("firewall rules restrict inbound traffic to ports 80/443", "AES-256-GCM encryption at rest", "logs retained for 365 days")
-✓ Procedures with details ("reviewed quarterly by IT management", "approved by CISO", "penetration tests conducted annually by Acme Security")
-✓ Organizational structures ("managed by 8-person IT team", "overseen by VP of Security", "performed by AWS as subservice organization")
-✓ Technical configurations ("TLS 1.3 with perfect forward secrecy", "bcrypt password hashing with cost factor 12", "daily incremental backups at 2 AM UTC")
-✓ Compliance assertions ("meets NIST SP 800-53 Rev 5", "follows ISO 27001:2013", "complies with GDPR Article 32")
-✓ Quantitative metrics ("RTO of 4 hours", "RPO of 15 minutes", "99.95% uptime SLA", "maximum 3 failed login attempts")
-
-WHAT TO SKIP:
-✗ Document metadata ("This is a SOC2 report", "Examination period was...")
-✗ Legal boilerplate ("Confidential information", "Trade secrets", "Not for distribution")
-✗ Table of contents items
-✗ Page numbers or section headers alone
-
-RESPOND WITH VALID JSON ARRAY:
-[
-  {{
-    "claim": "Clear, specific assertion (be granular - separate claims into individual facts)",
-    "source_doc": "{document_name}",
-    "source_location": "Lines X-Y (overall range)",
-    "evidence_quote": "Exact text from chunk (use for single evidence)",
-    "confidence": 0.95,
-    "fact_type": "technical_control",
-    "control_family": "encryption",
-    "specificity_score": 0.9,
-    "entities": ["AWS", "AES-256"],
-    "quantitative_values": ["256-bit"],
-    "process_details": {{"who": "IT team", "when": "daily", "how": "automated script"}},
-    "section_context": "{section_context}",
-    "related_control_ids": ["CC6.1"]
-  }},
-  {{
-    "claim": "V5 example with multiple evidence quotes",
-    "source_doc": "{document_name}",
-    "source_location": "Lines X-Z (overall range)",
-    "evidence_quotes": [
-      {{
-        "quote": "First exact quote from chunk",
-        "source_location": "Lines X-Y",
-        "relevance": "Frequency"
-      }},
-      {{
-        "quote": "Second exact quote from chunk",
-        "source_location": "Lines Z-W",
-        "relevance": "Who performs"
-      }}
-    ],
-    "confidence": 0.95,
-    "fact_type": "process",
-    "control_family": "monitoring",
-    "specificity_score": 0.9,
-    "entities": ["Acme Security"],
-    "quantitative_values": ["quarterly"],
-    "process_details": {{"who": "Acme Security", "when": "quarterly", "how": "third-party assessment"}},
-    "section_context": "{section_context}",
-    "related_control_ids": []
-  }}
-]
-
 CHUNK TEXT:
 {chunk_text}
 
@@ -1241,25 +1406,14 @@ Extract as many distinct, specific facts as possible from this chunk. RESPOND ON
 
         try:
             # Use Claude CLI with higher token limit for aggressive extraction
-            content = self.client.prompt(prompt, max_tokens=6000)
+            content = self.client.prompt(
+                prompt,
+                system_prompt=CHUNK_EXTRACTION_SYSTEM_PROMPT,
+                max_tokens=6000,
+                cached_prefix=document_block,
+            )
 
-            # Try to parse JSON
-            try:
-                facts_data = json.loads(content)
-            except json.JSONDecodeError:
-                # Try to extract JSON from markdown code blocks
-                if "```json" in content:
-                    json_start = content.find("```json") + 7
-                    json_end = content.find("```", json_start)
-                    content = content[json_start:json_end].strip()
-                    facts_data = json.loads(content)
-                elif "```" in content:
-                    json_start = content.find("```") + 3
-                    json_end = content.find("```", json_start)
-                    content = content[json_start:json_end].strip()
-                    facts_data = json.loads(content)
-                else:
-                    raise
+            facts_data = _parse_json_response(content)
 
             # Validate and convert to ExtractedFact objects
             facts = []
@@ -1406,21 +1560,7 @@ Extract all {pass_type} facts. RESPOND ONLY WITH A VALID JSON ARRAY:"""
         try:
             content = self.client.prompt(prompt, max_tokens=3000)
 
-            try:
-                facts_data = json.loads(content)
-            except json.JSONDecodeError:
-                if "```json" in content:
-                    json_start = content.find("```json") + 7
-                    json_end = content.find("```", json_start)
-                    content = content[json_start:json_end].strip()
-                    facts_data = json.loads(content)
-                elif "```" in content:
-                    json_start = content.find("```") + 3
-                    json_end = content.find("```", json_start)
-                    content = content[json_start:json_end].strip()
-                    facts_data = json.loads(content)
-                else:
-                    raise
+            facts_data = _parse_json_response(content)
 
             facts = []
             for fact_dict in facts_data:
@@ -1611,6 +1751,12 @@ Extract all {pass_type} facts. RESPOND ONLY WITH A VALID JSON ARRAY:"""
                 if f.quantitative_values:
                     existing_qv_values.update(f.quantitative_values)
 
+            # Lowercase each chunk once rather than once per value searched
+            chunks_lower = [
+                (chunk_text, chunk_text.lower(), start_line, end_line)
+                for chunk_id, chunk_text, start_line, end_line in chunks
+            ]
+
             for qv_value, qv_type in sorted(all_qv_values):
                 if len(generated_global_facts) >= needed_qv_facts:
                     break
@@ -1621,26 +1767,23 @@ Extract all {pass_type} facts. RESPOND ONLY WITH A VALID JSON ARRAY:"""
 
                 # Find a chunk containing this QV for context
                 context_chunk = None
-                for chunk_id, chunk_text, start_line, end_line in chunks:
-                    if qv_value.lower() in chunk_text.lower():
-                        context_chunk = (chunk_text, start_line, end_line)
+                qv_lower = qv_value.lower()
+                for chunk_text, chunk_lower, start_line, end_line in chunks_lower:
+                    if qv_lower in chunk_lower:
+                        context_chunk = (chunk_text, chunk_lower, start_line, end_line)
                         break
 
                 if not context_chunk:
                     continue
 
-                chunk_text, start_line, end_line = context_chunk
+                chunk_text, chunk_lower, start_line, end_line = context_chunk
 
                 # Extract context around QV
                 try:
-                    import re
-                    qv_escaped = qv_value.replace("(", "\\(").replace(")", "\\)").replace("[", "\\[").replace("]", "\\]")
-                    pattern = f".{{0,200}}{qv_escaped}.{{0,200}}"
-                    match = re.search(pattern, chunk_text, re.IGNORECASE | re.DOTALL)
-                    if not match:
+                    context_match = _context_around(chunk_text, chunk_lower, qv_value)
+                    if not context_match:
                         continue
 
-                    context_match = " ".join(match.group(0).strip().split())
                     context_lower = context_match.lower()
 
                     # Generate context-aware claim
@@ -269,10 +269,8 @@ def enhance_quantitative_tagging(
                 matched_values.append(qv.value)
 
         if matched_values:
-            # Merge with existing quantitative_values
-            existing_qv = fact.quantitative_values or []
-            all_qv = list(set(existing_qv + matched_values))
-            fact.quantitative_values = all_qv
+            # Merge with existing quantitative_values, keeping first-seen order
+            fact.quantitative_values = list(dict.fromkeys((*(fact.quantitative_values or ()), *matched_values)))
 
         enhanced_facts.append(fact)
 
@@ -0,0 +1,118 @@
+"""
+Minimal command-line interface for scripted, read-only use.
+
+Exposes the 'info' and 'session-info' commands with argparse and plain
+output, without loading click or rich. Use 'frfr' for the full interactive
+commands; use 'frfr-fast' when calling these in tight loops or from CI.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from frfr import __version__, _json
+
+
+def _print_result(result: dict, as_json: bool) -> None:
+    """Print a result as JSON or as 'key: value' lines."""
+    if as_json:
+        sys.stdout.write(_json.dumps(result).decode("utf-8") + "\n")
+        return
+    for key, value in result.items():
+        if isinstance(value, list):
+            value = ", ".join(str(v) for v in value)
+        print(f"{key}: {value}")
+
+
+def info(args: argparse.Namespace) -> int:
+    """Print PDF metadata."""
+    from frfr.documents.pdf_extractor import get_pdf_info
+
+    try:
+        pdf_info = get_pdf_info(args.pdf_path)
+    except Exception as e:
+        print(f"Error reading PDF: {e}", file=sys.stderr)
+        return 1
+
+    _print_result({"file": args.pdf_path, **pdf_info}, args.json)
+    return 0
+
+
+def session_info(args: argparse.Namespace) -> int:
+    """Print per-document session progress."""
+    from frfr.session import Session
+
+    # Session() creates missing directories; this command must not
+    if not (Path(args.base_dir) / args.session_id).is_dir():
+        print(f"Session not found: {args.session_id}", file=sys.stderr)
+        return 1
+
+    session = Session(session_id=args.session_id, base_dir=args.base_dir)
+
+    docs = session.metadata.get("documents", [])
+    if args.document_name:
+        if args.document_name not in docs:
+            print(f"Document '{args.document_name}' not found in session", file=sys.stderr)
+            return 1
+        docs = [args.document_name]
+
+    documents = {}
+    for doc in docs:
+        processed_chunks = session.get_processed_chunks(doc)
+        documents[doc] = {
+            "processed_chunks": len(processed_chunks),
+            "last_chunk": max(processed_chunks) if processed_chunks else None,
+            "total_facts": sum(1 for _ in session.iter_facts(doc)),
+            "has_summary": bool(session.load_summary(doc)),
+        }
+
+    result = {
+        "session_id": session.session_id,
+        "status": session.metadata.get("status", "unknown"),
+        "created_at": session.metadata.get("created_at"),
+        "documents": documents,
+    }
+
+    if args.json:
+        _print_result(result, True)
+        return 0
+
+    _print_result({k: v for k, v in result.items() if k != "documents"}, False)
+    for doc, doc_info in documents.items():
+        print(f"\n[{doc}]")
+        _print_result(doc_info, False)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="frfr-fast", description="Fast read-only Frfr commands for scripting."
+    )
+    parser.add_argument("--version", action="version", version=__version__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    info_parser = subparsers.add_parser("info", help="Display metadata about a PDF file")
+    info_parser.add_argument("pdf_path", help="Path to the PDF file")
+    info_parser.add_argument("--json", action="store_true", help="Print JSON")
+    info_parser.set_defaults(func=info)
+
+    session_parser = subparsers.add_parser("session-info", help="Display information about a session")
+    session_parser.add_argument("session_id", help="The session ID (e.g., sess_ac43e048b916)")
+    session_parser.add_argument("--document-name", help="Show info for specific document only")
+    session_parser.add_argument("--base-dir", default=".frfr_sessions", help="Base directory for sessions")
+    session_parser.add_argument("--json", action="store_true", help="Print JSON")
+    session_parser.set_defaults(func=session_info)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for the frfr-fast script."""
+    args = build_parser().parse_args(argv)
+    return int(args.func(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
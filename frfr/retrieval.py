@@ -0,0 +1,245 @@
+"""
+Keyword retrieval over extracted facts.
+
+Large fact files do not fit in a single prompt, so queries against them first
+shortlist the facts most relevant to the question. FactIndex is a small
+in-memory inverted index ranked with BM25; it needs no extra dependencies and
+builds in well under a second for tens of thousands of facts.
+
+With fastembed installed, FactIndex can also rank facts by embedding
+similarity and fuse both rankings with reciprocal rank fusion, which helps
+questions phrased differently from the facts that answer them.
+"""
+
+import heapq
+import importlib.util
+import math
+import re
+from collections import Counter
+
+import numpy as np
+
+# Fact files larger than this are shortlisted per question instead of sent whole
+LARGE_CORPUS_FACTS = 5000
+
+# Facts kept per question when shortlisting
+DEFAULT_TOP_K = 200
+
+# Small multilingual embedding model (384 dimensions)
+DEFAULT_EMBEDDING_MODEL = "intfloat/multilingual-e5-small"
+
+# Reciprocal rank fusion constant (score = sum of 1 / (RRF_K + rank))
+RRF_K = 60
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "does", "do", "for", "from",
+    "has", "have", "how", "in", "is", "it", "of", "on", "or", "that", "the",
+    "this", "to", "was", "what", "when", "where", "which", "who", "why", "with",
+})
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase alphanumeric terms, dropping stopwords.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of terms in order (duplicates kept)
+    """
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+def fact_search_text(fact: dict) -> str:
+    """
+    Text of a fact that is indexed for retrieval.
+
+    Args:
+        fact: Fact dictionary (V4 evidence_quote or V5 evidence_quotes)
+
+    Returns:
+        Claim followed by its evidence quote(s)
+    """
+    parts = [fact.get("claim", ""), fact.get("evidence_quote", "")]
+    for quote in fact.get("evidence_quotes") or []:
+        if isinstance(quote, dict):
+            parts.append(quote.get("quote", ""))
+    return " ".join(p for p in parts if p)
+
+
+def embeddings_available() -> bool:
+    """Whether the optional embedding dependencies are installed."""
+    return importlib.util.find_spec("fastembed") is not None
+
+
+def rrf_fuse(rankings: list, limit: int, k: int = RRF_K) -> list[int]:
+    """
+    Combine several rankings with reciprocal rank fusion.
+
+    Args:
+        rankings: Lists of fact indices, each best first
+        limit: Maximum number of indices to return
+        k: Fusion constant; larger values flatten the rank weighting
+
+    Returns:
+        Fused fact indices, best first (ties keep fact order)
+    """
+    scores: dict[int, float] = {}
+    for ranking in rankings:
+        for rank, idx in enumerate(ranking, 1):
+            scores[idx] = scores.get(idx, 0.0) + 1.0 / (k + rank)
+    return heapq.nsmallest(limit, scores, key=lambda idx: (-scores[idx], idx))
+
+
+class EmbeddingIndex:
+    """Dense embeddings of facts for cosine-similarity search."""
+
+    def __init__(self, facts: list, model_name: str = DEFAULT_EMBEDDING_MODEL):
+        """
+        Embed all facts.
+
+        Args:
+            facts: Facts to index; search results are positions in this list
+            model_name: fastembed model name
+
+        Raises:
+            RuntimeError: If fastembed is not installed
+        """
+        try:
+            # Imported here so commands that never embed don't load onnxruntime
+            from fastembed import TextEmbedding  # type: ignore[import-not-found]
+        except ImportError:
+            raise RuntimeError(
+                "Semantic search requires fastembed: pip install fastembed"
+            ) from None
+
+        self.model = TextEmbedding(model_name)
+        # e5 models expect "passage: " / "query: " prefixes
+        passages = [f"passage: {fact_search_text(fact)}" for fact in facts]
+        vectors = np.array(list(self.model.embed(passages)), dtype=np.float32)
+        if len(vectors):
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-12
+        self.vectors = vectors
+
+    def search(self, query: str, limit: int = DEFAULT_TOP_K) -> list[int]:
+        """
+        Find the facts closest to a query by cosine similarity.
+
+        Args:
+            query: Question or keywords
+            limit: Maximum number of facts to return
+
+        Returns:
+            Fact indices, best match first
+        """
+        n = len(self.vectors)
+        if not n or limit <= 0:
+            return []
+
+        q = next(iter(self.model.embed([f"query: {query}"]))).astype(np.float32)
+        scores = self.vectors @ (q / (np.linalg.norm(q) + 1e-12))
+
+        if limit < n:
+            top = np.argpartition(-scores, limit - 1)[:limit]
+        else:
+            top = np.arange(n)
+        return [int(i) for i in top[np.argsort(-scores[top], kind="stable")]]
+
+
+class FactIndex:
+    """Inverted index over fact claims and evidence, ranked with BM25."""
+
+    def __init__(
+        self,
+        facts: list,
+        k1: float = 1.2,
+        b: float = 0.75,
+        semantic: bool = False,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+    ):
+        """
+        Build the index.
+
+        Args:
+            facts: Facts to index; search results are positions in this list
+            k1: BM25 term-frequency saturation
+            b: BM25 document-length normalization
+            semantic: Also embed facts and fuse BM25 with embedding similarity
+                (requires fastembed; see EmbeddingIndex)
+            model_name: fastembed model name for semantic search
+
+        Raises:
+            RuntimeError: If semantic is set but fastembed is not installed
+        """
+        self.k1 = k1
+        self.b = b
+        self.embeddings = EmbeddingIndex(facts, model_name) if semantic else None
+
+        # term -> [(fact index, term frequency)]
+        postings: dict[str, list[tuple[int, int]]] = {}
+        lengths = []
+        for idx, fact in enumerate(facts):
+            terms = tokenize(fact_search_text(fact))
+            lengths.append(len(terms))
+            for term, tf in Counter(terms).items():
+                postings.setdefault(term, []).append((idx, tf))
+
+        self.postings = postings
+        self.lengths = lengths
+        self.avg_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+
+    def __len__(self) -> int:
+        """Number of indexed facts."""
+        return len(self.lengths)
+
+    def search(self, query: str, limit: int = DEFAULT_TOP_K) -> list[int]:
+        """
+        Find the facts most relevant to a query.
+
+        Args:
+            query: Question or keywords
+            limit: Maximum number of facts to return
+
+        Returns:
+            Fact indices, best match first (ties keep fact order)
+        """
+        lexical = self.keyword_search(query, limit)
+        if self.embeddings is None:
+            return lexical
+        return rrf_fuse([lexical, self.embeddings.search(query, limit)], limit)
+
+    def keyword_search(self, query: str, limit: int = DEFAULT_TOP_K) -> list[int]:
+        """
+        Rank facts by BM25 over the query's terms.
+
+        Args:
+            query: Question or keywords
+            limit: Maximum number of facts to return
+
+        Returns:
+            Fact indices with at least one query term, best first
+        """
+        n = len(self.lengths)
+        if not n or limit <= 0:
+            return []
+
+        k1 = self.k1
+        lengths = self.lengths
+        norm = k1 * (1 - self.b)
+        scale = k1 * self.b / (self.avg_length or 1.0)
+
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            term_postings = self.postings.get(term)
+            if not term_postings:
+                continue
+            df = len(term_postings)
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for idx, tf in term_postings:
+                denom = tf + norm + scale * lengths[idx]
+                scores[idx] = scores.get(idx, 0.0) + idf * tf * (k1 + 1) / denom
+
+        return heapq.nsmallest(limit, scores, key=lambda idx: (-scores[idx], idx))
@@ -4,10 +4,20 @@ Session management for temporary storage and state.
 
 import json
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 from datetime import datetime
 
+from frfr import _json
+
+try:
+    import ijson  # type: ignore[import-not-found]
+except ImportError:
+    ijson = None  # type: ignore[assignment]
+
 
 class Session:
     """Manages a session directory for temporary artifacts."""
@@ -102,8 +112,43 @@ class Session:
             facts: List of extracted facts
         """
         facts_file = self.facts_dir / f"{document_name}_chunk_{chunk_id:04d}.json"
-        with open(facts_file, "w") as f:
-            json.dump(facts, f, indent=2)
+        _json.dump_file(facts, facts_file, indent=True)
+
+    def _fact_files(self, document_name: str) -> list[Path]:
+        """Chunk fact files for a document, in chunk order."""
+        return sorted(self.facts_dir.glob(f"{document_name}_chunk_*.json"))
+
+    @staticmethod
+    def _read_fact_files(fact_files: list[Path], read_ahead: int = 8) -> Iterator[list]:
+        """
+        Read chunk fact files in order, overlapping reads on a thread pool.
+
+        At most read_ahead files are loaded ahead of the consumer, so memory
+        stays bounded while the many small reads run concurrently.
+
+        Args:
+            fact_files: Chunk fact files in the order to yield them
+            read_ahead: Maximum files being read ahead of the consumer
+
+        Yields:
+            List of facts from each file
+        """
+        read = _json.load_file
+
+        if len(fact_files) <= 1 or read_ahead <= 1:
+            for path in fact_files:
+                yield read(path)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(read_ahead, len(fact_files))) as executor:
+            remaining = iter(fact_files)
+            pending = deque(executor.submit(read, path) for path in islice(remaining, read_ahead))
+            while pending:
+                facts = pending.popleft().result()
+                next_path = next(remaining, None)
+                if next_path is not None:
+                    pending.append(executor.submit(read, next_path))
+                yield facts
 
     def load_all_facts(self, document_name: str) -> list:
         """
@@ -116,12 +161,96 @@ class Session:
             List of all extracted facts
         """
         all_facts = []
-        for facts_file in sorted(self.facts_dir.glob(f"{document_name}_chunk_*.json")):
-            with open(facts_file, "r") as f:
-                facts = json.load(f)
-                all_facts.extend(facts)
+        for facts in self._read_fact_files(self._fact_files(document_name)):
+            all_facts.extend(facts)
         return all_facts
 
+    def iter_facts(self, document_name: str) -> Iterator[dict]:
+        """
+        Iterate over all facts for a document, one chunk file at a time.
+
+        With ijson installed each chunk file is parsed incrementally, so only
+        one fact is held in memory at a time; otherwise a few chunks' facts
+        are loaded at once.
+
+        Args:
+            document_name: Name of the document
+
+        Yields:
+            Extracted fact dictionaries in chunk order
+        """
+        if ijson is not None:
+            for path in self._fact_files(document_name):
+                with open(path, "rb") as f:
+                    yield from ijson.items(f, "item", use_float=True)
+            return
+
+        for facts in self._read_fact_files(self._fact_files(document_name)):
+            yield from facts
+
+    def write_consolidated(
+        self,
+        output_path: Path,
+        document_names: list[str],
+        source_text_files: Optional[dict[str, str]] = None,
+        progress_callback: Optional[Callable[[str], None]] = None,
+    ) -> dict:
+        """
+        Stream consolidated facts for documents to a JSON file.
+
+        Facts are written as they are read from the chunk files rather than
+        collected into one dict first, so memory stays bounded by the largest
+        chunk. Output is compact JSON; fact_count and total_facts follow the
+        facts they count.
+
+        Args:
+            output_path: Path of the consolidated JSON file to write
+            document_names: Documents to include, in order
+            source_text_files: Optional map of document name to source text file
+            progress_callback: Optional callback invoked with each finished document
+
+        Returns:
+            Dictionary with per-document fact_count/has_summary and total_facts
+        """
+        dumps = _json.dumps
+
+        source_text_files = source_text_files or {}
+        documents: dict[str, dict] = {}
+        total_facts = 0
+
+        with open(output_path, "wb") as f:
+            f.write(b'{"session_id":' + dumps(self.session_id) + b',"documents":{')
+
+            for doc_index, doc in enumerate(document_names):
+                summary = self.load_summary(doc)
+                if doc_index:
+                    f.write(b",")
+                f.write(dumps(doc) + b':{"summary":' + dumps(summary))
+                if doc in source_text_files:
+                    f.write(b',"source_text_file":' + dumps(source_text_files[doc]))
+
+                f.write(b',"facts":[')
+                fact_count = 0
+                for fact in self.iter_facts(doc):
+                    if fact_count:
+                        f.write(b",")
+                    f.write(dumps(fact))
+                    fact_count += 1
+                f.write(b'],"fact_count":' + dumps(fact_count) + b"}")
+
+                documents[doc] = {
+                    "fact_count": fact_count,
+                    "has_summary": bool(summary),
+                }
+                total_facts += fact_count
+
+                if progress_callback:
+                    progress_callback(doc)
+
+            f.write(b'},"total_facts":' + dumps(total_facts) + b"}")
+
+        return {"documents": documents, "total_facts": total_facts}
+
     def save_chunk_text(self, document_name: str, chunk_id: int, text: str):
         """
         Save chunk text for debugging/inspection.
@@ -4,14 +4,19 @@ Validate extracted facts against source text.
 Ensures that evidence quotes actually exist in the specified line ranges.
 """
 
-import json
 import logging
+import re
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 
+from frfr import _json
+
 logger = logging.getLogger(__name__)
 
+# Match percentage in messages like "not found (only 17% match)"
+_PERCENT_RE = re.compile(r'(\d+)%')
+
 
 @dataclass
 class ValidationResult:
@@ -44,6 +49,14 @@ class FactValidator:
 
         self.claude_client = claude_client
 
+        # Normalized text per (start_line, end_line); facts from the same chunk
+        # often share ranges, and expanded searches revisit the same windows
+        self._normalized_ranges: Dict[Tuple[int, int], str] = {}
+
+        # Normalized text per extraction chunk; every fact of a chunk is
+        # validated against the same chunk_text
+        self._normalized_chunks: Dict[str, str] = {}
+
         logger.info(f"Loaded {len(self.lines)} lines from {self.text_file}")
 
     def parse_line_range(self, location: str) -> Tuple[int, int]:
@@ -107,6 +120,40 @@ class FactValidator:
         text = "".join(self.lines[start_idx:end_idx])
         return text
 
+    def get_normalized_line_text(self, start_line: int, end_line: int) -> str:
+        """
+        Get normalized text from a line range, cached per range.
+
+        Args:
+            start_line: Starting line (1-indexed)
+            end_line: Ending line (1-indexed)
+
+        Returns:
+            normalize_text() of the combined line range
+        """
+        key = (start_line, end_line)
+        normalized = self._normalized_ranges.get(key)
+        if normalized is None:
+            normalized = self.normalize_text(self.get_line_text(start_line, end_line))
+            self._normalized_ranges[key] = normalized
+        return normalized
+
+    def get_normalized_chunk_text(self, chunk_text: str) -> str:
+        """
+        Get normalized text for an extraction chunk, cached per chunk.
+
+        Args:
+            chunk_text: Raw text of the chunk the facts were extracted from
+
+        Returns:
+            normalize_text() of the chunk
+        """
+        normalized = self._normalized_chunks.get(chunk_text)
+        if normalized is None:
+            normalized = self.normalize_text(chunk_text)
+            self._normalized_chunks[chunk_text] = normalized
+        return normalized
+
     def find_quote_in_text(
         self, quote: str, text: str, context_lines: int = 5
     ) -> Tuple[bool, str]:
@@ -121,28 +168,39 @@ class FactValidator:
         Returns:
             Tuple of (found, actual_location)
         """
-        normalized_quote = self.normalize_text(quote)
-        normalized_text = self.normalize_text(text)
+        return self._match_normalized(self.normalize_text(quote), self.normalize_text(text))
+
+    @staticmethod
+    def _match_normalized(normalized_quote: str, normalized_text: str) -> Tuple[bool, str]:
+        """
+        Search for an already-normalized quote in already-normalized text.
 
+        Args:
+            normalized_quote: normalize_text() of the evidence quote
+            normalized_text: normalize_text() of the text to search in
+
+        Returns:
+            Tuple of (found, actual_location)
+        """
         # Try exact match first
         if normalized_quote in normalized_text:
             return True, "exact match"
 
         # Try partial match (at least 70% of quote present)
         # V4.1 FIX: Relaxed from 80% to 70% to reduce false rejections
-        quote_words = normalized_quote.split()
-        text_words = normalized_text.split()
+        quote_words = normalized_quote.lower().split()
+        num_quote_words = len(quote_words)
 
         # Check if most quote words appear in order
-        quote_idx = 0
         matched_words = 0
+        if num_quote_words:
+            for text_word in normalized_text.lower().split():
+                if text_word == quote_words[matched_words]:
+                    matched_words += 1
+                    if matched_words == num_quote_words:
+                        break
 
-        for text_word in text_words:
-            if quote_idx < len(quote_words) and text_word.lower() == quote_words[quote_idx].lower():
-                matched_words += 1
-                quote_idx += 1
-
-        match_ratio = matched_words / len(quote_words) if quote_words else 0
+        match_ratio = matched_words / num_quote_words if num_quote_words else 0
 
         if match_ratio >= 0.7:  # Relaxed from 0.8 to 0.7
             return True, f"partial match ({match_ratio:.0%})"
@@ -274,12 +332,13 @@ If the claim is NOT supported by this context, set found to false.
         # V5: Validate ALL quotes (all must pass for fact to be valid)
         # V4.5: If chunk_text is provided, validate against chunk instead of full document
         if chunk_text:
-            # Search for each quote in chunk text directly
+            # Search for each quote in chunk text directly (normalized once per chunk)
+            normalized_chunk = self.get_normalized_chunk_text(chunk_text)
             failed_quotes = []
             all_valid = True
 
             for quote in quotes_to_validate:
-                found, match_type = self.find_quote_in_text(quote, chunk_text)
+                found, match_type = self._match_normalized(self.normalize_text(quote), normalized_chunk)
                 if not found:
                     all_valid = False
                     failed_quotes.append((quote[:40], match_type))
@@ -321,16 +380,17 @@ If the claim is NOT supported by this context, set found to false.
                 error_message=f"Invalid location format: {location}",
             )
 
-        # Get text from specified lines
-        line_text = self.get_line_text(start_line, end_line)
+        # Get text from specified lines (normalized once per range)
+        line_text = self.get_normalized_line_text(start_line, end_line)
+        normalized_quotes = [self.normalize_text(quote) for quote in quotes_to_validate]
 
         # V5: Validate ALL quotes against line text
         all_found = True
         failed_quotes = []
         match_types = []
 
-        for quote in quotes_to_validate:
-            found, match_type = self.find_quote_in_text(quote, line_text)
+        for quote, normalized_quote in zip(quotes_to_validate, normalized_quotes):
+            found, match_type = self._match_normalized(normalized_quote, line_text)
             match_types.append(match_type)
             if not found:
                 all_found = False
@@ -353,13 +413,13 @@ If the claim is NOT supported by this context, set found to false.
         # If not found, try expanding the search range for failed quotes
         expanded_start = max(1, start_line - 5)
         expanded_end = min(len(self.lines), end_line + 5)
-        expanded_text = self.get_line_text(expanded_start, expanded_end)
+        expanded_text = self.get_normalized_line_text(expanded_start, expanded_end)
 
         all_found_expanded = True
         expanded_match_types = []
 
-        for quote in quotes_to_validate:
-            found_expanded, match_type_expanded = self.find_quote_in_text(quote, expanded_text)
+        for normalized_quote in normalized_quotes:
+            found_expanded, match_type_expanded = self._match_normalized(normalized_quote, expanded_text)
             expanded_match_types.append(match_type_expanded)
             if not found_expanded:
                 all_found_expanded = False
@@ -389,8 +449,7 @@ If the claim is NOT supported by this context, set found to false.
             if "%" in match_type_expanded:
                 try:
                     # Extract percentage number from string
-                    import re
-                    match = re.search(r'(\d+)%', match_type_expanded)
+                    match = _PERCENT_RE.search(match_type_expanded)
                     if match:
                         match_ratio = float(match.group(1)) / 100
                         if match_ratio > best_match_ratio:
@@ -481,9 +540,8 @@ If the claim is NOT supported by this context, set found to false.
         fact_files = sorted(facts_dir.glob(f"{document_name}_chunk_*.json"))
 
         for fact_file in fact_files:
-            with open(fact_file, "r") as f:
-                chunk_facts = json.load(f)
-                all_facts.extend(chunk_facts)
+            chunk_facts = _json.load_file(fact_file)
+            all_facts.extend(chunk_facts)
 
         logger.info(f"Loaded {len(all_facts)} facts from {len(fact_files)} chunks")
 
@@ -517,8 +575,7 @@ def validate_consolidated_facts(
     Returns:
         Tuple of (validation_results, summary_stats)
     """
-    with open(consolidated_file, "r") as f:
-        data = json.load(f)
+    data = _json.load_file(consolidated_file)
 
     # Get all facts from all documents
     all_facts = []
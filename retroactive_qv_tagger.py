@@ -6,9 +6,10 @@ This script scans fact claims for quantitative patterns and adds them to the
 quantitative_values metadata field if not already present.
 """
 
-import json
 import sys
 from pathlib import Path
+
+from frfr import _json
 from frfr.extraction.extraction_patterns import ExtractionPatterns
 
 
@@ -21,8 +22,7 @@ def retroactive_tag_qv(facts_file: Path, output_file: Path = None):
         output_file: Optional output path (defaults to same file with _qv_tagged suffix)
     """
     print(f"Loading facts from: {facts_file}")
-    with open(facts_file, 'r') as f:
-        data = json.load(f)
+    data = _json.load_file(facts_file)
 
     # Extract document name and facts
     doc_name = list(data['documents'].keys())[0]
@@ -30,8 +30,9 @@ def retroactive_tag_qv(facts_file: Path, output_file: Path = None):
 
     print(f"Loaded {len(facts)} facts from document '{doc_name}'")
 
-    # Count current QV coverage
-    initial_qv_count = sum(1 for f in facts if f.get('quantitative_values') and len(f['quantitative_values']) > 0)
+    # Count current QV coverage (flag computed once per fact, kept up to date below)
+    has_qv = [bool(f.get('quantitative_values')) for f in facts]
+    initial_qv_count = sum(has_qv)
     initial_coverage = (initial_qv_count / len(facts) * 100) if len(facts) > 0 else 0
 
     print(f"\nInitial QV coverage: {initial_coverage:.1f}% ({initial_qv_count}/{len(facts)})")
@@ -47,7 +48,7 @@ def retroactive_tag_qv(facts_file: Path, output_file: Path = None):
         existing_qv = set(fact.get('quantitative_values', []))
 
         # Extract quantitative values from claim text
-        extracted_qv = ExtractionPatterns.extract_all_quantitative(claim)
+        extracted_qv = ExtractionPatterns.iter_all_quantitative(claim)
 
         # Add new QV that aren't already present
         new_qv = []
@@ -60,6 +61,7 @@ def retroactive_tag_qv(facts_file: Path, output_file: Path = None):
             # Update the fact's quantitative_values
             all_qv = list(existing_qv) + new_qv
             fact['quantitative_values'] = all_qv
+            has_qv[i] = True
             tagged_count += 1
 
             if i < 10:  # Show first 10 examples
@@ -67,7 +69,7 @@ def retroactive_tag_qv(facts_file: Path, output_file: Path = None):
                 print(f"       Added: {', '.join(new_qv)}")
 
     # Calculate new coverage
-    final_qv_count = sum(1 for f in facts if f.get('quantitative_values') and len(f['quantitative_values']) > 0)
+    final_qv_count = sum(has_qv)
     final_coverage = (final_qv_count / len(facts) * 100) if len(facts) > 0 else 0
 
     print(f"\n{'='*60}")
@@ -91,8 +93,7 @@ def retroactive_tag_qv(facts_file: Path, output_file: Path = None):
     if output_file is None:
         output_file = facts_file.parent / f"{facts_file.stem}_qv_tagged.json"
 
-    with open(output_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    _json.dump_file(data, output_file, indent=True)
 
     print(f"Saved updated facts to: {output_file}")
 
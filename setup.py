@@ -0,0 +1,31 @@
+"""
+Optional mypyc build for frfr.
+
+Package metadata lives in pyproject.toml. This file only adds compiled
+extensions: with FRFR_MYPYC=1 the extraction patterns module is compiled
+ahead of time with mypyc, which needs mypy in the build environment:
+
+    pip install mypy
+    FRFR_MYPYC=1 pip install --no-build-isolation .
+
+The optional hyperscan and google-re2 engines are not needed for the build.
+
+Without FRFR_MYPYC the package installs as pure Python.
+"""
+
+import os
+
+from setuptools import setup
+
+# Modules compiled with FRFR_MYPYC=1; they must type-check cleanly under mypy
+MYPYC_MODULES = [
+    "frfr/extraction/extraction_patterns.py",
+]
+
+ext_modules = []
+if os.environ.get("FRFR_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(MYPYC_MODULES)
+
+setup(ext_modules=ext_modules)
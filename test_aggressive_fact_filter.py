@@ -0,0 +1,62 @@
+"""
+Test script for the aggressive fact filter's output writer.
+
+Validates that filtered facts files keep the layout of json.dump(indent=2)
+and store non-ASCII text as UTF-8.
+"""
+
+import json
+
+from aggressive_fact_filter import _write_filtered
+
+
+def test_write_filtered_format(tmp_path):
+    """Test that the spliced output matches an indented UTF-8 JSON dump."""
+    print("\n=== Testing Filtered Output Format ===\n")
+
+    data = {
+        "session_id": "sess_test",
+        "documents": {
+            "report": {
+                "summary": {"document_type": "SOC 2"},
+                "facts": [{"claim": "placeholder"}],
+            },
+        },
+    }
+    kept_facts = [
+        {"claim": "Données chiffrées en AES-256 — clés gérées par l'équipe IT", "quantitative_values": ["256"]},
+        {"claim": "Backups run daily", "entities": [], "specificity_score": 0.75},
+    ]
+    path = tmp_path / "filtered.json"
+
+    _write_filtered(data, "report", kept_facts, path)
+
+    expected = dict(data, documents={"report": dict(data["documents"]["report"], facts=kept_facts)})
+    raw = path.read_bytes()
+    print(raw.decode("utf-8"))
+
+    # Non-ASCII text is written as UTF-8, not as \uXXXX escapes
+    assert "Données".encode("utf-8") in raw
+    assert b"\\u00e9" not in raw
+    assert raw == json.dumps(expected, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def test_write_filtered_no_facts(tmp_path):
+    """Test that a document with no kept facts gets an empty facts array."""
+    print("\n=== Testing Filtered Output Without Facts ===\n")
+
+    data = {"session_id": "sess_test", "documents": {"report": {"facts": [{"claim": "dropped"}]}}}
+    path = tmp_path / "filtered.json"
+
+    _write_filtered(data, "report", [], path)
+
+    assert json.loads(path.read_bytes()) == {"session_id": "sess_test", "documents": {"report": {"facts": []}}}
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    with tempfile.TemporaryDirectory() as tmp:
+        test_write_filtered_format(Path(tmp))
+        test_write_filtered_no_facts(Path(tmp))
@@ -5,6 +5,7 @@ Validates that quantitative extraction, control parsing, and specificity
 scoring work correctly on real SOC 2 text samples.
 """
 
+from frfr.extraction import extraction_patterns
 from frfr.extraction.extraction_patterns import (
     ExtractionPatterns,
     ControlTableParser,
@@ -111,6 +112,58 @@ def test_role_extraction():
         print(f"  Roles: {roles}\n")
 
 
+def test_overlapping_matches_kept():
+    """Test that each pattern finds its matches even where another pattern's match overlaps."""
+    print("\n=== Testing Overlapping Matches ===\n")
+
+    text = (
+        "The Chief Information Security Officer and the IT Team review access "
+        "on a daily basis and retain logs for 90 days; data uses AES-256 and SHA."
+    )
+
+    roles = ExtractionPatterns.extract_roles(text)
+    print(f"Roles: {roles}")
+    assert "IT Team" in roles
+    assert "Security Officer" in roles
+
+    specs = ExtractionPatterns.extract_technical_specs(text)
+    print(f"Specs: {specs}")
+    assert "AES" in specs and "AES-256" in specs
+
+    frequencies = [qv.value for qv in ExtractionPatterns.extract_frequencies(text)]
+    print(f"Frequencies: {frequencies}")
+    assert "daily" in frequencies and "on a daily basis" in frequencies
+
+    # Every extractor reports exactly what scanning its patterns one by one finds
+    def scan(patterns):
+        return [m.group(0) for pattern in patterns for m in pattern.finditer(text)]
+
+    assert [qv.value for qv in ExtractionPatterns.extract_durations(text)] == scan(
+        ExtractionPatterns.DURATION_PATTERNS
+    )
+    assert set(roles) == set(scan(ExtractionPatterns.ROLE_PATTERNS))
+    assert set(specs) == set(scan(ExtractionPatterns.TECHNICAL_SPEC_PATTERNS))
+
+
+def test_regex_engines_agree():
+    """Test that the RE2 patterns (when google-re2 is installed) match like re."""
+    print(f"\n=== Testing Regex Engine ({extraction_patterns.REGEX_ENGINE}) ===\n")
+
+    test_samples = [
+        "The IT Security Team reviews firewall rules QUARTERLY and every 90\vdays",
+        "Sampled 25 of 40 users;\x1cInspected all 4 reviews at least 2 times per month",
+        "Chief Information Security Officer approves TLS 1.2, AES-256 and port 443 and 80",
+        "Over 1,500 employees in approximately 30 countries; uptime of 99.95%",
+    ]
+
+    for pattern, linear in extraction_patterns._LINEAR_PATTERNS.items():
+        for text in test_samples:
+            expected = [m.group(0) for m in pattern.finditer(text)]
+            assert [m.group(0) for m in linear.finditer(text)] == expected
+
+    print(f"Checked {len(extraction_patterns._LINEAR_PATTERNS)} RE2 pattern(s)")
+
+
 def test_control_table_parsing():
     """Test parsing of control table rows."""
     print("\n=== Testing Control Table Parsing ===\n")
@@ -244,6 +297,8 @@ if __name__ == "__main__":
     test_quantitative_extraction()
     test_technical_specs_extraction()
     test_role_extraction()
+    test_overlapping_matches_kept()
+    test_regex_engines_agree()
     test_control_table_parsing()
     test_specificity_scoring()
     test_comprehensive_extraction()
@@ -0,0 +1,100 @@
+"""
+Tests for the on-disk caches.
+"""
+
+import json
+import os
+from pathlib import Path
+
+from frfr.cache import ResponseCache, SummaryCache, load_json_cached
+
+
+def test_load_json_cached_reuses_copy_until_file_changes(tmp_path):
+    """The pickled copy is served while the file is unchanged, then rebuilt."""
+    facts_path = tmp_path / "facts.json"
+    facts_path.write_text(json.dumps({"facts": [{"claim": "MFA is required"}]}))
+    cache_dir = tmp_path / "cache"
+
+    first = load_json_cached(facts_path, cache_dir)
+    assert first == {"facts": [{"claim": "MFA is required"}]}
+    assert len(list((cache_dir / "json").glob("*.pkl"))) == 1
+
+    # Same mtime and size: served from the copy, not re-parsed
+    assert load_json_cached(facts_path, cache_dir) == first
+
+    facts_path.write_text(json.dumps({"facts": []}))
+    stat = facts_path.stat()
+    os.utime(facts_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_json_cached(facts_path, cache_dir) == {"facts": []}
+
+
+def test_load_json_cached_ignores_corrupt_copy(tmp_path):
+    """A corrupt cached copy falls back to parsing the JSON file."""
+    facts_path = tmp_path / "facts.json"
+    facts_path.write_text(json.dumps({"facts": [1, 2]}))
+    cache_dir = tmp_path / "cache"
+
+    load_json_cached(facts_path, cache_dir)
+    for cache_file in (cache_dir / "json").glob("*.pkl"):
+        cache_file.write_bytes(b"not a pickle")
+
+    assert load_json_cached(facts_path, cache_dir) == {"facts": [1, 2]}
+
+
+def test_load_json_cached_removes_temp_file_on_failed_write(tmp_path, monkeypatch):
+    """A copy that cannot be moved into place leaves no temp file behind."""
+    facts_path = tmp_path / "facts.json"
+    facts_path.write_text(json.dumps({"facts": [1]}))
+    cache_dir = tmp_path / "cache"
+
+    def fail_replace(self, target):
+        raise OSError("read-only cache")
+
+    monkeypatch.setattr(Path, "replace", fail_replace)
+
+    assert load_json_cached(facts_path, cache_dir) == {"facts": [1]}
+    assert list((cache_dir / "json").iterdir()) == []
+
+
+def test_response_cache_round_trip_and_expiry(tmp_path):
+    """Responses are keyed by facts file and question, and expire after the TTL."""
+    facts_path = tmp_path / "facts.json"
+    facts_path.write_text(json.dumps({"facts": []}))
+    cache = ResponseCache(tmp_path / "cache", ttl=60)
+
+    key = cache.make_key(facts_path, "Is MFA  required?")
+    assert key == cache.make_key(facts_path, "is mfa required?")
+    assert key != cache.make_key(facts_path, "Is MFA required?", variant="deep")
+    assert cache.get(key) is None
+
+    cache.set(key, "ANSWER: Yes [Fact 1]", question="Is MFA required?")
+    assert cache.get(key) == "ANSWER: Yes [Fact 1]"
+
+    expired = ResponseCache(tmp_path / "cache", ttl=-1)
+    assert expired.get(key) is None
+    # Expired entries are removed, not just skipped
+    assert cache.get(key) is None
+
+
+def test_response_cache_removes_temp_file_on_failed_write(tmp_path, monkeypatch):
+    """A response that cannot be moved into place leaves no temp file behind."""
+    cache = ResponseCache(tmp_path)
+
+    def fail_replace(self, target):
+        raise OSError("read-only cache")
+
+    monkeypatch.setattr(Path, "replace", fail_replace)
+
+    cache.set("key", "answer")
+    assert list((tmp_path / "responses").iterdir()) == []
+
+
+def test_summary_cache_round_trip(tmp_path):
+    """Summaries are stored per prompt and missing keys return None."""
+    cache = SummaryCache(tmp_path)
+    key = cache.make_key("Summarize: doc text")
+
+    assert cache.get(key) is None
+    cache.set(key, {"document_type": "SOC2 Type 2 report"})
+    assert cache.get(key) == {"document_type": "SOC2 Type 2 report"}
+    assert cache.make_key("Summarize: other text") != key
@@ -12,6 +12,7 @@ from frfr.documents import (
     get_pdf_info,
     PDFExtractionError,
 )
+from frfr.documents.pdf_extractor import PDF_BACKEND
 
 
 def test_extract_pdf_to_text_with_real_pdf():
@@ -29,7 +30,7 @@ def test_extract_pdf_to_text_with_real_pdf():
         result = extract_pdf_to_text(pdf_path, output_path)
 
         # Verify result metadata
-        assert result["method"] == "pypdf2"
+        assert result["method"] == PDF_BACKEND
         assert result["pages"] == 155
         assert result["total_chars"] > 400000  # Should have substantial text
         assert result["output_file"] == str(output_path)
@@ -58,7 +59,7 @@ def test_extract_pdf_page_to_text():
     # Extract page 1 (index 1, which is page 2 in the document)
     text, method = extract_pdf_page_to_text(pdf_path, page_num=1)
 
-    assert method == "pypdf2"
+    assert method == PDF_BACKEND
     assert len(text) > 1000
     assert "LexisNexis" in text
     assert "TABLE OF CONTENTS" in text
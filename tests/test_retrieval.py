@@ -0,0 +1,41 @@
+"""
+Tests for keyword retrieval over facts.
+"""
+
+from frfr.retrieval import FactIndex, rrf_fuse, tokenize
+
+
+FACTS = [
+    {"claim": "Firewall blocks inbound traffic", "evidence_quote": "Port 443 only"},
+    {"claim": "MFA is required for all users", "evidence_quote": "Multi-factor authentication (MFA) enforced"},
+    {"claim": "Data is encrypted at rest", "evidence_quotes": [{"quote": "AES-256 encryption"}]},
+    {"claim": "Access reviews happen quarterly", "evidence_quote": "Reviewed each quarter"},
+]
+
+
+def test_tokenize_drops_stopwords_and_punctuation():
+    """Terms are lowercased alphanumerics without stopwords."""
+    assert tokenize("Is the data AES-256 encrypted?") == ["data", "aes", "256", "encrypted"]
+
+
+def test_search_ranks_matching_facts_first():
+    """Facts sharing terms with the query rank above unrelated ones."""
+    index = FactIndex(FACTS)
+
+    assert index.search("Is MFA required?", limit=1) == [1]
+    assert index.search("AES encryption", limit=2)[0] == 2
+
+
+def test_search_limit_and_no_matches():
+    """Results respect the limit; queries with no known terms return nothing."""
+    index = FactIndex(FACTS)
+
+    assert len(index.search("data traffic users quarter", limit=2)) == 2
+    assert index.search("kubernetes") == []
+    assert FactIndex([]).search("mfa") == []
+
+
+def test_rrf_fuse_prefers_items_ranked_well_in_both():
+    """Items near the top of several rankings beat items high in only one."""
+    assert rrf_fuse([[1, 2, 3], [2, 0, 1]], limit=2) == [2, 1]
+    assert rrf_fuse([[], []], limit=5) == []
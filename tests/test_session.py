@@ -0,0 +1,58 @@
+"""
+Tests for session fact storage and consolidation.
+"""
+
+import json
+
+from frfr.session import Session
+
+
+def _make_session(tmp_path, chunks: int = 20, facts_per_chunk: int = 3) -> Session:
+    session = Session(session_id="sess_test", base_dir=str(tmp_path))
+    session.save_summary("doc", {"title": "Doc"})
+    for chunk_id in range(chunks):
+        session.save_chunk_facts(
+            "doc",
+            chunk_id,
+            [{"claim": f"fact {chunk_id}.{i}"} for i in range(facts_per_chunk)],
+        )
+    return session
+
+
+def test_load_all_facts_preserves_chunk_order(tmp_path):
+    """Facts come back in chunk order, with none dropped by read-ahead."""
+    session = _make_session(tmp_path)
+
+    facts = session.load_all_facts("doc")
+
+    assert len(facts) == 60
+    assert [f["claim"] for f in facts[:4]] == ["fact 0.0", "fact 0.1", "fact 0.2", "fact 1.0"]
+    assert facts[-1]["claim"] == "fact 19.2"
+
+
+def test_iter_facts_matches_load_all_facts(tmp_path):
+    """Streaming iteration yields the same facts as loading them all."""
+    session = _make_session(tmp_path)
+
+    assert list(session.iter_facts("doc")) == session.load_all_facts("doc")
+
+
+def test_write_consolidated(tmp_path):
+    """Consolidated output is valid JSON with counts matching the facts."""
+    session = _make_session(tmp_path, chunks=2)
+    session.save_summary("empty", {})
+    output_path = tmp_path / "consolidated.json"
+
+    stats = session.write_consolidated(
+        output_path, ["doc", "empty"], source_text_files={"doc": "doc.txt"}
+    )
+
+    data = json.loads(output_path.read_text())
+    assert data["session_id"] == "sess_test"
+    assert data["total_facts"] == 6
+    assert data["documents"]["doc"]["fact_count"] == 6
+    assert data["documents"]["doc"]["source_text_file"] == "doc.txt"
+    assert data["documents"]["doc"]["facts"] == session.load_all_facts("doc")
+    assert data["documents"]["empty"]["facts"] == []
+    assert stats["documents"]["doc"] == {"fact_count": 6, "has_summary": True}
+    assert stats["documents"]["empty"] == {"fact_count": 0, "has_summary": False}
@@ -0,0 +1,63 @@
+"""
+Tests for line-indexed source text.
+"""
+
+import io
+
+import pytest
+
+from frfr.documents import SourceText
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"", b"one", b"one\ntwo", b"one\ntwo\n", b"one\r\ntwo\r\n", b"\n\nthree\n"],
+)
+def test_line_count_matches_readlines(data):
+    """Line count matches readlines(), including an unterminated last line."""
+    lines = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8").readlines()
+    assert len(SourceText(data)) == len(lines)
+
+
+def test_get_lines_matches_joined_slice():
+    """A line range equals joining the same slice of readlines()."""
+    data = "".join(f"line {i}\n" for i in range(1, 51)).encode()
+    lines = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8").readlines()
+    source = SourceText(data)
+
+    assert source.get_lines(0, 3) == "".join(lines[0:3])
+    assert source.get_lines(10, 20) == "".join(lines[10:20])
+    assert source.get_lines(45, 100) == "".join(lines[45:])
+
+
+def test_get_lines_out_of_range():
+    """Empty or inverted ranges return an empty string."""
+    source = SourceText(b"a\nb\n")
+
+    assert source.get_lines(5, 10) == ""
+    assert source.get_lines(1, 1) == ""
+    assert source.get_lines(-3, 1) == "a\n"
+
+
+def test_from_file(tmp_path):
+    """Loading from a file indexes its contents."""
+    path = tmp_path / "source.txt"
+    path.write_text("alpha\nbeta\ngamma")
+
+    source = SourceText.from_file(path)
+
+    assert len(source) == 3
+    assert source.get_lines(2, 3) == "gamma"
+
+
+@pytest.mark.parametrize("text", ["", "one", "one\ntwo\n", "a\r\nb"])
+def test_from_file_matches_bytes(tmp_path, text):
+    """A memory-mapped file indexes the same as its bytes, including empty files."""
+    path = tmp_path / "source.txt"
+    path.write_bytes(text.encode())
+
+    mapped = SourceText.from_file(path)
+    loaded = SourceText(text.encode())
+
+    assert list(mapped.line_starts) == list(loaded.line_starts)
+    assert mapped.get_lines(0, 10) == loaded.get_lines(0, 10)